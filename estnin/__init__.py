@@ -0,0 +1,76 @@
+# coding: utf-8
+
+import importlib
+
+from .core import estnin, _estnin, checksum, EstNIN
+from .validation import Reason, Parsed, is_valid, try_parse
+from .ranges import span
+from .correction import Suggestion, suggest, suggest_many
+from .cache import Cache, cached
+from .text import scan, redact
+
+__author__ = "Anti Räis"
+
+# the modules of these names import NumPy, they are imported on first access so that
+# importing the package stays cheap for the scalar API
+_LAZY = {
+    'validate_many': 'vectorized',
+    'EstNINArray': 'array',
+    'COUNT': 'ordinal',
+    'to_ordinal': 'ordinal',
+    'from_ordinal': 'ordinal',
+    'to_ordinal_many': 'ordinal',
+    'from_ordinal_many': 'ordinal',
+    'random': 'sampling',
+    'ages': 'age',
+    'age_buckets': 'age',
+    'Index': 'index',
+    'BloomFilter': 'bloom',
+    'Allocator': 'allocator',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    'estnin',
+    'checksum',
+    'EstNIN',
+    'Reason',
+    'Parsed',
+    'is_valid',
+    'try_parse',
+    'validate_many',
+    'EstNINArray',
+    'span',
+    'COUNT',
+    'to_ordinal',
+    'from_ordinal',
+    'to_ordinal_many',
+    'from_ordinal_many',
+    'random',
+    'ages',
+    'age_buckets',
+    'Suggestion',
+    'suggest',
+    'suggest_many',
+    'Cache',
+    'cached',
+    'scan',
+    'redact',
+    'Index',
+    'BloomFilter',
+    'Allocator',
+]
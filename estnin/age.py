@@ -0,0 +1,110 @@
+# coding: utf-8
+
+"""
+Ages and age brackets of many EstNIN values on a reference date.
+
+The ages are calculated from the integer form of the values: the birth year from the century digit
+and ``YY`` and the birthday by comparing ``MMDD``, so no dates are constructed. People born on the
+29th of February turn a year older on the 1st of March in common years, the same as
+:meth:`estnin.age_on <estnin.estnin.age_on>`.
+"""
+
+from datetime import date
+
+from .vectorized import np, _require_numpy, _as_int64, _validate_array, VALID
+
+
+def _ages_array(values, on):
+    """
+    Return the ages on date *on* for the ``int64`` array *values*.
+    """
+    year = 1800 + 100 * ((values // 10**10 - 1) // 2) + values // 10**8 % 100
+    return on.year - year - (values // 10**4 % 10**4 > on.month * 100 + on.day)
+
+
+def _prepare(values, validate):
+    _require_numpy()
+    shape = np.shape(values)
+    values, errors = _as_int64(values)
+
+    if validate:
+        _validate_array(values, errors)
+        invalid = np.flatnonzero(errors != VALID)
+        if len(invalid):
+            raise ValueError('invalid value at index {}'.format(invalid[0]))
+
+    return values, shape
+
+
+def ages(values, on=None, validate=True):
+    """
+    Calculate the ages in whole years on given date.
+
+    :param values: values to calculate the ages for.
+    :type values: :class:`numpy.ndarray`, :class:`EstNINArray <estnin.EstNINArray>` or any sequence
+                  of :py:func:`int` or :py:func:`str`
+
+    :param on: date to calculate the ages on, today by default.
+    :type on: :py:func:`datetime.date`
+
+    :param validate: if set to :py:const:`False` then the values are assumed to be valid.
+    :type validate: :py:const:`bool`
+
+    :return: ages shaped as the input, negative for people born after the date.
+    :rtype: :class:`numpy.ndarray` of ``int64``
+
+    :raises: :py:exc:`ValueError <ValueError>` if any of the values is invalid.
+
+    **Usage:**
+        >>> from estnin import ages
+        >>> from datetime import date
+        >>> ages([37001011233, 60002290003, 50512310004], on=date(2023, 2, 28))
+        array([53, 22, 17])
+    """
+    values, shape = _prepare(values, validate)
+    return _ages_array(values, on or date.today()).reshape(shape)
+
+
+def age_buckets(values, on=None, edges=(18, 65), validate=True):
+    """
+    Assign the values to age brackets on given date.
+
+    The bracket of an age is the number of edges that are less than or equal to it, so with the
+    default edges ``0`` is for minors, ``1`` for ages ``[18..65)`` and ``2`` for 65 and older. The
+    number of people in each bracket is ``numpy.bincount(buckets, minlength=len(edges) + 1)``.
+
+    :param values: values to calculate the brackets for.
+    :type values: :class:`numpy.ndarray`, :class:`EstNINArray <estnin.EstNINArray>` or any sequence
+                  of :py:func:`int` or :py:func:`str`
+
+    :param on: date to calculate the ages on, today by default.
+    :type on: :py:func:`datetime.date`
+
+    :param edges: increasing ages where the brackets start.
+    :type edges: sequence of :py:func:`int`
+
+    :param validate: if set to :py:const:`False` then the values are assumed to be valid.
+    :type validate: :py:const:`bool`
+
+    :return: bracket indexes in range ``[0..len(edges)]`` shaped as the input.
+    :rtype: :class:`numpy.ndarray` of ``int64``
+
+    :raises: :py:exc:`ValueError <ValueError>` if any of the values is invalid or the edges are
+             not increasing.
+
+    **Usage:**
+        >>> from estnin import age_buckets
+        >>> from datetime import date
+        >>> age_buckets([37001011233, 60002290003, 50512310004], on=date(2023, 2, 28))
+        array([1, 1, 0])
+        >>> age_buckets([37001011233, 60002290003], on=date(2023, 2, 28), edges=[0, 30, 60])
+        array([2, 1])
+    """
+    _require_numpy()
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1)
+
+    if (edges[1:] <= edges[:-1]).any():
+        raise ValueError('edges must be increasing')
+
+    values, shape = _prepare(values, validate)
+    return np.searchsorted(edges, _ages_array(values, on or date.today()), side='right').astype(np.int64).reshape(shape)
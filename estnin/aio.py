@@ -0,0 +1,170 @@
+# coding: utf-8
+
+"""
+Validation of values arriving from :py:mod:`asyncio` streams.
+
+The values are read by a background task into a bounded queue and validated in batches with
+:func:`estnin.validate_many <estnin.validate_many>`, so the event loop is blocked only for one
+vectorized step per batch. The queue holds at most one batch, so a slow consumer slows down the
+reading of the source.
+"""
+
+import asyncio
+
+from collections import namedtuple
+
+from .vectorized import _require_numpy, validate_many
+
+#: Validation result of a single value yielded by :func:`validate_stream`.
+Result = namedtuple('Result', 'value valid error')
+
+
+class _End(object):
+
+    def __init__(self, error=None):
+        self.error = error
+
+
+async def _iterate(source):
+    if hasattr(source, '__aiter__'):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+async def _read(source, queue):
+    try:
+        async for item in _iterate(source):
+            await queue.put(item)
+    except Exception as error:
+        await queue.put(_End(error))
+    else:
+        await queue.put(_End())
+
+
+async def _collect(queue, batch_size, max_delay, getter=None):
+    """
+    Return ``(batch, end, getter)`` where *end* is the :class:`_End` marker if the source is
+    exhausted and *getter* is the ``queue.get()`` still waiting when *max_delay* ran out, it is
+    awaited first by the next call.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if max_delay is None else loop.time() + max_delay
+    batch = []
+    item = await (getter or queue.get())
+
+    while not isinstance(item, _End):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            return batch, None, None
+
+        try:
+            item = queue.get_nowait()
+            continue
+        except asyncio.QueueEmpty:
+            pass
+
+        if deadline is None:
+            item = await queue.get()
+            continue
+
+        # unlike wait_for, wait leaves the get running on a timeout, a cancelled get could drop
+        # the value it has just taken from the queue
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.wait((getter,), timeout=max(deadline - loop.time(), 0))
+        if not getter.done():
+            return batch, None, getter
+        item = getter.result()
+
+    return batch, item, None
+
+
+async def validate_batches(source, batch_size=1024, max_delay=None, executor=None, offload_size=0):
+    """
+    Validate values from an asynchronous (or a regular) iterable in batches.
+
+    :param source: values to validate.
+    :type source: async iterable or iterable of :py:func:`int` or :py:func:`str`
+
+    :param batch_size: maximum number of values validated at once.
+    :type batch_size: :py:func:`int`
+
+    :param max_delay: maximum number of seconds to wait for a batch to fill up after its first
+                      value, :py:const:`None` to wait until it is full or the source is exhausted.
+    :type max_delay: :py:func:`float`
+
+    :param executor: executor, e.g. :class:`concurrent.futures.ProcessPoolExecutor`, where the batches
+                     are validated instead of the event loop.
+    :type executor: :class:`concurrent.futures.Executor`
+
+    :param offload_size: smallest batch that is validated in the *executor*, smaller batches are
+                         validated in the event loop.
+    :type offload_size: :py:func:`int`
+
+    :return: asynchronous generator of ``(values, mask, errors)`` where *values* is the
+             :py:func:`list` of values in the batch and *mask* and *errors* are as returned by
+             :func:`estnin.validate_many <estnin.validate_many>`.
+
+    :raises: :py:exc:`ValueError <ValueError>` if batch_size is not positive.
+    :raises: :py:exc:`ImportError <ImportError>` if NumPy is not installed.
+    """
+    _require_numpy()
+
+    if batch_size < 1:
+        raise ValueError('batch_size must be positive')
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=batch_size)
+    reader = loop.create_task(_read(source, queue))
+    getter = None
+
+    try:
+        while True:
+            batch, end, getter = await _collect(queue, batch_size, max_delay, getter)
+
+            if batch:
+                if executor is not None and len(batch) >= offload_size:
+                    mask, errors = await loop.run_in_executor(executor, validate_many, batch)
+                else:
+                    mask, errors = validate_many(batch)
+                yield batch, mask, errors
+
+            if end is not None:
+                if end.error is not None:
+                    raise end.error
+                return
+    finally:
+        for task in filter(None, (reader, getter)):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+async def validate_stream(source, batch_size=1024, max_delay=None, executor=None, offload_size=0):
+    """
+    Validate values from an asynchronous (or a regular) iterable, yielding a result for every value
+    in the original order. The arguments are the same as for :func:`validate_batches`.
+
+    :return: asynchronous generator of :class:`Result <estnin.aio.Result>` with the value, validity
+             and the error code (see :func:`estnin.validate_many <estnin.validate_many>`).
+
+    **Usage:**
+        >>> import asyncio
+        >>> from estnin.aio import validate_stream
+        >>> async def main(source):
+        ...     return [result async for result in validate_stream(source, batch_size=2)]
+        >>> asyncio.run(main(iter([37001011233, '37001011234', 'x'])))
+        [Result(value=37001011233, valid=True, error=0), Result(value='37001011234', valid=False, error=4), Result(value='x', valid=False, error=5)]
+    """
+    batches = validate_batches(source, batch_size, max_delay, executor, offload_size)
+
+    try:
+        async for values, mask, errors in batches:
+            for result in zip(values, mask.tolist(), errors.tolist()):
+                yield Result(*result)
+    finally:
+        await batches.aclose()
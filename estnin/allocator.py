@@ -0,0 +1,275 @@
+# coding: utf-8
+
+"""
+Allocation of unused EstNIN values for given birth date and sex.
+"""
+
+import os
+import struct
+import tempfile
+import threading
+
+from .core import estnin, _checksum
+from .ordinal import _DAY_ZERO, _CENTURY_START, _BLOCK_START, COUNT, to_ordinal, to_ordinal_many
+from .vectorized import np, _require_numpy
+
+_HEADER = struct.Struct('<8sIQ')
+_BLOCK = struct.Struct('<I')
+_MAGIC = b'ESTNINAL'
+_VERSION = 1
+_BLOCK_BYTES = 125
+_FULL = (1 << 1000) - 1
+_CHUNK_SIZE = 1 << 12
+
+
+class Allocator(object):
+    """
+    Provides allocation of unique EstNIN values, e.g. for test data or temporary identifiers.
+
+    The used sequences of each century digit and birth date are kept as a bitmap of 1000 bits, so
+    finding the first free sequence takes the same time no matter how full the day is. Only the days
+    with used sequences take memory. All the methods are thread-safe.
+    """
+
+    def __init__(self):
+        """
+        Create an allocator with all the values free.
+
+        **Usage:**
+            >>> from estnin import estnin, Allocator
+            >>> from datetime import date
+            >>> allocator = Allocator()
+            >>> allocator.load_used([37001010007, 37001010018])
+            >>> allocator.allocate(estnin.MALE, date(1970, 1, 1))
+            37001010029
+            >>> allocator.allocate_many(estnin.FEMALE, date(1970, 1, 1), 2)
+            [47001010008, 47001010019]
+            >>> allocator.release(37001010018)
+            >>> allocator.allocate(estnin.MALE, date(1970, 1, 1))
+            37001010018
+        """
+        self._blocks = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '{}(len={})'.format(type(self).__name__, len(self))
+
+    def __len__(self):
+        """
+        Returns the number of used values.
+        """
+        with self._lock:
+            return sum(bin(bits).count('1') for bits in self._blocks.values())
+
+    def __contains__(self, value):
+        try:
+            block, sequence = divmod(to_ordinal(value), 1000)
+        except (TypeError, ValueError):
+            return False
+
+        return bool(self._blocks.get(block, 0) >> sequence & 1)
+
+    @staticmethod
+    def _block(sex, birth_date):
+        # the ordinals of the values of one century digit and date are a run of 1000 numbers
+        estnin._validate_year(birth_date.year)
+        century = (birth_date.year - 1800) // 100 * 2 + 1 + bool(sex)
+        days = birth_date.toordinal() - _DAY_ZERO - _CENTURY_START[(century - 1) // 2]
+        prefix = century * 10**10 + birth_date.year % 100 * 10**8 + birth_date.month * 10**6 + birth_date.day * 10**4
+        return _BLOCK_START[century] // 1000 + days, prefix
+
+    @staticmethod
+    def _value(prefix, sequence):
+        value = prefix + sequence * 10
+        return value + _checksum(value)
+
+    def available(self, sex, birth_date):
+        """
+        Return the number of free sequences for given sex and birth date.
+
+        :param sex: :class:`estnin.MALE <estnin.estnin.MALE>` or :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+
+        :param birth_date: date of birth.
+        :type birth_date: :py:func:`datetime.date`
+
+        :rtype: :py:func:`int`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the date is not in range [1800..2199].
+        """
+        block, _ = self._block(sex, birth_date)
+        with self._lock:
+            return 1000 - bin(self._blocks.get(block, 0)).count('1')
+
+    def allocate(self, sex, birth_date):
+        """
+        Allocate the free value with the lowest sequence for given sex and birth date.
+
+        :param sex: :class:`estnin.MALE <estnin.estnin.MALE>` or :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+
+        :param birth_date: date of birth.
+        :type birth_date: :py:func:`datetime.date`
+
+        :rtype: :py:func:`int`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the date is not in range [1800..2199] or all
+                 the sequences are used.
+        """
+        return self.allocate_many(sex, birth_date, 1)[0]
+
+    def allocate_many(self, sex, birth_date, count):
+        """
+        Allocate *count* free values with the lowest sequences for given sex and birth date. Either
+        all the values are allocated or none.
+
+        :param sex: :class:`estnin.MALE <estnin.estnin.MALE>` or :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+
+        :param birth_date: date of birth.
+        :type birth_date: :py:func:`datetime.date`
+
+        :param count: number of values to allocate.
+        :type count: :py:func:`int`
+
+        :return: values ordered by sequence.
+        :rtype: :py:func:`list` of :py:func:`int`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the date is not in range [1800..2199] or there
+                 are not enough free sequences.
+        """
+        if count < 0:
+            raise ValueError('count must not be negative')
+
+        block, prefix = self._block(sex, birth_date)
+        sequences = []
+
+        with self._lock:
+            bits = self._blocks.get(block, 0)
+            if 1000 - bin(bits).count('1') < count:
+                raise ValueError('not enough free sequences on {}'.format(birth_date))
+
+            for _ in range(count):
+                # adding one to the bitmap sets its lowest zero bit and clears the ones below it
+                free = (bits + 1) & ~bits
+                sequences.append(free.bit_length() - 1)
+                bits |= free
+
+            if bits:
+                self._blocks[block] = bits
+
+        return [self._value(prefix, sequence) for sequence in sequences]
+
+    def release(self, value):
+        """
+        Mark a value as free.
+
+        :param value: allocated value.
+        :type value: :py:func:`int`, :py:func:`str` or :class:`estnin.estnin <estnin.estnin>`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the value is invalid or not used.
+        """
+        block, sequence = divmod(to_ordinal(value), 1000)
+
+        with self._lock:
+            bits = self._blocks.get(block, 0)
+            if not bits >> sequence & 1:
+                raise ValueError('value is not used')
+
+            bits &= ~(1 << sequence)
+            if bits:
+                self._blocks[block] = bits
+            else:
+                del self._blocks[block]
+
+    def load_used(self, values):
+        """
+        Mark values as used, e.g. the values that are already issued. Values that are already
+        used are ignored.
+
+        :param values: values to mark.
+        :type values: :class:`numpy.ndarray`, :class:`EstNINArray <estnin.EstNINArray>` or any
+                      sequence of :py:func:`int` or :py:func:`str`
+
+        :raises: :py:exc:`ValueError <ValueError>` if any of the values is invalid.
+        """
+        _require_numpy()
+        ordinals = np.sort(to_ordinal_many(values).reshape(-1))
+        blocks, sequences = np.divmod(ordinals, 1000)
+        unique, starts = np.unique(blocks, return_index=True)
+        starts = np.append(starts, len(ordinals))
+
+        loaded = {}
+        for first in range(0, len(unique), _CHUNK_SIZE):
+            last = min(first + _CHUNK_SIZE, len(unique))
+            start, stop = starts[first], starts[last]
+
+            used = np.zeros((last - first, 1024), dtype=bool)
+            used[np.searchsorted(unique[first:last], blocks[start:stop]), sequences[start:stop]] = True
+            packed = np.packbits(used, axis=1, bitorder='little')
+
+            for block, row in zip(unique[first:last].tolist(), packed):
+                loaded[block] = int.from_bytes(row.tobytes(), 'little')
+
+        with self._lock:
+            for block, bits in loaded.items():
+                self._blocks[block] = self._blocks.get(block, 0) | bits
+
+    def save(self, path):
+        """
+        Write the used values to a file. The file is replaced atomically, so it is never left
+        partially written.
+
+        :param path: path to the file.
+        :type path: :py:func:`str` or :class:`os.PathLike`
+        """
+        with self._lock:
+            blocks = sorted(self._blocks.items())
+
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as file:
+            try:
+                file.write(_HEADER.pack(_MAGIC, _VERSION, len(blocks)))
+                for block, bits in blocks:
+                    file.write(_BLOCK.pack(block))
+                    file.write(bits.to_bytes(_BLOCK_BYTES, 'little'))
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+
+        os.replace(file.name, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an allocator written with :meth:`save`.
+
+        :param path: path to the file.
+        :type path: :py:func:`str` or :class:`os.PathLike`
+
+        :rtype: :class:`Allocator`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the file is not a saved allocator.
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError('data is too short')
+
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('not a saved Allocator')
+
+        size = _BLOCK.size + _BLOCK_BYTES
+        if len(data) != _HEADER.size + count * size:
+            raise ValueError('data size does not match the header')
+
+        allocator = cls()
+        for offset in range(_HEADER.size, len(data), size):
+            block, = _BLOCK.unpack_from(data, offset)
+            bits = int.from_bytes(data[offset + _BLOCK.size:offset + size], 'little')
+            if block >= COUNT // 1000 or bits > _FULL:
+                raise ValueError('invalid block at offset {}'.format(offset))
+            if bits:
+                allocator._blocks[block] = bits
+
+        return allocator
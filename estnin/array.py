@@ -0,0 +1,265 @@
+# coding: utf-8
+
+"""
+Columnar container for many EstNIN values backed by a single ``int64`` NumPy array.
+"""
+
+from .core import estnin
+from .age import _ages_array
+from .vectorized import np, _require_numpy, _as_int64, _validate_array, VALID
+
+
+class EstNINArray(object):
+    """
+    Provides a columnar representation for many Estonian national identity numbers.
+
+    The values are kept in one contiguous read-only ``int64`` buffer. The fields are available as
+    NumPy arrays, slicing returns views of the same buffer and item access creates
+    :class:`estnin.estnin <estnin.estnin>` objects only when asked for.
+
+    :func:`numpy.asarray` returns the buffer without copying. The buffer protocol (e.g.
+    ``memoryview(array)``) needs Python 3.12 or later, use :attr:`values` on older versions.
+    """
+
+    def __init__(self, values, validate=True):
+        """
+        Create a new instance from given values.
+
+        :param values: values to store, :class:`numpy.ndarray` of ``int64`` is used without copying.
+        :type values: :class:`numpy.ndarray`, :class:`EstNINArray <EstNINArray>` or any sequence of
+                      :py:func:`int` or :py:func:`str`
+
+        :param validate: if set to :py:const:`False` then the values are assumed to be valid.
+        :type validate: :py:const:`bool`
+
+        :raises: :py:exc:`ValueError <ValueError>` if any of the values is invalid.
+
+        **Usage:**
+            >>> from estnin import EstNINArray
+            >>> people = EstNINArray([37001011233, 47001011234])
+            >>> people.is_female
+            array([False,  True])
+            >>> people[1]
+            47001011234
+        """
+        _require_numpy()
+
+        if isinstance(values, EstNINArray):
+            values = values._values
+
+        values, errors = _as_int64(values)
+
+        if validate:
+            _validate_array(values, errors)
+            invalid = np.flatnonzero(errors != VALID)
+            if len(invalid):
+                raise ValueError('invalid value at index {}'.format(invalid[0]))
+
+        self._values = self._readonly(values)
+        self._sorted = None
+
+    @staticmethod
+    def _readonly(values):
+        values = values.view()
+        values.flags.writeable = False
+        return values
+
+    @classmethod
+    def _wrap(cls, values):
+        instance = cls.__new__(cls)
+        instance._values = cls._readonly(values)
+        instance._sorted = None
+        return instance
+
+    @property
+    def values(self):
+        """
+        Returns the underlying read-only ``int64`` array.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._values
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self._values, dtype=dtype)
+
+        if dtype is None or np.dtype(dtype) == self._values.dtype:
+            return self._values
+
+        # copy=False asks for the buffer itself, which cannot be converted to another type
+        if copy is False:
+            raise ValueError('converting to {} requires a copy'.format(np.dtype(dtype)))
+
+        return self._values.astype(dtype)
+
+    @property
+    def __array_interface__(self):
+        return self._values.__array_interface__
+
+    def __buffer__(self, flags):
+        # the Python level buffer protocol (PEP 688) is only used by Python 3.12 or later
+        return memoryview(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, np.array2string(self._values, separator=', ', threshold=10))
+
+    def __iter__(self):
+        for value in self._values.tolist():
+            yield estnin(value)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._wrap(self._values[key])
+
+        if isinstance(key, (int, np.integer)):
+            return estnin(int(self._values[key]))
+
+        key = np.asarray(key)
+        if key.dtype.kind == 'b' and key.shape != self._values.shape:
+            raise IndexError('boolean index does not match the length of the array')
+
+        return self._wrap(self._values[key])
+
+    def __contains__(self, value):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return False
+
+        return bool(self.contains([value])[0])
+
+    def _sorted_values(self):
+        if self._sorted is None:
+            if len(self._values) < 2 or (self._values[1:] >= self._values[:-1]).all():
+                self._sorted = self._values
+            else:
+                self._sorted = np.sort(self._values)
+
+        return self._sorted
+
+    def sort(self):
+        """
+        Return a new sorted array.
+
+        :rtype: :class:`EstNINArray <EstNINArray>`
+        """
+        return self._wrap(self._sorted_values())
+
+    def searchsorted(self, values, side='left'):
+        """
+        Find the indices where given values would be inserted into the sorted array to maintain
+        the order. See :func:`numpy.searchsorted`.
+
+        :param values: values to search for.
+        :type values: :py:func:`int` or array of :py:func:`int`
+
+        :param side: ``'left'`` or ``'right'``
+        :type side: :py:func:`str`
+
+        :rtype: :py:func:`int` or :class:`numpy.ndarray`
+        """
+        return np.searchsorted(self._sorted_values(), values, side=side)
+
+    def contains(self, values):
+        """
+        Test for each of the given values if it is present in the array.
+
+        The array is sorted once on the first call, every lookup after that is a binary search.
+
+        :param values: values to look up.
+        :type values: array or sequence of :py:func:`int`
+
+        :rtype: :class:`numpy.ndarray` of :py:const:`bool`
+
+        **Usage:**
+            >>> from estnin import EstNINArray
+            >>> EstNINArray([47001011234, 37001011233]).contains([37001011233, 37001011244])
+            array([ True, False])
+        """
+        values = np.asarray(values, dtype=np.int64)
+        sorted_values = self._sorted_values()
+
+        if not len(sorted_values):
+            return np.zeros(values.shape, dtype=bool)
+
+        index = np.searchsorted(sorted_values, values)
+        return sorted_values[np.minimum(index, len(sorted_values) - 1)] == values
+
+    @property
+    def century(self):
+        """
+        Returns the century digits as :class:`numpy.ndarray`.
+        """
+        return self._values // 10**10
+
+    @property
+    def year(self):
+        """
+        Returns the years as :class:`numpy.ndarray` in the format of ``YYYY``.
+        """
+        return 1800 + 100 * ((self._values // 10**10 - 1) // 2) + self._values // 10**8 % 100
+
+    @property
+    def month(self):
+        """
+        Returns the months as :class:`numpy.ndarray`.
+        """
+        return self._values // 10**6 % 100
+
+    @property
+    def day(self):
+        """
+        Returns the days as :class:`numpy.ndarray`.
+        """
+        return self._values // 10**4 % 100
+
+    @property
+    def sequence(self):
+        """
+        Returns the sequences as :class:`numpy.ndarray`.
+        """
+        return self._values // 10 % 1000
+
+    @property
+    def checksum(self):
+        """
+        Returns the checksum digits as :class:`numpy.ndarray`.
+        """
+        return self._values % 10
+
+    @property
+    def date(self):
+        """
+        Returns the dates as :class:`numpy.ndarray` of ``datetime64[D]``.
+        """
+        months = (self.year - 1970) * 12 + self.month - 1
+        return months.astype('datetime64[M]').astype('datetime64[D]') + (self.day - 1).astype('timedelta64[D]')
+
+    def age_on(self, on):
+        """
+        Return the ages in whole years on given date, see :func:`estnin.ages <estnin.age.ages>`.
+
+        :param on: date to calculate the ages on.
+        :type on: :py:func:`datetime.date`
+
+        :rtype: :class:`numpy.ndarray` of ``int64``
+        """
+        return _ages_array(self._values, on)
+
+    @property
+    def is_male(self):
+        """
+        Returns :class:`numpy.ndarray` of :py:const:`bool` that is :py:const:`True` for males.
+        """
+        return self._values // 10**10 % 2 == 1
+
+    @property
+    def is_female(self):
+        """
+        Returns :class:`numpy.ndarray` of :py:const:`bool` that is :py:const:`True` for females.
+        """
+        return self._values // 10**10 % 2 == 0
@@ -0,0 +1,366 @@
+# coding: utf-8
+
+"""
+Compact probabilistic set of EstNIN values.
+"""
+
+import math
+import mmap
+import struct
+
+from .vectorized import np, _require_numpy, _as_int64, FORMAT
+
+_MASK = 2**64 - 1
+_HEADER = struct.Struct('<8sIIQQQd')
+_MAGIC = b'ESTNINBF'
+_VERSION = 1
+_CHUNK_SIZE = 1 << 18
+
+
+def _mix(value):
+    """
+    Return the 64 bit SplitMix64 hash of an integer.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def _mix_array(values):
+    """
+    Vectorized version of :func:`_mix` for an ``int64`` array.
+    """
+    values = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class BloomFilter(object):
+    """
+    Provides a Bloom filter for EstNIN values: a fixed size set that may report a value that was
+    never added (a false positive) but never misses a value that was added.
+
+    The integer form of the values is hashed directly and the values are not validated, so the
+    filter works for any 11 digit numbers. Filters with the same size can be merged.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Create an empty filter sized for given number of values and false positive rate.
+
+        :param capacity: expected number of values.
+        :type capacity: :py:func:`int`
+
+        :param error_rate: false positive rate when the filter holds *capacity* values.
+        :type error_rate: :py:func:`float`
+
+        :raises: :py:exc:`ValueError <ValueError>` if capacity is not positive or error_rate is not
+                 in range ``(0..1)``.
+
+        **Usage:**
+            >>> from estnin import BloomFilter
+            >>> blocked = BloomFilter(capacity=1000, error_rate=0.001)
+            >>> blocked.add(37001011233)
+            >>> 37001011233 in blocked, '47001011234' in blocked
+            (True, False)
+            >>> restored = BloomFilter.from_bytes(blocked.to_bytes())
+            >>> 37001011233 in restored
+            True
+        """
+        capacity = int(capacity)
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate not in range (0..1)')
+
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        bits = max(64, (bits + 63) // 64 * 64)
+        hashes = max(1, round(bits / capacity * math.log(2)))
+
+        self._setup(bytearray(bits // 8), hashes, capacity, error_rate, 0)
+
+    def _setup(self, data, hashes, capacity, error_rate, count):
+        self._data = data
+        self._size = len(data) * 8
+        self._hashes = hashes
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._count = count
+
+    @classmethod
+    def _create(cls, data, hashes, capacity, error_rate, count):
+        instance = cls.__new__(cls)
+        instance._setup(data, hashes, capacity, error_rate, count)
+        return instance
+
+    def __repr__(self):
+        return '{}(capacity={}, error_rate={}, len={})'.format(
+            type(self).__name__, self._capacity, self._error_rate, self._count)
+
+    def __len__(self):
+        """
+        Returns the number of values added, including repeated values.
+        """
+        return self._count
+
+    @property
+    def capacity(self):
+        """
+        Returns the number of values the filter was sized for.
+        """
+        return self._capacity
+
+    @property
+    def error_rate(self):
+        """
+        Returns the false positive rate the filter was sized for.
+        """
+        return self._error_rate
+
+    @property
+    def size(self):
+        """
+        Returns the number of bits in the filter.
+        """
+        return self._size
+
+    @property
+    def hashes(self):
+        """
+        Returns the number of bits set for each value.
+        """
+        return self._hashes
+
+    @property
+    def false_positive_rate(self):
+        """
+        Returns the false positive rate of the filter measured from the fraction of bits that
+        are set, which is accurate even after merging or adding more values than the capacity.
+
+        :rtype: :py:func:`float`
+        """
+        ones = 0
+        view = memoryview(self._data)
+        for start in range(0, len(view), 1 << 20):
+            ones += bin(int.from_bytes(view[start:start + (1 << 20)], 'little')).count('1')
+
+        return (ones / self._size) ** self._hashes
+
+    def _positions(self, value):
+        mixed = _mix(value)
+        first, step = mixed >> 32, mixed & 0xFFFFFFFF | 1
+        return [(first + i * step) % self._size for i in range(self._hashes)]
+
+    def _positions_array(self, values):
+        mixed = _mix_array(values)
+        first, step = mixed >> np.uint64(32), mixed & np.uint64(0xFFFFFFFF) | np.uint64(1)
+        steps = np.arange(self._hashes, dtype=np.uint64)
+        return (first[:, None] + steps * step[:, None]) % np.uint64(self._size)
+
+    def _writable(self):
+        if isinstance(self._data, memoryview) and self._data.readonly:
+            raise ValueError('filter is read-only')
+
+        return self._data
+
+    def add(self, value):
+        """
+        Add a value to the filter.
+
+        :param value: value to add.
+        :type value: :py:func:`int`, :py:func:`str` or :class:`estnin.estnin <estnin.estnin>`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the filter is read-only or the value is not a number.
+        """
+        data = self._writable()
+
+        for position in self._positions(int(value)):
+            data[position >> 3] |= 1 << (position & 7)
+
+        self._count += 1
+
+    def __contains__(self, value):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return False
+
+        data = self._data
+        return all(data[position >> 3] >> (position & 7) & 1 for position in self._positions(value))
+
+    def add_many(self, values):
+        """
+        Add many values to the filter.
+
+        :param values: values to add.
+        :type values: :class:`numpy.ndarray` or any sequence of :py:func:`int` or :py:func:`str`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the filter is read-only or any of the values is
+                 not a number.
+        """
+        _require_numpy()
+        values, errors = _as_int64(values)
+
+        invalid = np.flatnonzero(errors == FORMAT)
+        if len(invalid):
+            raise ValueError('invalid value at index {}'.format(invalid[0]))
+
+        bits = np.frombuffer(self._writable(), dtype=np.uint8)
+        for start in range(0, len(values), _CHUNK_SIZE):
+            positions = self._positions_array(values[start:start + _CHUNK_SIZE]).reshape(-1)
+            np.bitwise_or.at(bits, positions >> np.uint64(3), np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+
+        self._count += len(values)
+
+    def contains_many(self, values):
+        """
+        Test for each of the given values if it may be in the filter.
+
+        :param values: values to look up.
+        :type values: :class:`numpy.ndarray` or any sequence of :py:func:`int` or :py:func:`str`
+
+        :return: :py:const:`False` for values that are certainly not in the filter.
+        :rtype: :class:`numpy.ndarray` of :py:const:`bool`
+        """
+        _require_numpy()
+        shape = np.shape(values)
+        values, errors = _as_int64(values)
+
+        bits = np.frombuffer(self._data, dtype=np.uint8)
+        result = np.empty(len(values), dtype=bool)
+        for start in range(0, len(values), _CHUNK_SIZE):
+            positions = self._positions_array(values[start:start + _CHUNK_SIZE])
+            found = bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8) & 1
+            result[start:start + _CHUNK_SIZE] = found.all(axis=1)
+
+        result &= errors != FORMAT
+        return result.reshape(shape)
+
+    def _check_compatible(self, other):
+        if not isinstance(other, BloomFilter):
+            raise TypeError('can only merge with another BloomFilter')
+        if (self._size, self._hashes) != (other._size, other._hashes):
+            raise ValueError('filters have different size or number of hashes')
+
+    def update(self, *others):
+        """
+        Merge other filters into this one, e.g. filters built from shards of the same list.
+
+        :param others: filters created with the same capacity and error rate.
+        :type others: :class:`BloomFilter`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the filters are not compatible or this filter is read-only.
+        """
+        data = self._writable()
+
+        for other in others:
+            self._check_compatible(other)
+            if np is None:
+                merged = int.from_bytes(data, 'little') | int.from_bytes(other._data, 'little')
+                data[:] = merged.to_bytes(len(data), 'little')
+            else:
+                bits = np.frombuffer(data, dtype=np.uint8)
+                np.bitwise_or(bits, np.frombuffer(other._data, dtype=np.uint8), out=bits)
+            self._count += other._count
+
+    def union(self, *others):
+        """
+        Return a new filter with the values of this and the other filters.
+
+        :rtype: :class:`BloomFilter`
+        """
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    __or__ = union
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def copy(self):
+        """
+        Return a writable copy of the filter.
+
+        :rtype: :class:`BloomFilter`
+        """
+        return self._create(bytearray(self._data), self._hashes, self._capacity, self._error_rate, self._count)
+
+    def _header(self):
+        return _HEADER.pack(_MAGIC, _VERSION, self._hashes, self._size, self._count, self._capacity, self._error_rate)
+
+    def to_bytes(self):
+        """
+        Serialize the filter: a fixed size header followed by the bits.
+
+        :rtype: :py:func:`bytes`
+        """
+        return self._header() + bytes(self._data)
+
+    @classmethod
+    def _parse(cls, data):
+        data = memoryview(data).cast('B')
+        if len(data) < _HEADER.size:
+            raise ValueError('data is too short')
+
+        magic, version, hashes, size, count, capacity, error_rate = _HEADER.unpack(data[:_HEADER.size])
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('not a serialized BloomFilter')
+        if len(data) != _HEADER.size + size // 8:
+            raise ValueError('data size does not match the header')
+
+        return data[_HEADER.size:], hashes, capacity, error_rate, count
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Deserialize a filter created with :meth:`to_bytes`, the data is copied.
+
+        :param data: serialized filter.
+        :type data: :py:func:`bytes` or any buffer
+
+        :rtype: :class:`BloomFilter`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the data is not a serialized filter.
+        """
+        bits, hashes, capacity, error_rate, count = cls._parse(data)
+        return cls._create(bytearray(bits), hashes, capacity, error_rate, count)
+
+    def save(self, path):
+        """
+        Write the filter to a file in the format of :meth:`to_bytes`.
+
+        :param path: path to the file.
+        :type path: :py:func:`str` or :class:`os.PathLike`
+        """
+        with open(path, 'wb') as file:
+            file.write(self._header())
+            file.write(self._data)
+
+    @classmethod
+    def load(cls, path, mmap_mode=False):
+        """
+        Read a filter written with :meth:`save`.
+
+        :param path: path to the file.
+        :type path: :py:func:`str` or :class:`os.PathLike`
+
+        :param mmap_mode: if set to :py:const:`True` then the file is memory-mapped instead of read,
+                          so the filter is loaded instantly and shared between processes, but it
+                          is read-only.
+        :type mmap_mode: :py:const:`bool`
+
+        :rtype: :class:`BloomFilter`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the file is not a serialized filter.
+        """
+        with open(path, 'rb') as file:
+            if not mmap_mode:
+                return cls.from_bytes(file.read())
+
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls._create(*cls._parse(mapped))
@@ -0,0 +1,141 @@
+# coding: utf-8
+
+"""
+Bounded, thread-safe interning of parsed EstNIN values.
+"""
+
+import numbers
+import threading
+
+from collections import OrderedDict, namedtuple
+
+from .core import EstNIN
+
+#: Statistics returned by :meth:`Cache.cache_info`.
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+
+def _key(value):
+    # int() would truncate 37001011233.7 and accept True, neither is a value
+    if isinstance(value, bool) or isinstance(value, numbers.Number) and not isinstance(value, numbers.Integral):
+        raise ValueError('value is not an integer')
+
+    return int(value)
+
+
+class Cache(object):
+    """
+    Least recently used cache of :class:`estnin.EstNIN <estnin.EstNIN>` instances.
+
+    Parsing the same value again returns the instance that is already in the cache instead of
+    validating the value again. Instances are immutable, so they can be shared freely.
+    """
+
+    def __init__(self, maxsize=65536):
+        """
+        Create a new cache.
+
+        :param maxsize: maximum number of instances kept in the cache.
+        :type maxsize: :py:func:`int`
+
+        :raises: :py:exc:`ValueError <ValueError>` if maxsize is not positive.
+
+        **Usage:**
+            >>> from estnin import Cache
+            >>> cache = Cache(maxsize=2)
+            >>> cache(37001011233) is cache("37001011233")
+            True
+            >>> cache.cache_info()
+            CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+        """
+        maxsize = int(maxsize)
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive')
+
+        self._maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __call__(self, value):
+        """
+        Return the cached instance for given value, parsing and caching it if it is not present.
+
+        :param value: value to parse.
+        :type value: :py:func:`str`, :py:func:`int` or :class:`estnin.estnin <estnin.estnin>`
+
+        :rtype: :class:`estnin.EstNIN <estnin.EstNIN>`
+
+        :raises: :py:exc:`ValueError <ValueError>` if invalid value is given, invalid values are not cached.
+        """
+        key = _key(value)
+
+        with self._lock:
+            instance = self._items.get(key)
+            if instance is not None:
+                self._items.move_to_end(key)
+                self._hits += 1
+                return instance
+            self._misses += 1
+
+        instance = EstNIN(key)
+
+        with self._lock:
+            instance = self._items.setdefault(key, instance)
+            self._items.move_to_end(key)
+            if len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+        return instance
+
+    get = __call__
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, value):
+        try:
+            return _key(value) in self._items
+        except (TypeError, ValueError):
+            return False
+
+    def cache_info(self):
+        """
+        Return the cache statistics.
+
+        :rtype: :class:`CacheInfo <estnin.cache.CacheInfo>`
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._items))
+
+    def cache_clear(self):
+        """
+        Remove all the instances and reset the statistics.
+        """
+        with self._lock:
+            self._items.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+#: Default cache used by :func:`cached`.
+default_cache = Cache()
+
+
+def cached(value):
+    """
+    Parse given value using the :data:`default_cache`.
+
+    :param value: value to parse.
+    :type value: :py:func:`str`, :py:func:`int` or :class:`estnin.estnin <estnin.estnin>`
+
+    :rtype: :class:`estnin.EstNIN <estnin.EstNIN>`
+
+    :raises: :py:exc:`ValueError <ValueError>` if invalid value is given.
+
+    **Usage:**
+        >>> from estnin import cached
+        >>> cached(37001011233) is cached(37001011233)
+        True
+    """
+    return default_cache(value)
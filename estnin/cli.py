@@ -0,0 +1,209 @@
+# coding: utf-8
+
+"""
+Command line interface, run as ``python -m estnin`` or ``estnin``.
+
+**Usage:**
+
+.. code-block:: console
+
+    $ python -m estnin validate people.csv --column id --header --output invalid
+    $ cat people.csv | python -m estnin validate --column 2 --output summary --jobs 0
+    $ python -m estnin dedup registry-a.txt registry-b.txt --output-file people.txt --memory-limit 1G
+"""
+
+import os
+import sys
+import csv
+import argparse
+import contextlib
+import collections
+
+from itertools import islice
+from timeit import default_timer as timer
+
+from . import vectorized
+
+#: Names for the error codes in :mod:`estnin.vectorized` as written to the output.
+REASONS = {
+    vectorized.VALID: 'valid',
+    vectorized.RANGE: 'range',
+    vectorized.CENTURY: 'century',
+    vectorized.DATE: 'date',
+    vectorized.CHECKSUM: 'checksum',
+    vectorized.FORMAT: 'format',
+}
+
+_BUFFER_SIZE = 1 << 20
+
+# replaces fields longer than a value, fails with FORMAT
+_TOO_LONG = ''
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='python -m estnin', description='Tools for Estonian national identity numbers.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    validate = commands.add_parser('validate', help='validate a column of a CSV file')
+    validate.add_argument('input', nargs='?', default='-', help='input file, "-" or omitted for stdin')
+    validate.add_argument('-c', '--column', default='0', help='column index (starting from 0) or name if --header is given')
+    validate.add_argument('-d', '--delimiter', default=',', help='field delimiter (default: ",")')
+    validate.add_argument('--header', action='store_true', help='first row of the input is a header')
+    validate.add_argument('--output', choices=('valid', 'invalid', 'summary'), default='summary',
+                          help='write valid rows, invalid rows with the reason or only a summary (default: summary)')
+    validate.add_argument('-o', '--output-file', default='-', help='output file, "-" or omitted for stdout')
+    validate.add_argument('--chunk-size', type=int, default=65536, help='rows validated at once (default: 65536)')
+    validate.add_argument('-j', '--jobs', type=int, default=1, help='worker processes, 0 to use all cores (default: 1)')
+    validate.set_defaults(handler=_validate)
+
+    dedup = commands.add_parser('dedup', help='write the unique valid values of files with one value per line')
+    dedup.add_argument('inputs', nargs='+', help='input files')
+    dedup.add_argument('-o', '--output-file', required=True, help='output file, the values are written in sorted order')
+    dedup.add_argument('-m', '--memory-limit', type=_size, default='256M',
+                       help='memory for the values held in memory, e.g. 512M or 4G (default: 256M)')
+    dedup.add_argument('--temporary-directory', help='directory for the sorted runs (default: system temporary directory)')
+    dedup.set_defaults(handler=_dedup)
+
+    return parser
+
+
+def _size(value):
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    try:
+        if value[-1:].upper() in units:
+            return int(value[:-1]) * units[value[-1].upper()]
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError('invalid size: {}'.format(value))
+
+
+def _open(path, mode):
+    if path == '-' and 'r' not in mode:
+        return contextlib.nullcontext(sys.stdout)
+
+    if path == '-':
+        # the csv module needs the line endings of quoted fields untranslated
+        return open(sys.stdin.fileno(), mode, newline='', buffering=_BUFFER_SIZE, closefd=False)
+
+    return open(path, mode, newline='', buffering=_BUFFER_SIZE)
+
+
+def _validate_column(values):
+    # a long field would widen the array of the whole chunk, it is invalid anyway
+    values = [value.strip() for value in values]
+    _, errors = vectorized.validate_many([value if len(value) <= 11 else _TOO_LONG for value in values])
+    return errors.tobytes()
+
+
+def _chunks(rows, column, size):
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+
+        try:
+            yield chunk, [row[column] for row in chunk]
+        except IndexError:
+            raise ValueError('column {} is missing in some rows'.format(column))
+
+
+def _results(chunks, jobs):
+    """
+    Yield ``(rows, errors)`` for each chunk, with at most two chunks per worker in flight.
+    """
+    if jobs == 1:
+        for rows, values in chunks:
+            yield rows, _validate_column(values)
+        return
+
+    import multiprocessing
+
+    with multiprocessing.Pool(jobs) as pool:
+        pending = collections.deque()
+
+        for rows, values in chunks:
+            pending.append((rows, pool.apply_async(_validate_column, (values,))))
+
+            if len(pending) >= jobs * 2:
+                rows, result = pending.popleft()
+                yield rows, result.get()
+
+        while pending:
+            rows, result = pending.popleft()
+            yield rows, result.get()
+
+
+def _validate(args):
+    vectorized._require_numpy()
+
+    jobs = args.jobs or os.cpu_count() or 1
+    counts = collections.Counter()
+    start = timer()
+
+    with _open(args.input, 'r') as source, _open(args.output_file, 'w') as target:
+        rows = (row for row in csv.reader(source, delimiter=args.delimiter) if row)
+        writer = csv.writer(target, delimiter=args.delimiter, lineterminator='\n')
+
+        column = args.column
+        if args.header:
+            header = next(rows, [])
+            column = header.index(column) if column in header else int(column)
+            if args.output == 'valid':
+                writer.writerow(header)
+            elif args.output == 'invalid':
+                writer.writerow(header + ['reason'])
+        else:
+            column = int(column)
+
+        for chunk, errors in _results(_chunks(rows, column, args.chunk_size), jobs):
+            counts.update(errors)
+
+            if args.output == 'valid':
+                writer.writerows(row for row, error in zip(chunk, errors) if error == vectorized.VALID)
+            elif args.output == 'invalid':
+                writer.writerows(row + [REASONS[error]] for row, error in zip(chunk, errors) if error != vectorized.VALID)
+
+        total = sum(counts.values())
+        elapsed = timer() - start
+
+        if args.output == 'summary':
+            target.write('total: {}\n'.format(total))
+            for code, reason in sorted(REASONS.items()):
+                target.write('{}: {}\n'.format(reason, counts[code]))
+
+    sys.stderr.write('[*] validated {} rows ({} invalid) in {:.3f}s, {:.0f} rows/s\n'.format(
+        total, total - counts[vectorized.VALID], elapsed, total / elapsed if elapsed else 0))
+
+    return 0 if counts[vectorized.VALID] == total else 1
+
+
+def _dedup(args):
+    from . import tools
+
+    vectorized._require_numpy()
+    result = tools.dedup(args.inputs, args.output_file, args.memory_limit, args.temporary_directory)
+
+    sys.stderr.write('[*] read {} rows ({} invalid, {} duplicates), wrote {} values in {:.3f}s, {:.0f} rows/s, {} runs spilled\n'.format(
+        result.rows, result.invalid, result.duplicates, result.written, result.seconds, result.rows_per_second, result.runs))
+
+    return 0 if not result.invalid else 1
+
+
+def main(argv=None):
+    """
+    Run the command line interface with given arguments.
+
+    :param argv: command line arguments, :py:data:`sys.argv` is used if not given.
+    :type argv: :py:func:`list` of :py:func:`str`
+
+    :return: exit status, ``0`` if all the values were valid, ``1`` if some were invalid and ``2`` on errors.
+    :rtype: :py:func:`int`
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, ImportError) as error:
+        parser.exit(2, '{}: error: {}\n'.format(parser.prog, error))
@@ -0,0 +1,164 @@
+# coding: utf-8
+
+"""
+Compact fixed-width binary records of valid EstNIN values.
+
+Every value is stored as its :func:`ordinal <estnin.to_ordinal>` in :data:`RECORD_SIZE` bytes in
+big-endian order, so the records sort bytewise in the same order as the values and any record can
+be decoded on its own. The checksum is not stored, it is derived on decoding.
+
+The ``*_many`` functions require `NumPy <https://numpy.org/>`_.
+"""
+
+from .ordinal import COUNT, to_ordinal, from_ordinal, to_ordinal_many, from_ordinal_many
+from .vectorized import np, _require_numpy
+
+#: Number of bytes in a record.
+RECORD_SIZE = 4
+
+_DTYPE = '>u4'
+
+
+def encode(value):
+    """
+    Encode a single value.
+
+    :param value: valid EstNIN
+    :type value: :py:func:`int`, :py:func:`str` or :class:`estnin.estnin <estnin.estnin>`
+
+    :rtype: :py:func:`bytes`
+
+    :raises: :py:exc:`ValueError <ValueError>` if the value is not a valid EstNIN.
+
+    **Usage:**
+        >>> from estnin import codec
+        >>> codec.encode(37001011233)
+        b'\\x05\\xe0\\xbfS'
+        >>> codec.decode(b'\\x05\\xe0\\xbfS')
+        37001011233
+    """
+    return to_ordinal(value).to_bytes(RECORD_SIZE, 'big')
+
+
+def decode(record):
+    """
+    Decode a single record.
+
+    :param record: :data:`RECORD_SIZE` bytes.
+    :type record: :py:func:`bytes` or any buffer
+
+    :rtype: :py:func:`int`
+
+    :raises: :py:exc:`ValueError <ValueError>` if the record is not a valid value.
+    """
+    record = memoryview(record).cast('B')
+    if len(record) != RECORD_SIZE:
+        raise ValueError('record must be {} bytes'.format(RECORD_SIZE))
+
+    ordinal = int.from_bytes(record, 'big')
+    if ordinal >= COUNT:
+        raise ValueError('invalid record')
+
+    return from_ordinal(ordinal)
+
+
+def decode_at(data, index):
+    """
+    Decode the record at given index without decoding the others.
+
+    :param data: encoded records.
+    :type data: :py:func:`bytes`, :py:func:`bytearray`, :py:func:`memoryview`, :py:mod:`mmap` or
+                :class:`numpy.ndarray`
+
+    :param index: index of the record, negative values count from the end.
+    :type index: :py:func:`int`
+
+    :rtype: :py:func:`int`
+
+    :raises: :py:exc:`IndexError <IndexError>` if the index is out of range.
+    :raises: :py:exc:`ValueError <ValueError>` if the record is not a valid value.
+    """
+    data = memoryview(data).cast('B')
+    count = _count(data)
+
+    if index < 0:
+        index += count
+    if not 0 <= index < count:
+        raise IndexError('record index out of range')
+
+    return decode(data[index * RECORD_SIZE:(index + 1) * RECORD_SIZE])
+
+
+def encode_many(values, out=None):
+    """
+    Encode many values at once.
+
+    :param values: valid EstNINs
+    :type values: :class:`numpy.ndarray` or any sequence of :py:func:`int` or :py:func:`str`
+
+    :param out: writable buffer of exactly ``len(values) * RECORD_SIZE`` bytes to write the records
+                to, e.g. :py:func:`bytearray`, a shared memory block or a memory-mapped file.
+    :type out: any writable buffer
+
+    :return: the records, or *out* if given.
+    :rtype: :py:func:`bytes`
+
+    :raises: :py:exc:`ValueError <ValueError>` if any of the values is not a valid EstNIN or *out*
+             has a wrong size.
+
+    **Usage:**
+        >>> from estnin import codec
+        >>> data = codec.encode_many([37001011233, 47001011234])
+        >>> len(data)
+        8
+        >>> codec.decode_many(data)
+        array([37001011233, 47001011234])
+        >>> codec.decode_at(data, -1)
+        47001011234
+    """
+    _require_numpy()
+    ordinals = to_ordinal_many(values).reshape(-1).astype(_DTYPE)
+
+    if out is None:
+        return ordinals.tobytes()
+
+    target = np.frombuffer(out, dtype=np.uint8)
+    if len(target) != ordinals.nbytes:
+        raise ValueError('out must be {} bytes'.format(ordinals.nbytes))
+
+    target[:] = ordinals.view(np.uint8)
+    return out
+
+
+def decode_many(data):
+    """
+    Decode and validate all the records.
+
+    :param data: encoded records.
+    :type data: :py:func:`bytes`, :py:func:`bytearray`, :py:func:`memoryview`, :py:mod:`mmap` or
+                :class:`numpy.ndarray`
+
+    :rtype: :class:`numpy.ndarray` of ``int64``
+
+    :raises: :py:exc:`ValueError <ValueError>` if the size of data is not a multiple of
+             :data:`RECORD_SIZE` or any of the records is not a valid value.
+    """
+    _require_numpy()
+    data = memoryview(data).cast('B')
+    _count(data)
+
+    ordinals = np.frombuffer(data, dtype=_DTYPE).astype(np.int64)
+
+    invalid = np.flatnonzero(ordinals >= COUNT)
+    if len(invalid):
+        raise ValueError('invalid record at index {}'.format(invalid[0]))
+
+    return from_ordinal_many(ordinals)
+
+
+def _count(data):
+    count, remainder = divmod(len(data), RECORD_SIZE)
+    if remainder:
+        raise ValueError('data size is not a multiple of {}'.format(RECORD_SIZE))
+
+    return count
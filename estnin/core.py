@@ -0,0 +1,882 @@
+# coding: utf-8
+
+from array import array
+from datetime import date
+from functools import total_ordering
+from collections import namedtuple
+
+__author__ = "Anti Räis"
+
+_WEIGHTS_1 = (1, 2, 3, 4, 5, 6, 7, 8, 9, 1)
+_WEIGHTS_2 = (3, 4, 5, 6, 7, 8, 9, 1, 2, 3)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _checksum_table(weights_1, weights_2, digits):
+    # each entry packs the partial sums of both weight passes (mod 11) as ``first * 32 + second``
+    table = []
+    for value in range(10**digits):
+        first = second = 0
+        for position in range(digits):
+            digit = value // 10**(digits - 1 - position) % 10
+            first += digit * weights_1[position]
+            second += digit * weights_2[position]
+        table.append(first % 11 * 32 + second % 11)
+    return table
+
+
+def _checksum_final_table():
+    table = []
+    for packed in range(32 * 32):
+        first, second = divmod(packed, 32)
+        first, second = first % 11, second % 11
+        table.append(first if first != 10 else (second if second != 10 else 0))
+    return table
+
+
+_CHECKSUM_TABLES = None
+
+
+def _checksum_tables():
+    """
+    Return the checksum tables ``(prefix, middle, sequence, final)``, they are built on first use
+    to keep the import cheap.
+
+    The first three hold the partial sums for the digit groups century + YYM, MDD and the sequence
+    and *final* maps the sum of the partial sums to the checksum digit.
+    """
+    global _CHECKSUM_TABLES
+
+    if _CHECKSUM_TABLES is None:
+        _CHECKSUM_TABLES = (
+            _checksum_table(_WEIGHTS_1[:4], _WEIGHTS_2[:4], 4),
+            _checksum_table(_WEIGHTS_1[4:7], _WEIGHTS_2[4:7], 3),
+            _checksum_table(_WEIGHTS_1[7:], _WEIGHTS_2[7:], 3),
+            _checksum_final_table(),
+        )
+
+    return _CHECKSUM_TABLES
+
+
+def checksum(value):
+    """
+    Calculate the checksum digit for given EstNIN. The last digit of the value is ignored.
+
+    :param value: 11 digit EstNIN value.
+    :type value: :py:func:`int` or :py:func:`str`
+
+    :return: checksum digit
+    :rtype: :py:func:`int`
+
+    :raises: :py:exc:`ValueError <ValueError>` if the value is not an 11 digit number.
+
+    **Usage:**
+        >>> from estnin import checksum
+        >>> checksum(37001011230)
+        3
+    """
+    value = int(value)
+
+    if not 10**10 <= value < 10**11:
+        raise ValueError('value is out of range')
+
+    return _checksum(value)
+
+
+def _checksum(value):
+    prefix, middle, sequence, final = _CHECKSUM_TABLES or _checksum_tables()
+    body = value // 10
+    return final[prefix[body // 10**6] + middle[body // 1000 % 1000] + sequence[body % 1000]]
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _is_valid_date(year, month, day):
+    if not 1 <= month <= 12:
+        return False
+
+    return 1 <= day <= _DAYS_IN_MONTH[month] + (month == 2 and _is_leap(year))
+
+
+# the calendar of 1800-01-01..2199-12-31, days are numbered from 0 starting with 1800-01-01
+_DAY_ZERO = date(1800, 1, 1).toordinal()
+_DAY_COUNT = date(2200, 1, 1).toordinal() - _DAY_ZERO
+_CALENDAR = None
+
+
+def _calendar():
+    """
+    Return the calendar table, it is built on first use to keep the import cheap.
+
+    The table is ``(months, days, dates)`` where *months* packs ``first day number * 32 + length``
+    for ``CYYMM`` (zero for invalid months), *days* holds ``century index * 10**6 + YYMMDD`` for
+    every day number and *dates* caches the :py:func:`datetime.date` objects by day number. The
+    century index is ``(century digit - 1) // 2``.
+    """
+    global _CALENDAR
+
+    if _CALENDAR is None:
+        months = array('i', [0]) * (9 * 10**4)
+        days = array('i')
+
+        for year in range(1800, 2200):
+            index = (year - 1800) // 100
+            prefix = index * 10**4 + year % 100 * 100
+            for month in range(1, 13):
+                length = _DAYS_IN_MONTH[month] + (month == 2 and _is_leap(year))
+                for century in (index * 2 + 1, index * 2 + 2):
+                    months[century * 10**4 + year % 100 * 100 + month] = len(days) * 32 + length
+                days.extend(range((prefix + month) * 100 + 1, (prefix + month) * 100 + length + 1))
+
+        _CALENDAR = months, days, [None] * _DAY_COUNT
+
+    return _CALENDAR
+
+
+def _day_number(value):
+    # number of the birth day of an EstNIN in range, -1 if the date is invalid
+    key = value // 10**4
+    entry = (_CALENDAR or _calendar())[0][key // 100]
+    day = key % 100
+    return (entry >> 5) + day - 1 if 0 < day <= entry & 31 else -1
+
+
+def _day_value(number, female):
+    # EstNIN without the sequence and checksum for given day number and sex
+    day = (_CALENDAR or _calendar())[1][number]
+    return (day // 10**6 * 2 + 1 + female) * 10**10 + day % 10**6 * 10**4
+
+
+def _day_date(number):
+    dates = (_CALENDAR or _calendar())[2]
+    birth_date = dates[number]
+    if birth_date is None:
+        birth_date = dates[number] = date.fromordinal(_DAY_ZERO + number)
+    return birth_date
+
+
+def _age(value, on):
+    # whole years since the date of birth, a 29th of February birthday is on the 1st of March in
+    # common years as (month, day) is compared as MMDD
+    century = value // 10**10
+    year = 1800 + 100 * ((century - 1) // 2) + value // 10**8 % 100
+    return on.year - year - (on.month * 100 + on.day < value // 10**4 % 10**4)
+
+
+class _estnin(namedtuple('ESTNIN', 'century date sequence checksum')):
+    def __str__(self):
+        return str(int(self))
+
+    def __int__(self):
+        date = self.date
+        return (
+            self.century * 10**10
+            + date.year % 100 * 10**8
+            + date.month * 10**6
+            + date.day * 10**4
+            + self.sequence * 10
+            + self.checksum
+        )
+
+
+class estnin(object):
+    """
+    Provides an representation for Estonian national identity number.
+    """
+
+    #: First valid value (minimum as a number).
+    MIN = 10001010002
+    #: Last valid value (maximum as a number).
+    MAX = 89912319991
+
+    #: Value used by :class:`estnin.create <estnin.create>` method to indicate that the new EstNIN should be created for a male.
+    MALE = 0
+    #: Value used by :class:`estnin.create <estnin.create>` method to indicate that the new EstNIN should be created is for a female.
+    FEMALE = 1
+
+    def __init__(self, estnin, set_checksum=False, lazy=False):
+        """
+        Create a new instance from given value.
+
+        :param estnin: value to create an EstNIN representation for.
+        :type estnin: :py:func:`str` or :py:func:`int`
+
+        :param set_checksum: if set to :py:const:`True` then recalculate and set the checksum value.
+        :type set_checksum: :py:const:`bool`
+
+        :param lazy: if set to :py:const:`True` then only the validated number is kept and the date
+                     fields are decoded on first access.
+        :type lazy: :py:const:`bool`
+
+        :return: :class:`estnin <estnin>` object
+        :rtype: estnin.estnin
+
+        :raises: :py:exc:`ValueError <ValueError>` if invalid value is given.
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> estnin(37001011233)
+            37001011233
+            >>> estnin("37001011230", set_checksum=True)
+            37001011233
+            >>> estnin(37001011233, lazy=True).is_male
+            True
+        """
+        if lazy:
+            self._value = self._validate_lazy(estnin, set_checksum=set_checksum)
+        else:
+            self._estnin = self._validate_format(estnin, set_checksum=set_checksum)
+
+    def __getattr__(self, name):
+        # decodes the fields of a lazily created instance on first access
+        if name != '_estnin' or '_value' not in self.__dict__:
+            raise AttributeError(name)
+
+        estnin = self.__dict__.pop('_value')
+        self._estnin = _estnin(estnin // 10**10, self._validate_date(estnin), estnin // 10 % 1000, estnin % 10)
+        return self._estnin
+
+    @classmethod
+    def create(cls, sex, birth_date, sequence):
+        """
+        Create a new instance by providing the sex, birth date and sequence.
+
+        :param sex: use *falsy* for male and *truthy* value for female
+        :type sex: :class:`estnin.MALE <estnin.MALE>` or :class:`estnin.FEMALE <estnin.FEMALE>`
+
+        :param birth_date: date of birth
+        :type birth_date: :py:func:`datetime.date`
+
+        :param sequence: value in ``[0 - 999]`` specifing the sequence number on given day
+        :type sequence: :py:func:`int`
+
+        :return: :class:`estnin.estnin <estnin.estnin>` object
+        :rtype: estnin.estnin
+
+        :raises: :py:exc:`ValueError <ValueError>` if invalid value is provided
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> from datetime import date
+            >>> estnin.create(estnin.MALE, date(1970, 1, 1), 123)
+            37001011233
+        """
+        cls._validate_year(birth_date.year)
+        cls._validate_sequence(sequence)
+
+        century = ((birth_date.year - 1800) // 100) * 2 + 1 + bool(sex)
+        return cls(_estnin(century, birth_date, sequence, 0), set_checksum=True)
+
+    def __repr__(self):
+        return str(int(self))
+
+    def frozen(self):
+        """
+        Return an immutable and hashable copy of this EstNIN.
+
+        :rtype: :class:`estnin.EstNIN <estnin.EstNIN>`
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> estnin(37001011233).frozen()
+            37001011233
+        """
+        return EstNIN(int(self))
+
+    def age_on(self, on):
+        """
+        Return the age in whole years on given date.
+
+        People born on the 29th of February turn a year older on the 1st of March in common years.
+
+        :param on: date to calculate the age on.
+        :type on: :py:func:`datetime.date`
+
+        :return: age in whole years, negative if the date is before the date of birth.
+        :rtype: :py:func:`int`
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> from datetime import date
+            >>> estnin(37001011233).age_on(date(2020, 1, 1))
+            50
+            >>> person = estnin(60002290003)
+            >>> person.age_on(date(2001, 2, 28)), person.age_on(date(2001, 3, 1))
+            (0, 1)
+        """
+        return _age(int(self), on)
+
+    def __int__(self):
+        value = self.__dict__.get('_value')
+        return int(self._estnin) if value is None else value
+
+    def __lt__(self, other):
+        return int(self) < int(other)
+
+    def __le__(self, other):
+        return int(self) <= int(other)
+
+    def __eq__(self, other):
+        return int(self) == int(other)
+
+    def __neg__(self):
+        if self.is_male:
+            self.century += 1
+        else:
+            self.century -= 1
+
+        return self
+
+    def __add__(self, other):
+        days, sequence = divmod(self.sequence + other, 1000)
+        number = self.date.toordinal() - _DAY_ZERO + days
+        if not 0 <= number < _DAY_COUNT:
+            raise ValueError('year not in range [1800..2199]')
+
+        value = _day_value(number, self.is_female) + sequence * 10
+        self._estnin = _estnin(value // 10**10, _day_date(number), sequence, _checksum(value))
+        return self
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            value = estnin(self)
+            self += 1
+            return value
+        except ValueError:
+            raise StopIteration
+
+    def __reversed__(self):
+        try:
+            while True:
+                value = estnin(self)
+                self -= 1
+                yield value
+        except ValueError:
+            return
+
+    @classmethod
+    def _validate_year(self, year):
+        if not 1800 <= year <= 2199:
+            raise ValueError('year not in range [1800..2199]')
+
+    @classmethod
+    def _validate_sequence(self, sequence):
+        if not 0 <= sequence <= 999:
+            raise ValueError('sequence not in range [0..999]')
+
+    @classmethod
+    def _validate_century(self, century):
+        if not 1 <= century <= 8:
+            raise ValueError('century not in range [1..8]')
+
+    def _calculate_century(self, year):
+        century = (year - 1800) // 100 * 2 + 1
+        return century if self.is_male else century + 1
+
+    @classmethod
+    def _calculate_year(self, century, year):
+        return 1800 + 100 * ((century - 1) // 2) + year % 100
+
+    def _validate_value(self, estnin, set_checksum=False):
+        estnin = int(estnin)
+
+        if set_checksum:
+            if not self.MIN // 10 * 10 <= estnin <= self.MAX // 10 * 10 + 9:
+                raise ValueError('value is out of range')
+
+            return estnin // 10 * 10 + self._calculate_checksum(estnin)
+
+        if not self.MIN <= estnin <= self.MAX:
+            raise ValueError('value is out of range')
+
+        self._validate_checksum(estnin)
+        return estnin
+
+    def _validate_format(self, estnin, set_checksum=False):
+        estnin = self._validate_value(estnin, set_checksum=set_checksum)
+
+        return _estnin(
+            estnin // 10**10,
+            self._validate_date(estnin),
+            (estnin // 10) % 1000,
+            estnin % 10,
+        )
+
+    def _validate_lazy(self, estnin, set_checksum=False):
+        estnin = self._validate_value(estnin, set_checksum=set_checksum)
+
+        if _day_number(estnin) < 0:
+            raise ValueError('invalid date')
+
+        return estnin
+
+    def _validate_date(self, estnin):
+        number = _day_number(estnin)
+
+        if number < 0:
+            raise ValueError('invalid date')
+
+        return _day_date(number)
+
+    def _validate_checksum(self, checksum):
+        calculated = self._calculate_checksum(checksum)
+
+        if checksum % 10 != calculated:
+            raise ValueError('invalid checksum')
+
+        return calculated
+
+    def _update_checksum(self):
+        checksum = self._calculate_checksum(int(self._estnin))
+        self._estnin = self._estnin._replace(checksum=checksum)
+
+    @classmethod
+    def _calculate_checksum(self, estnin):
+        return _checksum(int(estnin))
+
+    @property
+    def is_male(self):
+        """
+        Returns :py:const:`True` if the EstNIN represents a male.
+
+        :rtype: :py:const:`bool`
+        """
+        return self.century % 2 == 1
+
+    @property
+    def is_female(self):
+        """
+        Returns :py:const:`True` if the EstNIN represents a female.
+
+        :rtype: :py:const:`bool`
+        """
+        return self.century % 2 == 0
+
+    @property
+    def century(self):
+        """
+        Century property that returns the century digit in the EstNIN or sets it accordingly.
+
+        :getter: return the century digit as :py:func:`int`.
+        :setter: update the century digit given as :py:func:`int` or :py:func:`str`.
+        :modifies: checksum
+        :raises: :py:exc:`ValueError <ValueError>` if century value is not in range ``[1..8]``
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.century
+            3
+            >>> person.century = 5
+            >>> person
+            57001011235
+        """
+        value = self.__dict__.get('_value')
+        return self._estnin.century if value is None else value // 10**10
+
+    @century.setter
+    def century(self, value):
+        century = int(value)
+
+        self._validate_century(century)
+        year = self._calculate_year(century, self._estnin.date.year)
+        date = self._estnin.date.replace(year=year)
+        self._estnin = self._estnin._replace(century=century, date=date)
+        self._update_checksum()
+
+    @property
+    def year(self):
+        """
+        Year property that returns the year in the EstNIN or sets it accordingly.
+
+        :getter: return the year as :py:func:`int` in the format of ``YYYY``.
+        :setter: update the year given as :py:func:`int` or :py:func:`str` in the format of ``YYYY``.
+        :modifies: century, checksum
+        :raises: :py:exc:`ValueError <ValueError>` if year value is not in range ``[1800..2199]``
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.year
+            1970
+            >>> person.year = 2001
+            >>> person
+            50101011235
+        """
+        return self._estnin.date.year
+
+    @year.setter
+    def year(self, value):
+        year = int(value)
+        self._validate_year(year)
+        date = self._estnin.date.replace(year=year)
+        century = self._calculate_century(date.year)
+        self._estnin = self._estnin._replace(century=century, date=date)
+        self._update_checksum()
+
+    @property
+    def month(self):
+        """
+        Month property that returns the month in the EstNIN or sets it accordingly.
+
+        :getter: return the month as :py:func:`int` in the format of ``MM``.
+        :setter: update the month given as :py:func:`int` or :py:func:`str` in the format of ``MM``.
+        :modifies: checksum
+        :raises: :py:exc:`ValueError <ValueError>` if month value is not in range ``[1..12]``
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.month
+            1
+            >>> person.month = 12
+            >>> person
+            30112011231
+        """
+        return self._estnin.date.month
+
+    @month.setter
+    def month(self, value):
+        month = int(value)
+        date = self._estnin.date.replace(month=month)
+        self._estnin = self._estnin._replace(date=date)
+        self._update_checksum()
+
+    @property
+    def day(self):
+        """
+        Day property that returns the day in the EstNIN or sets it accordingly.
+
+        :getter: return the day as :py:func:`int` in the format of ``DD``.
+        :setter: update the day given as :py:func:`int` or :py:func:`str` in the format of ``DD``.
+        :modifies: checksum
+        :raises: :py:exc:`ValueError <ValueError>` if day value is not valid for given month.
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.day
+            1
+            >>> person.day = 31
+            >>> person
+            37001311233
+        """
+        return self._estnin.date.day
+
+    @day.setter
+    def day(self, value):
+        day = int(value)
+        date = self._estnin.date.replace(day=day)
+        self._estnin = self._estnin._replace(date=date)
+        self._update_checksum()
+
+    @property
+    def sequence(self):
+        """
+        Sequence property that returns the sequence in the EstNIN or sets it accordingly.
+
+        :getter: return the sequence as :py:func:`int`.
+        :setter: update the sequence given as :py:func:`int` or :py:func:`str`.
+        :modifies: checksum
+        :raises: :py:exc:`ValueError <ValueError>` if sequence value is not in range ``[0..999]``.
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.sequence
+            123
+            >>> person.sequence = 42
+            >>> person
+            37001010421
+        """
+        value = self.__dict__.get('_value')
+        return self._estnin.sequence if value is None else value // 10 % 1000
+
+    @sequence.setter
+    def sequence(self, value):
+        sequence = int(value)
+
+        self._validate_sequence(sequence)
+        self._estnin = self._estnin._replace(sequence=sequence)
+        self._update_checksum()
+
+    @property
+    def checksum(self):
+        """
+        Checksum property that returns the checksum digit in the EstNIN.
+
+        :getter: return the checksum as :py:func:`int`.
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.checksum
+            3
+        """
+        value = self.__dict__.get('_value')
+        return self._estnin.checksum if value is None else value % 10
+
+    @property
+    def date(self):
+        """
+        Date property that returns the date representated in the EstNIN.
+
+        :getter: return the date as :py:func:`datetime.date`.
+        :setter: update the date given as :py:func:`datetime.date`.
+        :modifies: century, checksum
+        :raises: :py:exc:`ValueError <ValueError>` if invalid date is given.
+
+        **Usage:**
+            >>> from estnin import estnin
+            >>> person = estnin(37001011233)
+            >>> person.date
+            datetime.date(1970, 1, 1)
+            >>> person.date = person.date.replace(year=1972, day=22)
+            >>> person.date
+            datetime.date(1972, 1, 22)
+            >>> person
+            37201221236
+        """
+        return self._estnin.date
+
+    @date.setter
+    def date(self, value):
+        if not isinstance(value, date):
+            raise ValueError('invalid date object')
+
+        self.year = value.year
+        self.month = value.month
+        self.day = value.day
+
+
+@total_ordering
+class EstNIN(object):
+    """
+    Immutable and hashable representation for Estonian national identity number.
+
+    Only the number itself is stored, all the other fields are derived from it on access. Instances
+    can be used as dictionary keys and set members and compare equal to their integer value.
+    """
+
+    __slots__ = ('_value',)
+
+    #: First valid value (minimum as a number).
+    MIN = estnin.MIN
+    #: Last valid value (maximum as a number).
+    MAX = estnin.MAX
+
+    #: Value used by :class:`EstNIN.create <EstNIN.create>` method to indicate a male.
+    MALE = estnin.MALE
+    #: Value used by :class:`EstNIN.create <EstNIN.create>` method to indicate a female.
+    FEMALE = estnin.FEMALE
+
+    def __init__(self, value, set_checksum=False):
+        """
+        Create a new instance from given value.
+
+        :param value: value to create an EstNIN representation for.
+        :type value: :py:func:`str`, :py:func:`int` or :class:`estnin.estnin <estnin.estnin>`
+
+        :param set_checksum: if set to :py:const:`True` then recalculate and set the checksum value.
+        :type set_checksum: :py:const:`bool`
+
+        :raises: :py:exc:`ValueError <ValueError>` if invalid value is given.
+
+        **Usage:**
+            >>> from estnin import EstNIN
+            >>> EstNIN(37001011233)
+            37001011233
+            >>> len({EstNIN(37001011233), EstNIN("37001011233")})
+            1
+        """
+        value = int(value)
+
+        if set_checksum:
+            if not self.MIN // 10 * 10 <= value <= self.MAX // 10 * 10 + 9:
+                raise ValueError('value is out of range')
+
+            value = value // 10 * 10 + _checksum(value)
+
+        else:
+            if not self.MIN <= value <= self.MAX:
+                raise ValueError('value is out of range')
+
+            if value % 10 != _checksum(value):
+                raise ValueError('invalid checksum')
+
+        if _day_number(value) < 0:
+            raise ValueError('invalid date')
+
+        object.__setattr__(self, '_value', value)
+
+    @classmethod
+    def create(cls, sex, birth_date, sequence):
+        """
+        Create a new instance by providing the sex, birth date and sequence.
+
+        :param sex: use *falsy* for male and *truthy* value for female
+        :type sex: :class:`EstNIN.MALE <EstNIN.MALE>` or :class:`EstNIN.FEMALE <EstNIN.FEMALE>`
+
+        :param birth_date: date of birth
+        :type birth_date: :py:func:`datetime.date`
+
+        :param sequence: value in ``[0 - 999]`` specifing the sequence number on given day
+        :type sequence: :py:func:`int`
+
+        :return: :class:`EstNIN <EstNIN>` object
+        :rtype: estnin.EstNIN
+
+        :raises: :py:exc:`ValueError <ValueError>` if invalid value is provided
+
+        **Usage:**
+            >>> from estnin import EstNIN
+            >>> from datetime import date
+            >>> EstNIN.create(EstNIN.MALE, date(1970, 1, 1), 123)
+            37001011233
+        """
+        return cls._from_fields(bool(sex), birth_date.year, birth_date.month, birth_date.day, sequence)
+
+    @classmethod
+    def _from_fields(cls, female, year, month, day, sequence):
+        estnin._validate_year(year)
+        estnin._validate_sequence(sequence)
+
+        century = (year - 1800) // 100 * 2 + 1 + female
+        value = century * 10**10 + year % 100 * 10**8 + month * 10**6 + day * 10**4 + sequence * 10
+        return cls(value, set_checksum=True)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    def __reduce__(self):
+        return type(self), (self._value,)
+
+    def age_on(self, on):
+        """
+        Return the age in whole years on given date, see :meth:`estnin.age_on <estnin.estnin.age_on>`.
+
+        :param on: date to calculate the age on.
+        :type on: :py:func:`datetime.date`
+
+        :rtype: :py:func:`int`
+        """
+        return _age(self._value, on)
+
+    def __repr__(self):
+        return str(self._value)
+
+    def __str__(self):
+        return str(self._value)
+
+    def __int__(self):
+        return self._value
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __eq__(self, other):
+        # only the types that hash like the value compare equal to it
+        if not isinstance(other, (int, EstNIN, estnin)):
+            return NotImplemented
+        return self._value == int(other)
+
+    def __lt__(self, other):
+        if not isinstance(other, (int, EstNIN, estnin)):
+            return NotImplemented
+        return self._value < int(other)
+
+    def __neg__(self):
+        century = self.century + 1 if self.is_male else self.century - 1
+        return type(self)(century * 10**10 + self._value % 10**10, set_checksum=True)
+
+    def __add__(self, other):
+        days, sequence = divmod(self._value // 10 % 1000 + other, 1000)
+        number = _day_number(self._value) + days
+        if not 0 <= number < _DAY_COUNT:
+            raise ValueError('year not in range [1800..2199]')
+
+        value = _day_value(number, self.is_female) + sequence * 10
+        instance = object.__new__(type(self))
+        object.__setattr__(instance, '_value', value + _checksum(value))
+        return instance
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    @property
+    def is_male(self):
+        """
+        Returns :py:const:`True` if the EstNIN represents a male.
+
+        :rtype: :py:const:`bool`
+        """
+        return self._value // 10**10 % 2 == 1
+
+    @property
+    def is_female(self):
+        """
+        Returns :py:const:`True` if the EstNIN represents a female.
+
+        :rtype: :py:const:`bool`
+        """
+        return self._value // 10**10 % 2 == 0
+
+    @property
+    def century(self):
+        """
+        Returns the century digit as :py:func:`int`.
+        """
+        return self._value // 10**10
+
+    @property
+    def year(self):
+        """
+        Returns the year as :py:func:`int` in the format of ``YYYY``.
+        """
+        return estnin._calculate_year(self._value // 10**10, self._value // 10**8)
+
+    @property
+    def month(self):
+        """
+        Returns the month as :py:func:`int`.
+        """
+        return self._value // 10**6 % 100
+
+    @property
+    def day(self):
+        """
+        Returns the day as :py:func:`int`.
+        """
+        return self._value // 10**4 % 100
+
+    @property
+    def sequence(self):
+        """
+        Returns the sequence as :py:func:`int`.
+        """
+        return self._value // 10 % 1000
+
+    @property
+    def checksum(self):
+        """
+        Returns the checksum digit as :py:func:`int`.
+        """
+        return self._value % 10
+
+    @property
+    def date(self):
+        """
+        Returns the date as :py:func:`datetime.date`.
+        """
+        return _day_date(_day_number(self._value))
@@ -0,0 +1,284 @@
+# coding: utf-8
+
+"""
+Suggestions of valid EstNIN values for mistyped input.
+
+The candidates are the values within one or two edits of the input: substituted digits, swapped
+adjacent digits, and missing or extra digits. Instead of trying all ten digits for a substituted or
+missing digit, the digit is solved from the checksum weights, which leaves at most two digits per
+position, and only those are checked for a valid date.
+"""
+
+from collections import namedtuple
+
+from .core import _checksum, _is_valid_date, _WEIGHTS_1, _WEIGHTS_2
+from .validation import _as_int, _reason, Reason
+
+#: A suggested value and the number of edits it differs from the input by.
+Suggestion = namedtuple('Suggestion', 'value edits')
+
+# multiplicative inverses modulo 11, the checksum weights are never divisible by 11
+_INVERSE = [0] + [next(x for x in range(1, 11) if w * x % 11 == 1) for w in range(1, 11)]
+_POWERS = [10**(10 - position) for position in range(11)]
+_VALID = Reason.VALID
+
+
+def _strip(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def _codes(value):
+    """
+    Return the characters of *value* as digits, other characters are ``-1``.
+    """
+    if not isinstance(value, str):
+        value = str(int(value))
+
+    return [ord(char) - 48 if '0' <= char <= '9' else -1 for char in value]
+
+
+def _number(digits):
+    number = 0
+    for digit in digits:
+        number = number * 10 + digit
+    return number
+
+
+def _check(digits, found, edits):
+    # adds a complete candidate of 11 characters if it is valid
+    if -1 in digits:
+        return
+
+    value = _number(digits)
+    if _reason(value) is _VALID:
+        _add(found, value, edits)
+
+
+def _valid_date(value):
+    century = value // 10**10
+    if not 1 <= century <= 8:
+        return False
+
+    return _is_valid_date(1800 + 100 * ((century - 1) // 2) + value // 10**8 % 100, value // 10**6 % 100, value // 10**4 % 100)
+
+
+def _add(found, value, edits):
+    if found.get(value, edits) >= edits:
+        found[value] = edits
+
+
+def _solve(digits, found, edits):
+    """
+    Add the valid values that differ from the 11 characters in *digits* by one substituted
+    character. The substituted digit is solved from the checksum.
+    """
+    invalid = [position for position, digit in enumerate(digits) if digit < 0]
+    if len(invalid) > 1:
+        return
+
+    number = sum1 = sum2 = 0
+    for position, digit in enumerate(digits[:10]):
+        digit = max(digit, 0)
+        number = number * 10 + digit
+        sum1 += _WEIGHTS_1[position] * digit
+        sum2 += _WEIGHTS_2[position] * digit
+
+    check = digits[10]
+    number = number * 10 + max(check, 0)
+
+    # the sequence and the checksum do not affect the date, so when the date is invalid only the
+    # first 7 digits are worth substituting and otherwise the checksum alone decides
+    date_valid = _valid_date(number)
+
+    for position in invalid or range(11):
+        if position >= 7 and not date_valid:
+            break
+
+        digit = max(digits[position], 0)
+        base = number - digit * _POWERS[position]
+
+        if position == 10:
+            _add(found, base + _checksum(base), edits)
+            break
+
+        rest1 = sum1 - _WEIGHTS_1[position] * digit
+        rest2 = sum2 - _WEIGHTS_2[position] * digit
+        inverse = _INVERSE[_WEIGHTS_1[position]]
+
+        # the first weights give the checksum unless their sum is 10 (mod 11), then the second
+        # weights are used, so there are at most two digits that give the right checksum
+        first = (check - rest1) * inverse % 11
+        second = (10 - rest1) * inverse % 11
+
+        if second <= 9:
+            result = (rest2 + _WEIGHTS_2[position] * second) % 11
+            if (result if result != 10 else 0) != check:
+                second = 10
+
+        for candidate in (first, second):
+            if candidate <= 9:
+                value = base + candidate * _POWERS[position]
+                if position >= 7 or _valid_date(value):
+                    _add(found, value, edits)
+
+
+def _one_edit(digits, found, edits):
+    """
+    Add the valid values within one edit of *digits* to *found* with given number of edits.
+    """
+    length = len(digits)
+
+    if length == 11:
+        _solve(digits, found, edits)
+
+        if -1 in digits:
+            return
+
+        number = _number(digits)
+        date_valid = _valid_date(number)
+
+        for position in range(10):
+            first, second = digits[position], digits[position + 1]
+            if first == second:
+                continue
+
+            value = number + (second - first) * 9 * _POWERS[position + 1]
+            if position >= 7:
+                if date_valid and value % 10 == _checksum(value):
+                    _add(found, value, edits)
+            elif _reason(value) is _VALID:
+                _add(found, value, edits)
+
+    elif length == 10:
+        # a missing digit is a substitution of a placeholder inserted at every position
+        for position in range(11):
+            _solve(digits[:position] + [-1] + digits[position:], found, edits)
+
+    elif length == 12:
+        for position in range(12):
+            if position == 0 or digits[position] != digits[position - 1]:
+                _check(digits[:position] + digits[position + 1:], found, edits)
+
+
+def _neighbours(digits):
+    """
+    Yield all the sequences within one edit of *digits*.
+    """
+    length = len(digits)
+
+    for position in range(length):
+        for digit in range(10):
+            if digit != digits[position]:
+                yield digits[:position] + [digit] + digits[position + 1:]
+
+    for position in range(length - 1):
+        if digits[position] != digits[position + 1]:
+            swapped = digits[:]
+            swapped[position], swapped[position + 1] = digits[position + 1], digits[position]
+            yield swapped
+
+    for position in range(length):
+        yield digits[:position] + digits[position + 1:]
+
+    for position in range(length + 1):
+        for digit in range(10):
+            yield digits[:position] + [digit] + digits[position:]
+
+
+def _suggest(digits, max_edits):
+    found = {}
+
+    if abs(len(digits) - 11) <= 1:
+        _one_edit(digits, found, 1)
+
+    if max_edits == 2 and abs(len(digits) - 11) <= 2:
+        for neighbour in _neighbours(digits):
+            if abs(len(neighbour) - 11) <= 1:
+                _one_edit(neighbour, found, 2)
+
+    return [Suggestion(value, edits) for edits, value in sorted((edits, value) for value, edits in found.items())]
+
+
+def _max_edits(max_edits):
+    if max_edits not in (1, 2):
+        raise ValueError('max_edits must be 1 or 2')
+
+
+def suggest(value, max_edits=1):
+    """
+    Suggest valid EstNIN values for a mistyped value.
+
+    A valid value is returned as is with 0 edits. Otherwise the valid values that can be reached
+    with up to *max_edits* edits are returned, where an edit is a substituted character, a swap of
+    two adjacent characters, or a missing or extra digit.
+
+    :param value: mistyped value, any characters other than digits must be edited.
+    :type value: :py:func:`str` or :py:func:`int`
+
+    :param max_edits: maximum number of edits, ``1`` or ``2``.
+    :type max_edits: :py:func:`int`
+
+    :return: suggestions ordered by the number of edits and the value.
+    :rtype: :py:func:`list` of :class:`Suggestion`
+
+    :raises: :py:exc:`ValueError <ValueError>` if max_edits is not ``1`` or ``2``.
+
+    **Usage:**
+        >>> from estnin import suggest
+        >>> suggest('37001011233')
+        [Suggestion(value=37001011233, edits=0)]
+        >>> suggest('3700101l233')
+        [Suggestion(value=37001011233, edits=1)]
+        >>> [value for value, edits in suggest('3700101123')]
+        [37001011233, 37001011723, 37001015123, 37001041123, 37001101123]
+        >>> len(suggest('3700101123', max_edits=2))
+        417
+    """
+    _max_edits(max_edits)
+    value = _strip(value)
+    number = _as_int(value)
+
+    if number is not None and _reason(number) is _VALID:
+        return [Suggestion(number, 0)]
+
+    return _suggest(_codes(value), max_edits)
+
+
+def suggest_many(values, max_edits=1):
+    """
+    Suggest valid EstNIN values for each of the given values, see :func:`suggest`. Repeated invalid
+    values are only corrected once.
+
+    :param values: values to correct.
+    :type values: any iterable of :py:func:`str` or :py:func:`int`
+
+    :param max_edits: maximum number of edits, ``1`` or ``2``.
+    :type max_edits: :py:func:`int`
+
+    :return: suggestions for each value in the same order.
+    :rtype: :py:func:`list` of :py:func:`list` of :class:`Suggestion`
+
+    :raises: :py:exc:`ValueError <ValueError>` if max_edits is not ``1`` or ``2``.
+    """
+    _max_edits(max_edits)
+    corrected = {}
+    result = []
+
+    for value in values:
+        value = _strip(value)
+        number = _as_int(value)
+
+        if number is not None and _reason(number) is _VALID:
+            result.append([Suggestion(number, 0)])
+            continue
+
+        # only the invalid values are kept, as they are usually few and often repeated
+        digits = _codes(value)
+        key = tuple(digits)
+        suggestions = corrected.get(key)
+        if suggestions is None:
+            suggestions = corrected[key] = _suggest(digits, max_edits)
+
+        result.append(suggestions)
+
+    return result
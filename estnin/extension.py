@@ -0,0 +1,286 @@
+# coding: utf-8
+
+"""
+`pandas <https://pandas.pydata.org/>`_ support for EstNIN columns.
+
+Importing this module registers the ``"estnin"`` dtype, backed by a single ``int64`` array where
+missing values are stored as ``0``, and the ``.estnin`` accessor for :class:`pandas.Series` of any
+dtype. pandas can be installed together with the package using the ``pandas`` extra::
+
+    pip install estnin[pandas]
+"""
+
+import numbers
+
+from .core import EstNIN
+from .vectorized import np, _as_int64, _validate_array, VALID, FORMAT
+
+try:
+    import pandas as pd
+    from pandas.api.extensions import (
+        ExtensionArray, ExtensionDtype, register_extension_dtype, register_series_accessor, take,
+    )
+except ImportError:  # pragma: no cover
+    raise ImportError('pandas is required for the extension types, install it with "pip install estnin[pandas]"')
+
+
+@register_extension_dtype
+class EstNINDtype(ExtensionDtype):
+    """
+    pandas dtype of valid EstNIN values, available as ``dtype="estnin"``.
+
+    **Usage:**
+        >>> import pandas as pd
+        >>> import estnin.extension
+        >>> pd.Series(['37001011233', None], dtype='estnin')
+        0    37001011233
+        1           <NA>
+        dtype: estnin
+    """
+
+    name = 'estnin'
+    type = EstNIN
+    kind = 'O'
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return EstNINExtensionArray
+
+
+class EstNINExtensionArray(ExtensionArray):
+    """
+    pandas extension array of valid EstNIN values stored in an ``int64`` array, elements are
+    :class:`estnin.EstNIN <estnin.EstNIN>` or :data:`pandas.NA`.
+    """
+
+    def __init__(self, values, copy=False):
+        """
+        Wrap an ``int64`` array of valid values where ``0`` marks a missing value, the values are
+        not validated. Use :meth:`_from_sequence` or ``pd.array(values, dtype='estnin')`` to
+        validate the values.
+        """
+        self._data = np.array(values, dtype=np.int64, copy=copy or None)
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+
+        values = np.asarray(scalars, dtype=object).reshape(-1)
+        missing = pd.isna(values)
+        values[missing] = 0
+
+        values, errors = _as_int64(values)
+        _validate_array(values, errors)
+        errors[missing] = VALID
+        values[missing] = 0
+
+        invalid = np.flatnonzero(errors != VALID)
+        if len(invalid):
+            raise ValueError('invalid value at index {}'.format(invalid[0]))
+
+        return cls(values)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, dtype=None, copy=False):
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    @property
+    def dtype(self):
+        return EstNINDtype()
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if isinstance(key, numbers.Integral):
+            value = int(self._data[key])
+            return EstNIN(value) if value else pd.NA
+
+        key = pd.api.indexers.check_array_indexer(self, key)
+        return type(self)(self._data[key])
+
+    def __setitem__(self, key, value):
+        key = pd.api.indexers.check_array_indexer(self, key)
+
+        if pd.api.types.is_scalar(value) or isinstance(value, EstNIN):
+            self._data[key] = self._from_sequence([value])._data[0]
+        else:
+            self._data[key] = self._from_sequence(value)._data
+
+    def __iter__(self):
+        for value in self._data.tolist():
+            yield EstNIN(value) if value else pd.NA
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        if isinstance(other, EstNINExtensionArray):
+            other = other._data
+        else:
+            try:
+                other = self._from_sequence(other if pd.api.types.is_list_like(other) else [other])._data
+            except (TypeError, ValueError):
+                return np.zeros(len(self), dtype=bool)
+
+        return (self._data == other) & (self._data != 0)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype).kind in 'iu':
+            if self._hasna:
+                raise ValueError('cannot convert missing values to integers')
+            return self._data.astype(dtype)
+
+        return np.array(list(self), dtype=object if dtype is None else dtype)
+
+    def isna(self):
+        return self._data == 0
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = int(EstNIN(fill_value))
+        else:
+            fill_value = 0
+
+        return type(self)(take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value))
+
+    def copy(self):
+        return type(self)(self._data, copy=True)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(np.concatenate([array._data for array in to_concat]))
+
+    def _values_for_factorize(self):
+        return self._data, 0
+
+    def _values_for_argsort(self):
+        return self._data
+
+    def _formatter(self, boxed=False):
+        return str
+
+
+def _validate_series(series):
+    """
+    Return the ``int64`` values and error codes of a :class:`pandas.Series` of any dtype.
+    """
+    if isinstance(series.dtype, EstNINDtype):
+        values = series.array._data
+        return values, np.where(values == 0, FORMAT, VALID).astype(np.uint8)
+
+    if pd.api.types.is_bool_dtype(series.dtype):
+        values = np.zeros(len(series), dtype=np.int64)
+        return values, np.full(len(series), FORMAT, dtype=np.uint8)
+
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        missing = series.isna().to_numpy()
+        values = series.to_numpy(dtype=np.float64, na_value=0)
+        integral = values == np.floor(values)
+        values = np.where(integral, values, 0).astype(np.int64)
+        errors = np.zeros(len(values), dtype=np.uint8)
+        errors[missing | ~integral] = FORMAT
+    else:
+        values = series.to_numpy(dtype=object, na_value='')
+        values, errors = _as_int64(values)
+
+    _validate_array(values, errors)
+    return values, errors
+
+
+@register_series_accessor('estnin')
+class EstNINAccessor(object):
+    """
+    Vectorized EstNIN properties of a :class:`pandas.Series` of any dtype, available as
+    ``series.estnin``. Values that are missing or invalid give ``False``, ``<NA>`` or ``NaT``.
+
+    **Usage:**
+        >>> import pandas as pd
+        >>> import estnin.extension
+        >>> people = pd.Series(['37001011233', '47001011234', 'x'])
+        >>> people.estnin.is_valid.tolist()
+        [True, True, False]
+        >>> people.estnin.is_female.tolist()
+        [False, True, <NA>]
+        >>> people.estnin.birth_date.tolist()
+        [Timestamp('1970-01-01 00:00:00'), Timestamp('1970-01-01 00:00:00'), NaT]
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    def _validate(self):
+        return _validate_series(self._series)
+
+    def _series_of(self, values):
+        return pd.Series(values, index=self._series.index, name=self._series.name)
+
+    def _masked(self, values, array_type):
+        return self._series_of(array_type(values, self._validate()[1] != VALID))
+
+    @property
+    def errors(self):
+        """
+        Returns the error codes as :class:`pandas.Series` of ``uint8``, see
+        :func:`estnin.validate_many <estnin.validate_many>`.
+        """
+        return self._series_of(self._validate()[1])
+
+    @property
+    def is_valid(self):
+        """
+        Returns :class:`pandas.Series` of :py:const:`bool` that is :py:const:`True` for valid values.
+        """
+        return self._series_of(self._validate()[1] == VALID)
+
+    @property
+    def birth_date(self):
+        """
+        Returns the dates of birth as :class:`pandas.Series` of ``datetime64``.
+        """
+        values, errors = self._validate()
+        year = 1800 + 100 * ((values // 10**10 - 1) // 2) + values // 10**8 % 100
+        months = ((year - 1970) * 12 + values // 10**6 % 100 - 1).astype('datetime64[M]')
+        dates = months.astype('datetime64[D]') + (values // 10**4 % 100 - 1).astype('timedelta64[D]')
+        dates[errors != VALID] = np.datetime64('NaT')
+        return self._series_of(dates.astype('datetime64[s]'))
+
+    @property
+    def is_male(self):
+        """
+        Returns :class:`pandas.Series` of nullable ``boolean`` that is :py:const:`True` for males.
+        """
+        return self._masked(self._validate()[0] // 10**10 % 2 == 1, pd.arrays.BooleanArray)
+
+    @property
+    def is_female(self):
+        """
+        Returns :class:`pandas.Series` of nullable ``boolean`` that is :py:const:`True` for females.
+        """
+        return self._masked(self._validate()[0] // 10**10 % 2 == 0, pd.arrays.BooleanArray)
+
+    @property
+    def sequence(self):
+        """
+        Returns the sequences as :class:`pandas.Series` of nullable ``Int64``.
+        """
+        return self._masked(self._validate()[0] // 10 % 1000, pd.arrays.IntegerArray)
+
+    def to_estnin(self):
+        """
+        Convert the series to ``estnin`` dtype, invalid values become missing.
+
+        :rtype: :class:`pandas.Series`
+        """
+        values, errors = self._validate()
+        return self._series_of(EstNINExtensionArray(np.where(errors == VALID, values, 0)))
@@ -0,0 +1,213 @@
+# coding: utf-8
+
+"""
+Sorted in-memory index of EstNIN values for birth date, birthday and sex queries.
+"""
+
+from .core import estnin, _DAYS_IN_MONTH
+from .array import EstNINArray
+from .ordinal import _DAY_ZERO, _tables
+from .vectorized import np, _require_numpy, _as_int64, _validate_array, VALID
+
+
+def _day(value):
+    """
+    Return the number of days since 1800-01-01 for given date.
+    """
+    estnin._validate_year(value.year)
+    return value.toordinal() - _DAY_ZERO
+
+
+class Index(object):
+    """
+    Provides fast queries by birth date, birthday and sex over a fixed set of EstNIN values.
+
+    The values are kept ordered by birth date, sex (males first) and sequence, so every query is a
+    few binary searches followed by slicing. Duplicate values are kept.
+    """
+
+    def __init__(self, values, validate=True):
+        """
+        Build the index.
+
+        :param values: values to index.
+        :type values: :class:`numpy.ndarray`, :class:`EstNINArray <estnin.EstNINArray>` or any
+                      sequence of :py:func:`int` or :py:func:`str`
+
+        :param validate: if set to :py:const:`False` then the values are assumed to be valid.
+        :type validate: :py:const:`bool`
+
+        :raises: :py:exc:`ValueError <ValueError>` if any of the values is invalid.
+
+        **Usage:**
+            >>> from estnin import estnin, Index
+            >>> from datetime import date
+            >>> index = Index([37001011233, 47001011234, 48503150003, 38503150013])
+            >>> index.born_between(date(1985, 3, 1), date(1985, 6, 30), sex=estnin.FEMALE)
+            EstNINArray([48503150003])
+            >>> index.birthday(1, 1)
+            EstNINArray([37001011233, 47001011234])
+            >>> index.count_between(date(1970, 1, 1), date(1999, 12, 31), sex=estnin.MALE)
+            2
+        """
+        _require_numpy()
+
+        if isinstance(values, EstNINArray):
+            values = values.values
+
+        values, errors = _as_int64(values)
+
+        if validate:
+            _validate_array(values, errors)
+            invalid = np.flatnonzero(errors != VALID)
+            if len(invalid):
+                raise ValueError('invalid value at index {}'.format(invalid[0]))
+
+        keys = self._sort_keys(values)
+        order = np.argsort(keys)
+
+        self._keys = keys[order]
+        self._values = values[order]
+        self._values.flags.writeable = False
+
+        # number of females before each position, for counting by sex without scanning
+        self._females = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(self._keys // 1000 % 2, out=self._females[1:])
+
+    @staticmethod
+    def _sort_keys(values):
+        """
+        Return the sort keys ``(day * 2 + female) * 1000 + sequence`` where ``day`` is the number of
+        days since 1800-01-01.
+        """
+        year_start, leap, month_start = _tables()[:3]
+        century = values // 10**10
+        year = 100 * ((century - 1) // 2) + values // 10**8 % 100
+        day = year_start[year] + month_start[leap[year].astype(np.int64), values // 10**6 % 100] + values // 10**4 % 100 - 1
+        return (day * 2 + (century + 1) % 2) * 1000 + values // 10 % 1000
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return '{}(len={})'.format(type(self).__name__, len(self))
+
+    def __contains__(self, value):
+        try:
+            value = int(value)
+            key = self._sort_keys(np.array([value], dtype=np.int64))[0]
+        except (TypeError, ValueError, OverflowError, IndexError):
+            return False
+
+        position = np.searchsorted(self._keys, key)
+        return bool(position < len(self._keys) and self._values[position] == value)
+
+    @property
+    def values(self):
+        """
+        Returns all the values in the order of the index as a read-only ``int64`` array.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._values
+
+    def _bounds(self, first, last):
+        if first > last:
+            raise ValueError('first date must not be after the last date')
+
+        return np.searchsorted(self._keys, [_day(first) * 2000, (_day(last) + 1) * 2000])
+
+    def born_between(self, first, last, sex=None):
+        """
+        Return the values with birth date between *first* and *last* (inclusive).
+
+        :param first: first date of birth.
+        :type first: :py:func:`datetime.date`
+
+        :param last: last date of birth.
+        :type last: :py:func:`datetime.date`
+
+        :param sex: :class:`estnin.MALE <estnin.estnin.MALE>`, :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+                    or :py:const:`None` for both.
+
+        :return: values ordered by birth date, sex and sequence.
+        :rtype: :class:`EstNINArray <estnin.EstNINArray>`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the dates are not in range [1800..2199] or not ordered.
+        """
+        start, stop = self._bounds(first, last)
+        values = self._values[start:stop]
+
+        if sex is not None:
+            values = values[self._keys[start:stop] // 1000 % 2 == int(bool(sex))]
+
+        return EstNINArray._wrap(values)
+
+    def count_between(self, first, last, sex=None):
+        """
+        Return the number of values with birth date between *first* and *last* (inclusive).
+        See :meth:`born_between` for the arguments.
+
+        :rtype: :py:func:`int`
+        """
+        start, stop = self._bounds(first, last)
+
+        if sex is None:
+            return int(stop - start)
+
+        females = int(self._females[stop] - self._females[start])
+        return females if sex else int(stop - start) - females
+
+    def _birthday_ranges(self, month, day, sex):
+        year_start, leap, month_start = _tables()[:3]
+
+        if not 1 <= month <= 12:
+            raise ValueError('month not in range [1..12]')
+        if not 1 <= day <= _DAYS_IN_MONTH[month] + (month == 2):
+            raise ValueError('day not in range for month {}'.format(month))
+
+        leap = leap[:-1].astype(np.int64)
+        years = np.flatnonzero(day <= _DAYS_IN_MONTH[month] + leap * (month == 2))
+        days = year_start[years] + month_start[leap[years], month] + day - 1
+
+        if sex is None:
+            starts, stops = days * 2000, days * 2000 + 2000
+        else:
+            starts = (days * 2 + int(bool(sex))) * 1000
+            stops = starts + 1000
+
+        return np.searchsorted(self._keys, starts), np.searchsorted(self._keys, stops)
+
+    def birthday(self, month, day, sex=None):
+        """
+        Return the values with birthday on given month and day in any year.
+
+        :param month: month of birth.
+        :type month: :py:func:`int`
+
+        :param day: day of birth, 29th of February returns the people born on leap days.
+        :type day: :py:func:`int`
+
+        :param sex: :class:`estnin.MALE <estnin.estnin.MALE>`, :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+                    or :py:const:`None` for both.
+
+        :return: values ordered by birth date, sex and sequence.
+        :rtype: :class:`EstNINArray <estnin.EstNINArray>`
+
+        :raises: :py:exc:`ValueError <ValueError>` if the month and day are not a valid date.
+        """
+        starts, stops = self._birthday_ranges(month, day, sex)
+        lengths = stops - starts
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+        return EstNINArray._wrap(self._values[positions])
+
+    def count_birthday(self, month, day, sex=None):
+        """
+        Return the number of values with birthday on given month and day in any year.
+        See :meth:`birthday` for the arguments.
+
+        :rtype: :py:func:`int`
+        """
+        starts, stops = self._birthday_ranges(month, day, sex)
+        return int((stops - starts).sum())
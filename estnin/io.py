@@ -0,0 +1,159 @@
+# coding: utf-8
+
+"""
+Bulk loading of EstNIN values from files.
+
+The files are memory-mapped and the digits are parsed straight from the mapped bytes in blocks,
+so the memory used is bound by the size of the result and not by the size of the file.
+"""
+
+import os
+import mmap
+
+from collections import namedtuple
+
+from .vectorized import np, _require_numpy, _parse_digits, _validate_array, FORMAT, VALID
+
+#: Result of :func:`load`: all the records as ``int64`` values, a boolean validity mask and the line
+#: (or record) numbers of the invalid records starting from 1. Records that are not 11 digits are
+#: ``0`` in *values*, records that fail any other check keep their parsed value, so filter *values*
+#: with *mask*.
+Loaded = namedtuple('Loaded', 'values mask invalid_lines')
+
+_BLOCK_SIZE = 1 << 22
+_NEWLINE = ord('\n')
+_CARRIAGE_RETURN = ord('\r')
+
+
+def load(path, record_size=None, offset=0, block_size=_BLOCK_SIZE):
+    """
+    Load and validate EstNIN values from a file with one value per line or with fixed-width records.
+
+    :param path: path to the file.
+    :type path: :py:func:`str` or :class:`os.PathLike`
+
+    :param record_size: size of each record in bytes (including any separator) for fixed-width
+                        files, :py:const:`None` for newline delimited files. Lines may end with
+                        ``\\n`` or ``\\r\\n``.
+    :type record_size: :py:func:`int`
+
+    :param offset: position of the 11 digits within a fixed-width record.
+    :type offset: :py:func:`int`
+
+    :param block_size: number of bytes parsed at once.
+    :type block_size: :py:func:`int`
+
+    :rtype: :class:`Loaded <estnin.io.Loaded>`
+
+    :raises: :py:exc:`ValueError <ValueError>` if the records do not fit 11 digits at *offset* or the
+             file size is not a multiple of *record_size*.
+
+    **Usage:**
+        >>> from estnin import io
+        >>> result = io.load('people.txt')  # doctest: +SKIP
+        >>> result.values[result.mask]  # doctest: +SKIP
+        array([37001011233, 47001011234])
+        >>> result.invalid_lines  # doctest: +SKIP
+        array([2])
+    """
+    _require_numpy()
+
+    if record_size is not None and (record_size < 11 or not 0 <= offset <= record_size - 11):
+        raise ValueError('record does not fit 11 digits at offset {}'.format(offset))
+
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if record_size is not None and size % record_size:
+            raise ValueError('file size is not a multiple of {}'.format(record_size))
+
+        if not size:
+            return _result(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint8))
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = np.frombuffer(mapped, dtype=np.uint8)
+            try:
+                if record_size is None:
+                    values, errors = _load_lines(mapped, data, block_size)
+                else:
+                    values, errors = _load_records(data, record_size, offset, block_size)
+            finally:
+                del data
+
+    return _result(values, errors)
+
+
+def _result(values, errors):
+    mask = errors == VALID
+    return Loaded(values, mask, np.flatnonzero(~mask) + 1)
+
+
+def _load_records(data, record_size, offset, block_size):
+    records = data.reshape(-1, record_size)[:, offset:offset + 11]
+    values = np.empty(len(records), dtype=np.int64)
+    errors = np.empty(len(records), dtype=np.uint8)
+    step = max(block_size // record_size, 1)
+
+    for start in range(0, len(records), step):
+        values[start:start + step], errors[start:start + step] = _parse(records[start:start + step])
+
+    return values, errors
+
+
+def _load_lines(mapped, data, block_size):
+    count = 0
+    for start, stop in _blocks(mapped, block_size):
+        count += np.count_nonzero(data[start:stop] == _NEWLINE)
+    count += data[-1] != _NEWLINE
+
+    values = np.empty(count, dtype=np.int64)
+    errors = np.empty(count, dtype=np.uint8)
+    position = 0
+
+    for start, stop in _blocks(mapped, block_size):
+        block_values, block_errors = _parse_lines(data[start:stop])
+        values[position:position + len(block_values)] = block_values
+        errors[position:position + len(block_values)] = block_errors
+        position += len(block_values)
+
+    return values, errors
+
+
+def _parse_lines(block):
+    """
+    Parse the lines of an ``uint8`` array that ends with a newline or at the end of the file.
+    """
+    ends = np.flatnonzero(block == _NEWLINE)
+    if block[-1] != _NEWLINE:
+        ends = np.append(ends, len(block))
+
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    ends -= (ends > starts) & (block[np.maximum(ends - 1, 0)] == _CARRIAGE_RETURN)
+
+    found = ends - starts == 11
+    values = np.zeros(len(starts), dtype=np.int64)
+    errors = np.full(len(starts), FORMAT, dtype=np.uint8)
+    values[found], errors[found] = _parse(block[starts[found, None] + np.arange(11)])
+    return values, errors
+
+
+def _blocks(mapped, block_size):
+    """
+    Yield ``(start, stop)`` of blocks that end right after a newline or at the end of the file.
+    """
+    size = len(mapped)
+    start = 0
+
+    while start < size:
+        stop = min(start + block_size, size)
+        if stop < size:
+            newline = mapped.rfind(b'\n', start, stop)
+            stop = newline + 1 if newline >= 0 else mapped.find(b'\n', stop) + 1 or size
+        yield start, stop
+        start = stop
+
+
+def _parse(chars):
+    values, invalid = _parse_digits(chars)
+    values[invalid] = 0
+    errors = np.where(invalid, FORMAT, VALID).astype(np.uint8)
+    return values, _validate_array(values, errors)
@@ -0,0 +1,181 @@
+# coding: utf-8
+
+"""
+Dense numbering of all the valid EstNIN values.
+
+Every valid value is mapped to an ordinal in ``[0..COUNT)`` and back. The ordinals keep the numeric
+order of the values: century digit first, then birth date and then sequence.
+"""
+
+from datetime import date
+
+from .core import estnin, _checksum, _day_number, _day_value, _DAY_ZERO
+from .vectorized import np, _require_numpy, _as_int64, _validate_array, _checksum_array, VALID
+
+# first day (counted from 1800-01-01) and number of days of each century
+_CENTURY_START = [date(year, 1, 1).toordinal() - _DAY_ZERO for year in (1800, 1900, 2000, 2100, 2200)]
+_CENTURY_DAYS = [stop - start for start, stop in zip(_CENTURY_START, _CENTURY_START[1:])]
+
+# first ordinal for each century digit, index 0 is unused
+_BLOCK_START = [0, 0]
+for _digit in range(1, 9):
+    _BLOCK_START.append(_BLOCK_START[-1] + _CENTURY_DAYS[(_digit - 1) // 2] * 1000)
+
+#: Number of valid EstNIN values.
+COUNT = _BLOCK_START.pop()
+
+
+def to_ordinal(value):
+    """
+    Return the ordinal of given EstNIN.
+
+    :param value: valid EstNIN
+    :type value: :py:func:`int`, :py:func:`str` or :class:`estnin.estnin <estnin.estnin>`
+
+    :return: ordinal in range ``[0..COUNT)``
+    :rtype: :py:func:`int`
+
+    :raises: :py:exc:`ValueError <ValueError>` if the value is not a valid EstNIN.
+
+    **Usage:**
+        >>> from estnin import estnin, to_ordinal, COUNT
+        >>> to_ordinal(estnin.MIN)
+        0
+        >>> to_ordinal(10001010013)
+        1
+        >>> to_ordinal(estnin.MAX) == COUNT - 1
+        True
+    """
+    value = int(value)
+
+    if not estnin.MIN <= value <= estnin.MAX:
+        raise ValueError('value is out of range')
+
+    if value % 10 != _checksum(value):
+        raise ValueError('invalid checksum')
+
+    number = _day_number(value)
+    if number < 0:
+        raise ValueError('invalid date')
+
+    century = value // 10**10
+    days = number - _CENTURY_START[(century - 1) // 2]
+    return _BLOCK_START[century] + days * 1000 + value // 10 % 1000
+
+
+def from_ordinal(ordinal):
+    """
+    Return the EstNIN for given ordinal.
+
+    :param ordinal: ordinal in range ``[0..COUNT)``
+    :type ordinal: :py:func:`int`
+
+    :rtype: :py:func:`int`
+
+    :raises: :py:exc:`ValueError <ValueError>` if the ordinal is out of range.
+
+    **Usage:**
+        >>> from estnin import from_ordinal
+        >>> from_ordinal(1)
+        10001010013
+    """
+    ordinal = int(ordinal)
+
+    if not 0 <= ordinal < COUNT:
+        raise ValueError('ordinal is out of range')
+
+    century = 8
+    while _BLOCK_START[century] > ordinal:
+        century -= 1
+
+    days, sequence = divmod(ordinal - _BLOCK_START[century], 1000)
+    value = _day_value(_CENTURY_START[(century - 1) // 2] + days, century % 2 == 0) + sequence * 10
+    return value + _checksum(value)
+
+
+_TABLES = None
+
+
+def _tables():
+    global _TABLES
+
+    if _TABLES is None:
+        years = np.arange(1800, 2201)
+        leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+        year_start = np.concatenate(([0], np.cumsum(365 + leap)))
+        month_days = np.array([[0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]] * 2)
+        month_days[1, 2] = 29
+        month_start = np.cumsum(month_days, axis=1) - month_days
+
+        # YYMMDD for every day since 1800-01-01
+        dates = np.arange(np.datetime64('1800-01-01'), np.datetime64('2200-01-01'))
+        months = dates.astype('datetime64[M]')
+        day_table = (
+            (months.astype(np.int64) // 12 + 1970) % 100 * 10**4
+            + (months.astype(np.int64) % 12 + 1) * 100
+            + (dates - months.astype('datetime64[D]')).astype(np.int64) + 1
+        )
+
+        _TABLES = year_start, leap, month_start, np.array(_BLOCK_START + [COUNT]), np.array(_CENTURY_START), day_table
+
+    return _TABLES
+
+
+def to_ordinal_many(values):
+    """
+    Vectorized version of :func:`to_ordinal`.
+
+    :param values: valid EstNINs
+    :type values: :class:`numpy.ndarray` or any sequence of :py:func:`int` or :py:func:`str`
+
+    :rtype: :class:`numpy.ndarray` of ``int64``
+
+    :raises: :py:exc:`ValueError <ValueError>` if any of the values is not a valid EstNIN.
+    """
+    _require_numpy()
+    shape = np.shape(values)
+    values, errors = _as_int64(values)
+    _validate_array(values, errors)
+
+    invalid = np.flatnonzero(errors != VALID)
+    if len(invalid):
+        raise ValueError('invalid value at index {}'.format(invalid[0]))
+
+    return _to_ordinals(values).reshape(shape)
+
+
+def _to_ordinals(values):
+    """
+    Return the ordinals of the valid values in the ``int64`` array *values*.
+    """
+    year_start, leap, month_start, block_start, century_start, _ = _tables()
+    century = values // 10**10
+    year = 100 * ((century - 1) // 2) + values // 10**8 % 100
+    days = year_start[year] + month_start[leap[year].astype(np.int64), values // 10**6 % 100] + values // 10**4 % 100 - 1
+    days -= century_start[(century - 1) // 2]
+    return block_start[century] + days * 1000 + values // 10 % 1000
+
+
+def from_ordinal_many(ordinals):
+    """
+    Vectorized version of :func:`from_ordinal`.
+
+    :param ordinals: ordinals in range ``[0..COUNT)``
+    :type ordinals: :class:`numpy.ndarray` or any sequence of :py:func:`int`
+
+    :rtype: :class:`numpy.ndarray` of ``int64``
+
+    :raises: :py:exc:`ValueError <ValueError>` if any of the ordinals is out of range.
+    """
+    _require_numpy()
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+
+    if ordinals.size and (ordinals.min() < 0 or ordinals.max() >= COUNT):
+        raise ValueError('ordinal is out of range')
+
+    _, _, _, block_start, century_start, day_table = _tables()
+    century = np.searchsorted(block_start, ordinals, side='right') - 1
+    days, sequence = np.divmod(ordinals - block_start[century], 1000)
+
+    values = century * 10**10 + day_table[century_start[(century - 1) // 2] + days] * 10**4 + sequence * 10
+    return values + _checksum_array(values)
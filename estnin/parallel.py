@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+Validation in worker processes over :mod:`multiprocessing.shared_memory`.
+
+The input values and the results live in shared memory blocks that the worker processes attach
+to by name, so only the block names and index ranges are sent to the workers. The input is only
+passed without copying when it was allocated with :func:`empty`, any other input is copied into a
+new block first.
+"""
+
+import os
+import weakref
+import multiprocessing
+
+from multiprocessing import shared_memory
+
+from .vectorized import np, _require_numpy, _as_int64, _validate_array, VALID
+
+# data address -> (block name, block size) for arrays created by :func:`empty`
+_BLOCKS = {}
+
+
+def _allocate(shape, dtype):
+    """
+    Create a new array backed by a shared memory block. The mapping is closed and the block is
+    unlinked, if it was not already, when the array is garbage collected.
+    """
+    dtype = np.dtype(dtype)
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    block = shared_memory.SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    address = array.__array_interface__['data'][0]
+    _BLOCKS[address] = (block.name, size)
+    weakref.finalize(array, _release, address, block)
+    return array, block
+
+
+def _release(address, block):
+    _BLOCKS.pop(address, None)
+    block.close()
+    _unlink(block)
+
+
+def _unlink(block):
+    try:
+        block.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _locate(array):
+    """
+    Return ``(name, offset)`` of the shared memory block the contiguous *array* lives in or
+    :py:const:`None` if it is not in any of the blocks created by this module.
+    """
+    if not array.flags.c_contiguous:
+        return None
+
+    start = array.__array_interface__['data'][0]
+    for address, (name, size) in list(_BLOCKS.items()):
+        if address <= start and start + array.nbytes <= address + size:
+            return name, start - address
+
+    return None
+
+
+def empty(count):
+    """
+    Create an uninitialized ``int64`` array backed by shared memory. Arrays created with this
+    function (and their contiguous slices) are passed to :func:`validate` without copying, any other
+    input is copied. The block stays linked, so that the workers can attach to it, until the array
+    is garbage collected.
+
+    :param count: number of elements.
+    :type count: :py:func:`int`
+
+    :rtype: :class:`numpy.ndarray`
+    """
+    _require_numpy()
+    return _allocate((count,), np.int64)[0]
+
+
+def _validate_range(values_block, values_offset, mask_block, errors_block, count, start, stop):
+    blocks = [shared_memory.SharedMemory(name) for name in (values_block, mask_block, errors_block)]
+    try:
+        values = np.ndarray((count,), dtype=np.int64, buffer=blocks[0].buf, offset=values_offset)
+        mask = np.ndarray((count,), dtype=bool, buffer=blocks[1].buf)
+        errors = np.ndarray((count,), dtype=np.uint8, buffer=blocks[2].buf)
+
+        _validate_array(values[start:stop], errors[start:stop])
+        np.equal(errors[start:stop], VALID, out=mask[start:stop])
+
+        del values, mask, errors
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def validate(values, workers=None, chunks=None):
+    """
+    Validate many values using several processes, with the same rules as
+    :func:`estnin.validate_many <estnin.vectorized.validate_many>`.
+
+    Values that are not already in shared memory (see :func:`empty`) are copied there once. The
+    returned arrays are mapped straight from the shared memory the workers wrote into, the blocks
+    created by this call are unlinked as soon as the workers are done.
+
+    :param values: values to validate.
+    :type values: :class:`numpy.ndarray` or any sequence of :py:func:`int` or :py:func:`str`
+
+    :param workers: number of worker processes, defaults to :py:func:`os.cpu_count`.
+    :type workers: :py:func:`int`
+
+    :param chunks: number of index ranges to split the work into, defaults to ``4 * workers``.
+    :type chunks: :py:func:`int`
+
+    :return: a tuple of boolean validity mask and an ``uint8`` array of error codes.
+    :rtype: :py:func:`tuple` of (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+
+    **Usage:**
+        >>> from estnin import parallel
+        >>> mask, errors = parallel.validate([37001011233, 37001011234], workers=2)
+        >>> mask
+        array([ True, False])
+    """
+    _require_numpy()
+
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers * 4
+
+    shape = np.shape(values)
+    array, errors = _as_int64(values)
+    count = len(array)
+    location = _locate(array)
+
+    created = []
+    if location is None:
+        shared, block = _allocate((count,), np.int64)
+        shared[:] = array
+        array, location = shared, _locate(shared)
+        created.append(block)
+
+    mask, mask_block = _allocate((count,), bool)
+    result, errors_block = _allocate((count,), np.uint8)
+    result[:] = errors
+    created += [mask_block, errors_block]
+
+    bounds = np.linspace(0, count, min(chunks, max(count, 1)) + 1, dtype=np.int64).tolist()
+    tasks = [
+        (location[0], location[1], mask_block.name, errors_block.name, count, start, stop)
+        for start, stop in zip(bounds, bounds[1:]) if start < stop
+    ]
+
+    try:
+        if workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                _validate_range(*task)
+        else:
+            with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+                pool.starmap(_validate_range, tasks)
+    finally:
+        # the workers are done with the names, the mappings stay valid and the memory is freed
+        # when the last one is closed, even if this process dies before collecting the arrays
+        for block in created:
+            _unlink(block)
+
+    return mask.reshape(shape), result.reshape(shape)
@@ -0,0 +1,201 @@
+# coding: utf-8
+
+"""
+Lazy :py:func:`range` like views over intervals of EstNIN values.
+"""
+
+from datetime import date
+
+from .core import estnin, _checksum, _checksum_tables, _DAY_ZERO, _DAY_COUNT
+
+
+def _position(value):
+    """
+    Return the position ``day * 1000 + sequence`` for a date or an EstNIN, where ``day`` is the number
+    of days since 1800-01-01.
+    """
+    if isinstance(value, date):
+        day = value.toordinal() - _DAY_ZERO
+        if not 0 <= day <= _DAY_COUNT:
+            raise ValueError('date not in range [1800-01-01..2200-01-01]')
+        return day * 1000
+
+    value = int(value)
+    century = value // 10**10
+    estnin._validate_century(century)
+    birth_date = date(estnin._calculate_year(century, value // 10**8), value // 10**6 % 100, value // 10**4 % 100)
+    return (birth_date.toordinal() - _DAY_ZERO) * 1000 + value // 10 % 1000
+
+
+def _bound(value):
+    """
+    Return the index of a bound, a date starts with the male value of its first sequence.
+    """
+    if isinstance(value, date):
+        return _position(value) * 2
+
+    value = int(value)
+    return _position(value) * 2 + int(value // 10**10 % 2 == 0)
+
+
+def _prefixes(day):
+    """
+    Return ``(value without sequence and checksum, partial checksum sum)`` for both sexes on given day.
+    """
+    birth_date = date.fromordinal(_DAY_ZERO + day)
+    century = (birth_date.year - 1800) // 100 * 2 + 1
+    prefix_sums, middle_sums, _, _ = _checksum_tables()
+    prefixes = []
+
+    for sex in (estnin.MALE, estnin.FEMALE):
+        prefix = (century + sex) * 10**6 + birth_date.year % 100 * 10**4 + birth_date.month * 100 + birth_date.day
+        prefixes.append((prefix * 10**4, prefix_sums[prefix // 1000] + middle_sums[prefix % 1000]))
+
+    return prefixes
+
+
+class span(object):
+    """
+    Provides an immutable sequence of EstNIN values between two birth dates or EstNINs that behaves
+    like :py:func:`range`.
+
+    The values are ordered by birth date, then by sequence and then by sex when both sexes are included.
+    Length, indexing, slicing and containment are computed in constant time and the values are
+    created only while iterating.
+    """
+
+    def __init__(self, start, stop, sex=None):
+        """
+        Create a new view from *start* (inclusive) to *stop* (exclusive). A date bound is the first
+        value of that day, an EstNIN bound is the value itself, so its sex is taken into account.
+
+        :param start: first birth date or EstNIN in the view.
+        :type start: :py:func:`datetime.date`, :py:func:`int`, :py:func:`str` or :class:`estnin.estnin <estnin.estnin>`
+
+        :param stop: birth date or EstNIN where the view ends.
+        :type stop: :py:func:`datetime.date`, :py:func:`int`, :py:func:`str` or :class:`estnin.estnin <estnin.estnin>`
+
+        :param sex: :class:`estnin.MALE <estnin.estnin.MALE>`, :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+                    or :py:const:`None` for both.
+
+        :raises: :py:exc:`ValueError <ValueError>` if start or stop is not valid.
+
+        **Usage:**
+            >>> from estnin import estnin, span
+            >>> from datetime import date
+            >>> people = span(date(1970, 1, 1), date(1971, 1, 1), sex=estnin.FEMALE)
+            >>> len(people)
+            365000
+            >>> people[0], people[-1]
+            (47001010008, 47012319994)
+            >>> 47006151234 in people
+            False
+            >>> list(people[1000:3000:1000])
+            [47001020004, 47001030000]
+        """
+        start, stop = _bound(start), _bound(stop)
+
+        if sex is None:
+            self._range = range(start, stop)
+        else:
+            # the first index of the sex at or after start
+            self._range = range(start + (int(bool(sex)) - start) % 2, stop, 2)
+
+    @classmethod
+    def _wrap(cls, indices):
+        instance = cls.__new__(cls)
+        instance._range = indices
+        return instance
+
+    def __repr__(self):
+        if not self._range:
+            return 'span([])'
+        return 'span([{}, ..., {}], len={})'.format(self[0], self[-1], len(self))
+
+    def __len__(self):
+        return len(self._range)
+
+    def __bool__(self):
+        return bool(self._range)
+
+    def __eq__(self, other):
+        if not isinstance(other, span):
+            return NotImplemented
+        return self._range == other._range
+
+    def __hash__(self):
+        return hash(self._range)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._wrap(self._range[key])
+
+        return self._value(self._range[key])
+
+    def __iter__(self):
+        return self._values(self._range)
+
+    def __reversed__(self):
+        return self._values(reversed(self._range))
+
+    def __contains__(self, value):
+        return self._index(value) is not None
+
+    def _index(self, value):
+        try:
+            value = int(value)
+            index = _bound(value)
+        except (TypeError, ValueError):
+            return None
+
+        if value % 10 != _checksum(value) or index not in self._range:
+            return None
+
+        return index
+
+    def index(self, value):
+        """
+        Return the index of given value.
+
+        :raises: :py:exc:`ValueError <ValueError>` if the value is not present.
+        """
+        index = self._index(value)
+        if index is None:
+            raise ValueError('{} is not in span'.format(value))
+
+        return self._range.index(index)
+
+    def count(self, value):
+        """
+        Return the number of occurrences of given value, ``0`` or ``1``.
+        """
+        return int(value in self)
+
+    @staticmethod
+    def _value(index):
+        position, female = divmod(index, 2)
+        day, sequence = divmod(position, 1000)
+
+        if not 0 <= day < _DAY_COUNT:
+            raise ValueError('date not in range [1800-01-01..2199-12-31]')
+
+        base, partial = _prefixes(day)[female]
+        _, _, sequences, final = _checksum_tables()
+        return base + sequence * 10 + final[partial + sequences[sequence]]
+
+    @staticmethod
+    def _values(indices):
+        _, _, sequences, final = _checksum_tables()
+        day = None
+        for index in indices:
+            position, female = divmod(index, 2)
+            current, sequence = divmod(position, 1000)
+
+            if current != day:
+                if not 0 <= current < _DAY_COUNT:
+                    raise ValueError('date not in range [1800-01-01..2199-12-31]')
+                day = current
+                prefixes = _prefixes(day)
+
+            base, partial = prefixes[female]
+            yield base + sequence * 10 + final[partial + sequences[sequence]]
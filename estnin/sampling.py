@@ -0,0 +1,165 @@
+# coding: utf-8
+
+"""
+Uniform random sampling of valid EstNIN values.
+"""
+
+import math
+
+from datetime import date
+
+from .core import estnin
+from .ordinal import _DAY_ZERO, _CENTURY_START, _BLOCK_START, from_ordinal_many
+from .vectorized import np, _require_numpy
+
+_CHUNK_SIZE = 1 << 22
+_SELECT_SIZE = 1 << 20
+
+
+def _intervals(sex, born_between):
+    """
+    Return the ordinal intervals ``[(start, stop), ...]`` of the values matching given sex and birth dates.
+    """
+    first, last = born_between
+    if first > last:
+        raise ValueError('born_between must be ordered')
+
+    estnin._validate_year(first.year)
+    estnin._validate_year(last.year)
+    first, last = first.toordinal() - _DAY_ZERO, last.toordinal() - _DAY_ZERO + 1
+
+    intervals = []
+    for century in range(1, 9):
+        if sex is not None and (century % 2 == 0) != bool(sex):
+            continue
+
+        index = (century - 1) // 2
+        start, stop = max(first, _CENTURY_START[index]), min(last, _CENTURY_START[index + 1])
+        if start < stop:
+            offset = _BLOCK_START[century] - _CENTURY_START[index] * 1000
+            intervals.append((offset + start * 1000, offset + stop * 1000))
+
+    return intervals
+
+
+def random(n, sex=None, born_between=(date(1800, 1, 1), date(2199, 12, 31)), seed=None, replace=True):
+    """
+    Draw *n* valid EstNIN values uniformly at random.
+
+    :param n: number of values to draw.
+    :type n: :py:func:`int`
+
+    :param sex: :class:`estnin.MALE <estnin.estnin.MALE>`, :class:`estnin.FEMALE <estnin.estnin.FEMALE>`
+                or :py:const:`None` for both.
+
+    :param born_between: first and last (inclusive) date of birth.
+    :type born_between: :py:func:`tuple` of :py:func:`datetime.date`
+
+    :param seed: seed or generator for :func:`numpy.random.default_rng`, the same seed gives the same values.
+    :type seed: :py:func:`int` or :class:`numpy.random.Generator`
+
+    :param replace: if set to :py:const:`False` then all the values are unique.
+    :type replace: :py:const:`bool`
+
+    :rtype: :class:`numpy.ndarray` of ``int64``
+
+    :raises: :py:exc:`ValueError <ValueError>` if the arguments are invalid or there are fewer than
+             *n* values to draw from without replacement.
+
+    **Usage:**
+        >>> from estnin import estnin, random
+        >>> from datetime import date
+        >>> people = random(3, sex=estnin.FEMALE, born_between=(date(1990, 1, 1), date(1990, 12, 31)), seed=1)
+        >>> len(set(people.tolist())), bool((people // 10**8 == 490).all())
+        (3, True)
+    """
+    _require_numpy()
+
+    n = int(n)
+    if n < 0:
+        raise ValueError('n must not be negative')
+
+    intervals = np.array(_intervals(sex, born_between), dtype=np.int64).reshape(-1, 2)
+    lengths = intervals[:, 1] - intervals[:, 0]
+    ends = np.cumsum(lengths)
+    total = int(ends[-1]) if len(ends) else 0
+
+    if n and not total:
+        raise ValueError('no values to draw from')
+
+    rng = np.random.default_rng(seed)
+
+    if not replace:
+        if n > total:
+            raise ValueError('cannot draw {} unique values from {}'.format(n, total))
+        positions = _unique(rng, total, n)
+
+    result = np.empty(n, dtype=np.int64)
+    for start in range(0, n, _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, n)
+        chunk = rng.integers(0, total, stop - start) if replace else positions[start:stop]
+        index = np.searchsorted(ends, chunk, side='right')
+        result[start:stop] = from_ordinal_many(intervals[index, 0] + chunk - (ends[index] - lengths[index]))
+
+    return result
+
+
+def _unique(rng, total, n):
+    """
+    Draw *n* unique integers from ``[0..total)`` in random order.
+    """
+    if n * 4 > total:
+        return _select(rng, total, n)
+
+    chosen = np.empty(0, dtype=np.int64)
+
+    while len(chosen) < n:
+        # m draws from the values not chosen yet give about ``left * (1 - exp(-m / total))``
+        # new ones, draw enough for the missing ones with a small margin
+        missing, left = n - len(chosen), total - len(chosen)
+        draws = int(-total * math.log1p(-missing / left) * 1.01) + 16
+        chosen = np.concatenate((chosen, rng.integers(0, total, draws)))
+        chosen.sort()
+        chosen = chosen[np.concatenate(([True], chosen[1:] != chosen[:-1]))]
+
+    return chosen[rng.permutation(len(chosen))[:n]]
+
+
+def _split(rng, total, n):
+    """
+    Yield ``(start, stop, count)`` for the chunks of ``[0..total)`` that *n* unique integers drawn
+    uniformly from it fall into, in increasing order.
+    """
+    stack = [(0, total, n)]
+
+    while stack:
+        start, stop, count = stack.pop()
+        if not count:
+            continue
+
+        if stop - start <= _SELECT_SIZE:
+            yield start, stop, count
+            continue
+
+        # the number of draws in the lower half is hypergeometric, both halves stay under the
+        # 10**9 limit of numpy for the whole ordinal range
+        middle = (start + stop) // 2
+        lower = int(rng.hypergeometric(middle - start, stop - middle, count))
+        stack.append((middle, stop, count - lower))
+        stack.append((start, middle, lower))
+
+
+def _select(rng, total, n):
+    """
+    Draw *n* unique integers from ``[0..total)`` in random order, with memory for the result and
+    one chunk of the range, no matter how large *total* is.
+    """
+    chosen = np.empty(n, dtype=np.int64)
+    filled = 0
+
+    for start, stop, count in _split(rng, total, n):
+        chosen[filled:filled + count] = rng.choice(stop - start, count, replace=False) + start
+        filled += count
+
+    rng.shuffle(chosen)
+    return chosen
@@ -0,0 +1,192 @@
+# coding: utf-8
+
+"""
+Finding and masking EstNIN values embedded in free text.
+
+The text is read in chunks, so memory use is bound by the chunk size and not by the size of the
+stream. Candidates are runs of exactly 11 digits on word boundaries (as ``\\b`` in :py:mod:`re`:
+Unicode for text, ASCII for bytes) and only the runs with a valid century, date and checksum are
+reported.
+"""
+
+from collections import namedtuple
+from functools import partial
+
+from .core import estnin, _checksum, _is_valid_date
+
+#: A value found by :func:`scan`, *start* and *end* are character (or byte) offsets in the stream.
+Match = namedtuple('Match', 'start end value')
+
+_CHUNK_SIZE = 1 << 20
+
+# all digits are translated to "0", so that the digit runs can be found with :py:meth:`bytes.find`
+# which is much faster than searching for a character class with :py:mod:`re`
+_DIGITS = bytes.maketrans(b'0123456789', b'0' * 10)
+_RUN = b'0' * 11
+_WORD = bytes(int(chr(byte).isalnum() or byte == ord('_')) if byte < 128 else 0 for byte in range(256))
+
+
+def scan(stream, chunk_size=_CHUNK_SIZE):
+    """
+    Find the valid EstNIN values in a text or binary stream.
+
+    :param stream: file object opened in text or binary mode, :py:func:`str`, :py:func:`bytes` or an
+                   iterable of :py:func:`str` or :py:func:`bytes` chunks.
+
+    :param chunk_size: number of characters (or bytes) read from a file object at once.
+    :type chunk_size: :py:func:`int`
+
+    :return: generator of matches in the order of appearance.
+    :rtype: :class:`Match <estnin.text.Match>`
+
+    **Usage:**
+        >>> from estnin import scan
+        >>> list(scan('isikukood 37001011233, tel 37001011234, arve nr 370010112331'))
+        [Match(start=10, end=21, value=37001011233)]
+    """
+    for buffer, offset, first, stop in _buffers(stream, chunk_size):
+        for start, value in _find(buffer, first, stop):
+            yield Match(offset + start, offset + start + 11, value)
+
+
+def redact(stream, mask='*', chunk_size=_CHUNK_SIZE):
+    """
+    Mask the valid EstNIN values in a text or binary stream.
+
+    :param stream: file object opened in text or binary mode, :py:func:`str`, :py:func:`bytes` or an
+                   iterable of :py:func:`str` or :py:func:`bytes` chunks.
+
+    :param mask: single character repeated for every digit, replacement string or a function that
+                 returns the replacement for given value as :py:func:`int`.
+    :type mask: :py:func:`str` or :py:func:`callable`
+
+    :param chunk_size: number of characters (or bytes) read from a file object at once.
+    :type chunk_size: :py:func:`int`
+
+    :return: generator of chunks of the rewritten stream, of the same type as the input.
+    :rtype: :py:func:`str` or :py:func:`bytes`
+
+    **Usage:**
+        >>> from estnin import redact
+        >>> ''.join(redact('isikukood 37001011233'))
+        'isikukood ***********'
+        >>> ''.join(redact('isikukood 37001011233', mask=lambda value: '{}******'.format(value // 10**6)))
+        'isikukood 37001******'
+    """
+    if not callable(mask):
+        mask = partial(_constant, mask * 11 if len(mask) == 1 else mask)
+
+    written = 0
+    for buffer, offset, first, stop in _buffers(stream, chunk_size):
+        binary = isinstance(buffer, bytes)
+
+        for start, value in _find(buffer, first, stop):
+            replacement = mask(value)
+            yield buffer[written - offset:start]
+            yield replacement.encode('utf-8') if binary else replacement
+            written = offset + start + 11
+
+        if written < offset + stop:
+            yield buffer[written - offset:stop]
+            written = offset + stop
+
+
+def _constant(replacement, value):
+    return replacement
+
+
+def _chunks(stream, chunk_size):
+    if isinstance(stream, (str, bytes)):
+        return [stream]
+
+    if hasattr(stream, 'read'):
+        return iter(partial(stream.read, chunk_size), stream.read(0))
+
+    return stream
+
+
+def _buffers(stream, chunk_size):
+    """
+    Yield ``(buffer, offset, first, stop)`` where *offset* is the position of the buffer in the stream
+    and the matches starting within ``[first..stop)`` belong to the buffer. The buffers overlap by one
+    character before *first*, to check the word boundary, and 11 characters after *stop*, that are
+    needed to decide about a match starting before *stop*.
+    """
+    pending = None
+    offset = first = 0
+
+    for chunk in _chunks(stream, chunk_size):
+        pending = chunk if pending is None else pending + chunk
+        if len(pending) <= 12:
+            continue
+
+        stop = len(pending) - 11
+        yield pending, offset, first, stop
+
+        offset += stop - 1
+        pending = pending[stop - 1:]
+        first = 1
+
+    if pending:
+        yield pending, offset, first, len(pending)
+
+
+def _find(buffer, first, stop):
+    """
+    Yield ``(start, value)`` of the valid values starting within ``[first..stop)`` of the buffer.
+    """
+    binary = isinstance(buffer, bytes)
+    ascii = binary or buffer.isascii()
+    data = buffer if binary else buffer.encode('ascii' if ascii else 'utf-8')
+    digits = data.translate(_DIGITS)
+    size = len(digits)
+    position = characters = 0
+    start = digits.find(_RUN)
+
+    while start >= 0:
+        end = start + 11
+        if (start and _WORD[digits[start - 1]]) or (end < size and _WORD[digits[end]]):
+            start = digits.find(_RUN, end)
+            continue
+
+        found = start
+        if not ascii:
+            # only ASCII word characters are known from the bytes, so convert the offset and check
+            # the neighbouring characters again
+            characters += len(data[position:start].decode('utf-8'))
+            position, found = start, characters
+            if _is_word(buffer, found - 1) or _is_word(buffer, found + 11):
+                start = digits.find(_RUN, end)
+                continue
+
+        if found >= stop:
+            break
+
+        if found >= first:
+            value = int(buffer[found:found + 11])
+            if _is_valid(value):
+                yield found, value
+
+        start = digits.find(_RUN, end)
+
+
+def _is_word(buffer, index):
+    if not 0 <= index < len(buffer):
+        return False
+
+    character = buffer[index]
+    return character.isalnum() or character == '_'
+
+
+def _is_valid(value):
+    century = value // 10**10
+    month, day = value // 10**6 % 100, value // 10**4 % 100
+
+    # cheap checks first, most of the digit runs are not EstNINs
+    if not (1 <= century <= 8 and 1 <= month <= 12 and 1 <= day <= 31):
+        return False
+
+    if not _is_valid_date(estnin._calculate_year(century, value // 10**8), month, day):
+        return False
+
+    return value % 10 == _checksum(value)
@@ -0,0 +1,228 @@
+# coding: utf-8
+
+"""
+Processing of EstNIN files that do not fit in memory.
+"""
+
+import os
+import tempfile
+
+from collections import namedtuple
+from timeit import default_timer as timer
+
+from .io import _parse_lines
+from .ordinal import _to_ordinals, from_ordinal_many
+from .vectorized import np, _require_numpy, VALID
+
+_RECORD = np.dtype('<u4') if np is not None else None
+_FAN_IN = 64
+_MIN_BLOCK = 1 << 12
+_WRITE_BLOCK = 1 << 16
+_POWERS = np.array([10**power for power in range(10, -1, -1)], dtype=np.int64) if np is not None else None
+
+
+class Deduplicated(namedtuple('Deduplicated', 'rows written duplicates invalid runs seconds')):
+    """
+    Result of :func:`dedup`: the number of rows read, unique values written, duplicate rows and
+    invalid rows, the number of sorted runs spilled to temporary files and the time taken.
+    """
+
+    __slots__ = ()
+
+    @property
+    def rows_per_second(self):
+        """
+        Returns the number of input rows processed per second.
+
+        :rtype: :py:func:`float`
+        """
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _read(path, block_size):
+    """
+    Yield ``(values, errors)`` for blocks of lines of a file.
+    """
+    with open(path, 'rb') as file:
+        rest = b''
+
+        while True:
+            data = file.read(block_size)
+            if not data:
+                break
+
+            data = rest + data
+            end = data.rfind(b'\n') + 1
+            rest = data[end:]
+
+            if end:
+                yield _parse_lines(np.frombuffer(data, dtype=np.uint8, count=end))
+
+        if rest:
+            yield _parse_lines(np.frombuffer(rest, dtype=np.uint8))
+
+
+def _write(file, ordinals):
+    # one value per line, the same format as the input, in chunks to bound the temporary arrays
+    for first in range(0, len(ordinals), _WRITE_BLOCK):
+        values = from_ordinal_many(ordinals[first:first + _WRITE_BLOCK].astype(np.int64))
+        lines = np.empty((len(values), 12), dtype=np.uint8)
+        lines[:, :11] = values[:, None] // _POWERS % 10 + ord('0')
+        lines[:, 11] = ord('\n')
+        file.write(lines.tobytes())
+
+
+def _unique(ordinals):
+    """
+    Return the unique values of a sorted array.
+    """
+    if not len(ordinals):
+        return ordinals
+    keep = np.empty(len(ordinals), dtype=bool)
+    keep[0] = True
+    np.not_equal(ordinals[1:], ordinals[:-1], out=keep[1:])
+    return ordinals[keep]
+
+
+def _spill(ordinals, directory, runs):
+    path = os.path.join(directory, 'run{}'.format(len(runs)))
+    ordinals.sort()
+    _unique(ordinals).astype(_RECORD, copy=False).tofile(path)
+    runs.append(path)
+
+
+def _merge(paths, block_size, write):
+    """
+    Merge sorted runs of unique ordinals, calling *write* with blocks of sorted unique ordinals.
+    """
+    files = [open(path, 'rb') for path in paths]
+
+    try:
+        buffers = [np.fromfile(file, dtype=_RECORD, count=block_size) for file in files]
+
+        while True:
+            active = [index for index, buffer in enumerate(buffers) if len(buffer)]
+            if not active:
+                return
+
+            # every value up to the smallest last value of the buffers is already read from all runs
+            bound = min(buffers[index][-1] for index in active)
+            parts = []
+
+            for index in active:
+                buffer = buffers[index]
+                cut = np.searchsorted(buffer, bound, side='right')
+                parts.append(buffer[:cut])
+                buffers[index] = buffer[cut:]
+
+                if not len(buffers[index]):
+                    buffers[index] = np.fromfile(files[index], dtype=_RECORD, count=block_size)
+
+            # the parts are sorted, which a stable sort merges in linear time
+            write(_unique(np.sort(np.concatenate(parts), kind='stable')))
+    finally:
+        for file in files:
+            file.close()
+
+
+def dedup(input_paths, output_path, memory_limit=1 << 28, temporary_directory=None):
+    """
+    Write the unique valid values of one or more files to a file in sorted order.
+
+    The input is validated while it is read, the valid values are collected into sorted runs of
+    packed ordinals that are spilled to temporary files when the memory limit is reached, and the
+    runs are merged dropping the duplicates. Invalid rows (including empty lines) are counted and
+    left out.
+
+    :param input_paths: files with one value per line.
+    :type input_paths: :py:func:`str`, :class:`os.PathLike` or a list of those
+
+    :param output_path: file to write the values to, one per line.
+    :type output_path: :py:func:`str` or :class:`os.PathLike`
+
+    :param memory_limit: approximate number of bytes to use for the values held in memory.
+    :type memory_limit: :py:func:`int`
+
+    :param temporary_directory: directory for the sorted runs, the default temporary directory
+                                is used if not given.
+    :type temporary_directory: :py:func:`str` or :class:`os.PathLike`
+
+    :rtype: :class:`Deduplicated`
+
+    **Usage:**
+        >>> from estnin import tools
+        >>> tools.dedup(['registry-a.txt', 'registry-b.txt'], 'people.txt', memory_limit=2**30)  # doctest: +SKIP
+        Deduplicated(rows=10000000, written=7520331, duplicates=2479669, invalid=0, runs=0, seconds=4.81)
+    """
+    _require_numpy()
+    start = timer()
+
+    if isinstance(input_paths, (str, bytes, os.PathLike)):
+        input_paths = [input_paths]
+
+    # a run is sorted in place, an ordinal takes 4 bytes and dropping the duplicates takes about
+    # as much again; a line read takes 12 bytes and parsing it about 20 times more
+    capacity = max(memory_limit // 10, _MIN_BLOCK)
+    block_size = max(min(memory_limit // 256, 1 << 20), _MIN_BLOCK)
+
+    rows = invalid = valid = written = 0
+    buffer = np.empty(capacity, dtype=np.uint32)
+    filled = 0
+    runs = []
+
+    with tempfile.TemporaryDirectory(dir=temporary_directory) as directory:
+        for path in input_paths:
+            for values, errors in _read(path, block_size):
+                mask = errors == VALID
+                ordinals = _to_ordinals(values[mask])
+                rows += len(values)
+                valid += len(ordinals)
+                invalid += len(values) - len(ordinals)
+
+                while len(ordinals):
+                    taken = min(capacity - filled, len(ordinals))
+                    buffer[filled:filled + taken] = ordinals[:taken]
+                    ordinals = ordinals[taken:]
+                    filled += taken
+
+                    if filled == capacity:
+                        _spill(buffer, directory, runs)
+                        filled = 0
+
+        if runs and filled:
+            _spill(buffer[:filled], directory, runs)
+
+        runs_spilled = len(runs)
+        if runs:
+            # free the buffer for merging
+            buffer = None
+
+        # the merged parts are copied about four times
+        merge_size = max(memory_limit // (16 * _FAN_IN), _MIN_BLOCK)
+
+        # merge the runs in rounds if there are too many to keep open at once
+        while len(runs) > _FAN_IN:
+            merged = []
+            for first in range(0, len(runs), _FAN_IN):
+                merged.append(os.path.join(directory, 'merged{}-{}'.format(len(runs), first)))
+                with open(merged[-1], 'wb') as file:
+                    _merge(runs[first:first + _FAN_IN], merge_size, lambda ordinals: ordinals.astype(_RECORD).tofile(file))
+
+            for path in runs:
+                os.remove(path)
+            runs = merged
+
+        with open(output_path, 'wb') as output:
+            def write(ordinals):
+                nonlocal written
+                written += len(ordinals)
+                _write(output, ordinals)
+
+            if runs:
+                _merge(runs, max(memory_limit // (16 * len(runs)), _MIN_BLOCK), write)
+            else:
+                buffer = buffer[:filled]
+                buffer.sort()
+                write(_unique(buffer))
+
+    return Deduplicated(rows, written, valid - written, invalid, runs_spilled, timer() - start)
@@ -0,0 +1,151 @@
+# coding: utf-8
+
+"""
+Validation of single values without exceptions.
+
+Constructing :class:`estnin.estnin <estnin.estnin>` raises :py:exc:`ValueError` for invalid
+values, which is costly when a large share of the input is invalid and does not tell the reasons
+apart without matching the message. :func:`is_valid` and :func:`try_parse` never raise and report
+the reason as a :class:`Reason`.
+"""
+
+from enum import IntEnum
+from collections import namedtuple
+
+from .core import estnin, _checksum, _is_valid_date
+
+
+class Reason(IntEnum):
+    """
+    Reason why a value is not a valid EstNIN. The values are the same as the error codes of
+    :func:`estnin.validate_many <estnin.validate_many>`.
+    """
+
+    #: The value is valid.
+    VALID = 0
+    #: The value is not in range ``[estnin.MIN..estnin.MAX]``.
+    RANGE = 1
+    #: The century digit is not in range ``[1..8]``.
+    CENTURY = 2
+    #: The value does not represent a valid date.
+    DATE = 3
+    #: The checksum digit is invalid.
+    CHECKSUM = 4
+    #: The value is not an integer or a string of exactly 11 digits.
+    FORMAT = 5
+
+
+class Parsed(namedtuple('Parsed', 'value reason')):
+    """
+    Result of :func:`try_parse`: the parsed :class:`estnin.estnin <estnin.estnin>` (or
+    :py:const:`None` if the value is invalid) and the :class:`Reason`. Evaluates to
+    :py:const:`True` only for a valid value.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return self.reason is Reason.VALID
+
+    @property
+    def valid(self):
+        """
+        Returns :py:const:`True` if the value is valid.
+
+        :rtype: :py:const:`bool`
+        """
+        return self.reason is Reason.VALID
+
+
+_VALID, _RANGE, _CENTURY, _DATE, _CHECKSUM, _FORMAT = Reason
+
+
+def _as_int(value):
+    # returns None for values that can not be interpreted as a number
+    if type(value) is int:
+        return value
+
+    if isinstance(value, (str, bytes)):
+        if len(value) == 11 and value.isdigit() and value.isascii():
+            return int(value)
+        return None
+
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _reason(value):
+    # checks in the same order as the vectorized validation, so the reasons are the same
+    if not 0 <= value < 10**11:
+        return _RANGE
+
+    century = value // 10**10
+    if not 1 <= century <= 8:
+        return _CENTURY
+
+    if not estnin.MIN <= value <= estnin.MAX:
+        return _RANGE
+
+    year = 1800 + 100 * ((century - 1) // 2) + value // 10**8 % 100
+    if not _is_valid_date(year, value // 10**6 % 100, value // 10**4 % 100):
+        return _DATE
+
+    if value % 10 != _checksum(value):
+        return _CHECKSUM
+
+    return _VALID
+
+
+def is_valid(value):
+    """
+    Check if given value is a valid EstNIN without raising an exception.
+
+    :param value: value to check, strings must be made up of exactly 11 digits.
+    :type value: :py:func:`int`, :py:func:`str` or any object convertible with :py:func:`int`
+
+    :rtype: :py:const:`bool`
+
+    **Usage:**
+        >>> from estnin import is_valid
+        >>> is_valid(37001011233), is_valid('37001011234'), is_valid(None)
+        (True, False, False)
+    """
+    value = _as_int(value)
+    return value is not None and _reason(value) is _VALID
+
+
+def try_parse(value):
+    """
+    Parse given value without raising an exception.
+
+    :param value: value to parse, strings must be made up of exactly 11 digits.
+    :type value: :py:func:`int`, :py:func:`str` or any object convertible with :py:func:`int`
+
+    :return: the :class:`estnin.estnin <estnin.estnin>` (:py:const:`None` if the value is invalid)
+             and the :class:`Reason`.
+    :rtype: :class:`Parsed`
+
+    **Usage:**
+        >>> from estnin import try_parse, Reason
+        >>> try_parse('37001011233')
+        Parsed(value=37001011233, reason=<Reason.VALID: 0>)
+        >>> result = try_parse(37013011233)
+        >>> bool(result), result.reason
+        (False, <Reason.DATE: 3>)
+        >>> try_parse('3700101123x').reason is Reason.FORMAT
+        True
+    """
+    number = _as_int(value)
+    if number is None:
+        return Parsed(None, _FORMAT)
+
+    reason = _reason(number)
+    if reason is not _VALID:
+        return Parsed(None, reason)
+
+    # the value is already validated, so it is stored as a lazily decoded instance
+    parsed = estnin.__new__(estnin)
+    parsed._value = number
+    return Parsed(parsed, _VALID)
@@ -0,0 +1,174 @@
+# coding: utf-8
+
+"""
+Array based counterparts of the validation rules in :class:`estnin.estnin <estnin.estnin>`.
+
+All functions in this module require `NumPy <https://numpy.org/>`_ which can be
+installed together with the package using the ``numpy`` extra::
+
+    pip install estnin[numpy]
+"""
+
+from . import core
+from .core import estnin
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+#: Error code for a valid value.
+VALID = 0
+#: Error code for a value that is not in range ``[estnin.MIN..estnin.MAX]``.
+RANGE = 1
+#: Error code for a value with the century digit not in range ``[1..8]``.
+CENTURY = 2
+#: Error code for a value that does not represent a valid date.
+DATE = 3
+#: Error code for a value with an invalid checksum.
+CHECKSUM = 4
+#: Error code for a string that is not made up of exactly 11 digits.
+FORMAT = 5
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('numpy is required for vectorized operations, install it with "pip install estnin[numpy]"')
+
+
+def _as_int64(values):
+    """
+    Convert *values* to a flat :class:`numpy.ndarray` of ``int64`` and an array of error codes where
+    the elements that could not be converted are marked with :data:`FORMAT`.
+    """
+    array = np.asarray(values)
+
+    if not array.size:
+        array = array.astype(np.int64)
+
+    if array.dtype.kind == 'O':
+        try:
+            array = array.astype(np.int64)
+        except (TypeError, ValueError, OverflowError):
+            array = array.astype(np.str_)
+
+    array = array.reshape(-1)
+
+    if array.dtype.kind in 'iu':
+        return array.astype(np.int64, copy=False), np.zeros(array.shape, dtype=np.uint8)
+
+    if array.dtype.kind in 'SU':
+        return _parse_strings(array)
+
+    raise TypeError('unsupported array type: {}'.format(array.dtype))
+
+
+def _parse_strings(array):
+    count = array.shape[0]
+    width = array.dtype.itemsize // (4 if array.dtype.kind == 'U' else 1)
+
+    if width < 11:
+        return np.zeros(count, dtype=np.int64), np.full(count, FORMAT, dtype=np.uint8)
+
+    chars = array.view(np.uint32 if array.dtype.kind == 'U' else np.uint8).reshape(count, width)
+    values, invalid = _parse_digits(chars)
+
+    if width > 11:
+        invalid |= chars[:, 11:].any(axis=1)
+
+    values[invalid] = 0
+    return values, np.where(invalid, FORMAT, VALID).astype(np.uint8)
+
+
+def _parse_digits(chars):
+    """
+    Parse the first 11 character codes of each row in the 2D array *chars* as a number. Returns the
+    values and a boolean array marking the rows that contain other characters than digits.
+    """
+    values = np.zeros(len(chars), dtype=np.int64)
+    invalid = np.zeros(len(chars), dtype=bool)
+
+    for i in range(11):
+        digit = chars[:, i].astype(np.int64) - ord('0')
+        invalid |= (digit < 0) | (digit > 9)
+        values = values * 10 + digit
+
+    return values, invalid
+
+
+_CHECKSUM_TABLES = None
+
+
+def _checksum_tables():
+    global _CHECKSUM_TABLES
+
+    if _CHECKSUM_TABLES is None:
+        _CHECKSUM_TABLES = tuple(np.asarray(table, dtype=np.int16) for table in core._checksum_tables())
+
+    return _CHECKSUM_TABLES
+
+
+def _checksum_array(values):
+    """
+    Calculate the checksum digits for the first 10 digits of each value in *values*.
+    """
+    prefix, middle, sequence, final = _checksum_tables()
+    body = np.clip(values, 0, 10**11 - 1) // 10
+    return final[prefix[body // 10**6] + middle[body // 1000 % 1000] + sequence[body % 1000]]
+
+
+def _valid_date_array(century, year, month, day):
+    year = 1800 + 100 * ((century - 1) // 2) + year
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid_month = (month >= 1) & (month <= 12)
+    max_day = np.asarray(core._DAYS_IN_MONTH, dtype=np.int64)[np.where(valid_month, month, 0)]
+    max_day += leap & (month == 2)
+    return valid_month & (day >= 1) & (day <= max_day)
+
+
+def _validate_array(values, errors):
+    """
+    Fill *errors* with error codes for each element in the ``int64`` array *values*. Elements that
+    already have an error code set are left as they are.
+    """
+    century = values // 10**10
+
+    codes = np.where(_checksum_array(values) != values % 10, CHECKSUM, VALID).astype(np.uint8)
+    valid_date = _valid_date_array(century, values // 10**8 % 100, values // 10**6 % 100, values // 10**4 % 100)
+    codes[~valid_date] = DATE
+    codes[(values < estnin.MIN) | (values > estnin.MAX)] = RANGE
+    codes[(century < 1) | (century > 8)] = CENTURY
+    codes[(values < 0) | (values >= 10**11)] = RANGE
+
+    np.copyto(errors, codes, where=errors == VALID)
+    return errors
+
+
+def validate_many(values):
+    """
+    Validate many values at once using the same rules as :class:`estnin.estnin <estnin.estnin>`.
+
+    :param values: values to validate.
+    :type values: :class:`numpy.ndarray` of integers or 11 character strings, or any sequence or buffer of those
+
+    :return: a tuple of boolean validity mask and an ``uint8`` array of error codes, both shaped as the input.
+             The error codes are :data:`VALID`, :data:`RANGE`, :data:`CENTURY`, :data:`DATE`,
+             :data:`CHECKSUM` and :data:`FORMAT`.
+    :rtype: :py:func:`tuple` of (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+
+    :raises: :py:exc:`ImportError <ImportError>` if NumPy is not installed.
+    :raises: :py:exc:`TypeError <TypeError>` if the values can not be interpreted as integers or strings.
+
+    **Usage:**
+        >>> from estnin import validate_many
+        >>> mask, errors = validate_many([37001011233, 37001011234, 37013011233])
+        >>> mask
+        array([ True, False, False])
+        >>> errors
+        array([0, 4, 3], dtype=uint8)
+    """
+    _require_numpy()
+    shape = np.shape(values)
+    values, errors = _as_int64(values)
+    _validate_array(values, errors)
+    return (errors == VALID).reshape(shape), errors.reshape(shape)
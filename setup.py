@@ -39,13 +39,15 @@ test_deps = [
 
 extras = {
     'test': test_deps,
+    'numpy': ['numpy'],
+    'pandas': ['numpy', 'pandas'],
 }
 
 setup(
     name                    = 'estnin',
     version                 = VERSION,
     url                     = 'https://github.com/antirais/estnin',
-    py_modules              = ['estnin'],
+    packages                = ['estnin'],
     license                 = 'MIT',
     include_package_data    = True,
     author                  = 'Anti Räis',
@@ -55,7 +57,7 @@ setup(
     test_suite              = 'tests',
     setup_requires          = ['pytest-runner'],
     tests_require           = test_deps,
-    extras_require          = {'test': test_deps},
+    extras_require          = extras,
     classifiers             = [
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
@@ -63,6 +65,9 @@ setup(
         'Programming Language :: Python :: 3',
         'Topic :: Software Development :: Libraries',
     ],
+    entry_points            = {
+        'console_scripts': ['estnin = estnin.cli:main'],
+    },
     cmdclass = {
         'clean': CleanCommand,
     },
@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+"""
+Benchmarks of the :class:`estnin.estnin` operations.
+
+Every benchmark runs an operation on a fixed number of values a few times and records the best
+throughput and the peak memory (measured with :py:mod:`tracemalloc` in a separate run). The results
+are written as JSON and compared against a stored baseline, a regression makes the script exit with
+a non-zero status::
+
+    python tests/benchmark.py                     # compare with tests/benchmark_baseline.json
+    python tests/benchmark.py --output out.json   # also write the results
+    python tests/benchmark.py --save-baseline     # replace the baseline with the results
+"""
+
+import gc
+import os
+import sys
+import json
+import asyncio
+import tempfile
+import platform
+import argparse
+import itertools
+import tracemalloc
+
+from random import Random
+from datetime import date
+from timeit import default_timer as timer
+
+from estnin import estnin, checksum, span, is_valid, try_parse, suggest, suggest_many, scan, redact, EstNIN, Allocator
+from estnin.vectorized import np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a benchmark. The decorated function gets the number of values and returns a function
+    that runs the operation on all of them, so that the setup is not measured.
+    """
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def numpy_benchmark(name):
+    """
+    Register a benchmark that needs NumPy, it is left out when NumPy is not installed.
+    """
+    if np is None:
+        return lambda function: function
+    return benchmark(name)
+
+
+def pandas_benchmark(name):
+    """
+    Register a benchmark that needs pandas, it is left out when pandas is not installed.
+    """
+    if pd is None:
+        return lambda function: function
+    return benchmark(name)
+
+
+def _values(count):
+    # 10 days of both sexes, so that every value can be moved to any month
+    return list(span(date(1970, 1, 1), date(1970, 1, 11))[:count])
+
+
+def _people(count):
+    return [estnin(value) for value in _values(count)]
+
+
+@benchmark('construct_int')
+def construct_int(count):
+    values = _values(count)
+    return lambda: [estnin(value) for value in values]
+
+
+@benchmark('construct_lazy')
+def construct_lazy(count):
+    values = _values(count)
+    return lambda: [estnin(value, lazy=True) for value in values]
+
+
+@benchmark('construct_str')
+def construct_str(count):
+    values = [str(value) for value in _values(count)]
+    return lambda: [estnin(value) for value in values]
+
+
+@benchmark('create')
+def create(count):
+    arguments = [(estnin(value).is_female, estnin(value).date, estnin(value).sequence) for value in _values(count)]
+    return lambda: [estnin.create(*fields) for fields in arguments]
+
+
+@benchmark('set_checksum')
+def set_checksum(count):
+    values = [value // 10 * 10 for value in _values(count)]
+    return lambda: [estnin(value, set_checksum=True) for value in values]
+
+
+@benchmark('checksum')
+def checksum_values(count):
+    values = range(estnin.MIN, estnin.MIN + count * 7919, 7919)
+    return lambda: [checksum(value) for value in values]
+
+
+def _setter(name, value):
+    def setup(count):
+        people = _people(count)
+
+        def run():
+            for person in people:
+                setattr(person, name, value)
+        return run
+    return setup
+
+
+for _name, _value in (
+    ('century', 5),
+    ('year', 1985),
+    ('month', 6),
+    ('day', 15),
+    ('sequence', 500),
+    ('date', date(1985, 6, 15)),
+):
+    benchmark('set_' + _name)(_setter(_name, _value))
+
+
+@benchmark('add')
+def add(count):
+    people = _people(count)
+
+    def run():
+        for person in people:
+            person + 1
+    return run
+
+
+@benchmark('sub')
+def sub(count):
+    people = _people(count)
+
+    def run():
+        for person in people:
+            person - 1
+    return run
+
+
+@benchmark('frozen_construct')
+def frozen_construct(count):
+    values = _values(count)
+    return lambda: [EstNIN(value) for value in values]
+
+
+@benchmark('frozen_add')
+def frozen_add(count):
+    people = [EstNIN(value) for value in _values(count)]
+    return lambda: [person + 1000 for person in people]
+
+
+@benchmark('iterate')
+def iterate(count):
+    return lambda: list(itertools.islice(estnin(estnin.MIN), count))
+
+
+@benchmark('iterate_reversed')
+def iterate_reversed(count):
+    return lambda: list(itertools.islice(reversed(estnin(estnin.MAX)), count))
+
+
+@benchmark('compare')
+def compare(count):
+    people = _people(count)
+    pairs = list(zip(people, people[1:] + people[:1]))
+
+    def run():
+        for first, second in pairs:
+            first < second
+            first == second
+    return run
+
+
+@benchmark('sort')
+def sort(count):
+    people = _people(count)
+    people = people[1::2] + people[::2]
+    return lambda: sorted(people)
+
+
+def _mixed(count):
+    # about 15% of the values have an invalid checksum
+    return [str(value + (i % 7 == 0)) for i, value in enumerate(_values(count))]
+
+
+@benchmark('try_parse')
+def try_parse_mixed(count):
+    values = _mixed(count)
+    return lambda: [try_parse(value) for value in values]
+
+
+@benchmark('is_valid')
+def is_valid_mixed(count):
+    values = _mixed(count)
+    return lambda: [is_valid(value) for value in values]
+
+
+def _typos(count):
+    # every value with one mistyped digit or two adjacent digits swapped
+    typos = []
+    for i, value in enumerate(str(value) for value in _values(count)):
+        position = i % 10
+        if i % 2:
+            typos.append(value[:position] + str((int(value[position]) + 1) % 10) + value[position + 1:])
+        else:
+            typos.append(value[:position] + value[position + 1] + value[position] + value[position + 2:])
+    return typos
+
+
+@benchmark('suggest')
+def suggest_typos(count):
+    typos = _typos(count)
+    return lambda: [suggest(value) for value in typos]
+
+
+@benchmark('suggest_many')
+def suggest_column(count):
+    # a column where every hundredth value is mistyped
+    values = [str(value) for value in _values(count)]
+    values[::100] = _typos(count)[::100]
+    return lambda: suggest_many(values)
+
+
+def _log(count):
+    # *count* lines of log text with a value on every 50th line
+    words = 'INFO request took 123ms status=200 path=/api/v1/items/998877 user id order 2024-01-05 12:33:01'.split()
+    choice = Random(0).choice
+    rows = [' '.join(choice(words) for _ in range(12)) for _ in range(count)]
+    for row in range(0, count, 50):
+        rows[row] += ' isikukood 37001011233'
+    return '\n'.join(rows)
+
+
+@benchmark('scan')
+def scan_text(count):
+    text = _log(count)
+    return lambda: list(scan(text))
+
+
+@benchmark('scan_bytes')
+def scan_bytes(count):
+    data = _log(count).encode()
+    return lambda: list(scan(data))
+
+
+@benchmark('redact')
+def redact_bytes(count):
+    data = _log(count).encode()
+    return lambda: b''.join(redact(data))
+
+
+def _stream(function, values):
+    async def source():
+        for value in values:
+            yield value
+
+    async def consume():
+        async for _ in function(source(), batch_size=4096):
+            pass
+
+    return lambda: asyncio.run(consume())
+
+
+@numpy_benchmark('validate_stream')
+def validate_stream(count):
+    from estnin.aio import validate_stream
+
+    return _stream(validate_stream, _values(count))
+
+
+@numpy_benchmark('validate_batches')
+def validate_batches(count):
+    from estnin.aio import validate_batches
+
+    return _stream(validate_batches, _values(count))
+
+
+@benchmark('allocate')
+def allocate(count):
+    # the lowest free sequences of the days and sexes of the values, in a new allocator
+    arguments = [(person.is_female, person.date) for person in _people(count)]
+
+    def run():
+        allocator = Allocator()
+        return [allocator.allocate(sex, birth_date) for sex, birth_date in arguments]
+    return run
+
+
+@numpy_benchmark('allocator_load_used')
+def allocator_load_used(count):
+    values = np.array(_values(count))[::-1]
+
+    def run():
+        allocator = Allocator()
+        allocator.load_used(values)
+        return allocator
+    return run
+
+
+@numpy_benchmark('dedup')
+def dedup(count):
+    # two files with half of the rows duplicated, a small memory limit spills sorted runs to disk
+    from estnin import tools
+
+    directory = tempfile.TemporaryDirectory()
+    values = np.random.default_rng(1).permutation(np.array(_values(count // 2) * 2))
+    paths = [os.path.join(directory.name, name) for name in ('a.txt', 'b.txt')]
+    for path, part in zip(paths, np.array_split(values, 2)):
+        with open(path, 'wb') as file:
+            file.write(b''.join(value + b'\n' for value in part.astype('S11').tolist()))
+
+    # the directory is removed when the function is garbage collected
+    return lambda: (directory, tools.dedup(paths, os.path.join(directory.name, 'out.txt'), memory_limit=1 << 16))
+
+
+@numpy_benchmark('validate_many')
+def validate_column(count):
+    from estnin import validate_many
+
+    values = np.random.default_rng(0).integers(estnin.MIN, estnin.MAX, count)
+    return lambda: validate_many(values)
+
+
+@numpy_benchmark('parallel_validate')
+def parallel_validate(count):
+    # the values are in shared memory already, so the workers map them without a copy; with this
+    # few values the start of the workers dominates
+    from estnin import parallel
+
+    values = parallel.empty(count)
+    values[:] = np.random.default_rng(0).integers(estnin.MIN, estnin.MAX, count)
+    return lambda: parallel.validate(values, workers=2)
+
+
+def _column(count):
+    from estnin import random, extension  # registers the dtype and the accessor
+
+    return pd.Series(random(count, seed=1).astype(str))
+
+
+@pandas_benchmark('series_is_valid')
+def series_is_valid(count):
+    column = _column(count)
+    return lambda: column.estnin.is_valid
+
+
+@pandas_benchmark('series_astype')
+def series_astype(count):
+    column = _column(count)
+    return lambda: column.astype('estnin')
+
+
+@numpy_benchmark('encode_many')
+def encode_many(count):
+    from estnin import random, codec
+
+    values = random(count, seed=1)
+    return lambda: codec.encode_many(values)
+
+
+@numpy_benchmark('decode_many')
+def decode_many(count):
+    from estnin import random, codec
+
+    data = codec.encode_many(random(count, seed=1))
+    return lambda: codec.decode_many(data)
+
+
+@numpy_benchmark('decode_at')
+def decode_at(count):
+    from estnin import random, codec
+
+    data = codec.encode_many(random(count, seed=1))
+    return lambda: [codec.decode_at(data, index) for index in range(count)]
+
+
+@numpy_benchmark('index_build')
+def index_build(count):
+    from estnin import random, Index
+
+    values = random(count, seed=1)
+    return lambda: Index(values)
+
+
+def _query(name, *arguments, **keywords):
+    # *count* queries to an index of ten times as many values
+    def setup(count):
+        from estnin import random, Index
+
+        query = getattr(Index(random(count * 10, seed=1)), name)
+
+        def run():
+            for _ in range(count):
+                query(*arguments, **keywords)
+        return run
+    return setup
+
+
+for _name, _arguments in (
+    ('born_between', (date(1985, 3, 1), date(1985, 6, 30))),
+    ('count_between', (date(1985, 3, 1), date(1985, 6, 30))),
+    ('birthday', (2, 29)),
+    ('count_birthday', (2, 29)),
+):
+    numpy_benchmark('index_' + _name)(_query(_name, *_arguments, sex=estnin.FEMALE))
+
+
+@numpy_benchmark('bloom_add_many')
+def bloom_add_many(count):
+    from estnin import random, BloomFilter
+
+    values = random(count, seed=1)
+
+    def run():
+        bloom = BloomFilter(count, error_rate=0.001)
+        bloom.add_many(values)
+        return bloom
+    return run
+
+
+def _bloom(count):
+    # a filter of *count* values and as many other values to look up
+    from estnin import random, BloomFilter
+
+    bloom = BloomFilter(count, error_rate=0.001)
+    bloom.add_many(random(count, seed=1))
+    return bloom, random(count, seed=2)
+
+
+@numpy_benchmark('bloom_contains_many')
+def bloom_contains_many(count):
+    bloom, others = _bloom(count)
+    return lambda: bloom.contains_many(others)
+
+
+@numpy_benchmark('bloom_contains')
+def bloom_contains(count):
+    bloom, others = _bloom(count)
+    others = others.tolist()
+
+    def run():
+        for value in others:
+            value in bloom
+    return run
+
+
+@numpy_benchmark('bloom_update')
+def bloom_update(count):
+    # merges of the filters of 1000 values with room for *count* values each
+    from estnin import random, BloomFilter
+
+    shards = []
+    for values in np.array_split(random(count, seed=1), count // 1000 or 1):
+        shards.append(BloomFilter(count, error_rate=0.001))
+        shards[-1].add_many(values)
+
+    return lambda: BloomFilter(count, error_rate=0.001).update(*shards)
+
+
+@benchmark('age_on')
+def age_on(count):
+    people = [EstNIN(value) for value in _values(count)]
+    on = date(2024, 6, 30)
+    return lambda: [person.age_on(on) for person in people]
+
+
+@numpy_benchmark('ages')
+def ages(count):
+    from estnin import ages
+
+    values = np.array(_values(count))
+    return lambda: ages(values, on=date(2024, 6, 30))
+
+
+@numpy_benchmark('age_buckets')
+def age_buckets(count):
+    from estnin import age_buckets
+
+    values = np.array(_values(count))
+    return lambda: age_buckets(values, on=date(2024, 6, 30), edges=[18, 65])
+
+
+def _calibration(count):
+    # plain Python work that does not depend on the package, used to normalize the results
+    # between machines and against the load of the machine
+    values = _values(count)
+
+    def run():
+        table = {}
+        for value in values:
+            table[value % 1000] = divmod(value, 10**4)
+            table[str(value)[:4]] = [value, value // 10]
+        return table
+    return run
+
+
+def _measure(setup, count):
+    function = setup(count)
+    gc.collect()
+    gc.disable()
+    try:
+        start = timer()
+        function()
+        return timer() - start
+    finally:
+        gc.enable()
+
+
+def run(names=None, count=20000, repeat=5):
+    """
+    Run the benchmarks and return the results as ``{name: {"count", "ops_per_sec", "relative",
+    "peak_memory"}}`` where ``relative`` is the throughput relative to a calibration loop.
+
+    The benchmarks are run in rounds, so that a temporary load on the machine affects all of them
+    and the calibration alike, and the best time of each is kept.
+    """
+    selected = {name: setup for name, setup in BENCHMARKS.items() if not names or name in names}
+    selected['calibration'] = _calibration
+    best = {}
+
+    for _ in range(repeat):
+        for name, setup in selected.items():
+            elapsed = _measure(setup, count)
+            best[name] = min(best.get(name, elapsed), elapsed)
+
+    calibration = count / best.pop('calibration')
+    del selected['calibration']
+    results = {}
+
+    for name, setup in selected.items():
+        function = setup(count)
+        tracemalloc.start()
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+
+        results[name] = {
+            'count': count,
+            'ops_per_sec': count / best[name],
+            'relative': count / best[name] / calibration,
+            'peak_memory': peak,
+        }
+
+    return results
+
+
+def compare_results(results, baseline, tolerance):
+    """
+    Return the list of regressions: benchmarks that are slower (relative to the calibration loop)
+    or use more memory than the baseline by more than *tolerance* (a fraction).
+    """
+    regressions = []
+
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+
+        if result['relative'] < expected['relative'] * (1 - tolerance):
+            regressions.append('{}: {:.0f} ops/s ({:.3f} relative), baseline {:.0f} ops/s ({:.3f} relative)'.format(
+                name, result['ops_per_sec'], result['relative'], expected['ops_per_sec'], expected['relative']))
+
+        # small allocations vary between runs, so memory has an absolute allowance as well
+        if result['peak_memory'] > expected['peak_memory'] * (1 + tolerance) + 64 * 1024:
+            regressions.append('{}: peak memory {} bytes, baseline {} bytes'.format(
+                name, result['peak_memory'], expected['peak_memory']))
+
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('names', nargs='*', help='benchmarks to run, all by default: ' + ', '.join(BENCHMARKS))
+    parser.add_argument('--count', type=int, default=20000, help='number of values per run')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed runs, the best one is kept')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='allowed slowdown as a fraction')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='write the results to the baseline file')
+    args = parser.parse_args(arguments)
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error('unknown benchmarks: {}'.format(', '.join(sorted(unknown))))
+
+    # without a baseline nothing would be compared and the run would pass silently
+    baseline = {}
+    if not args.save_baseline:
+        try:
+            with open(args.baseline) as file:
+                baseline = json.load(file)['results']
+        except (OSError, ValueError, KeyError) as error:
+            parser.error('cannot read the baseline {}: {!r}'.format(args.baseline, error))
+
+    results = run(args.names, args.count, args.repeat)
+    document = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+    print('{:<20} {:>12} {:>10} {:>10} {:>14}'.format('benchmark', 'ops/s', 'relative', 'baseline', 'peak memory'))
+    for name, result in results.items():
+        expected = baseline.get(name, {}).get('relative')
+        print('{:<20} {:>12.0f} {:>10.3f} {:>10} {:>14}'.format(
+            name, result['ops_per_sec'], result['relative'], '-' if expected is None else '{:.3f}'.format(expected),
+            result['peak_memory']))
+
+    for path in filter(None, (args.output, args.baseline if args.save_baseline else None)):
+        with open(path, 'w') as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+            file.write('\n')
+
+    if args.save_baseline:
+        return 0
+
+    regressions = compare_results(results, baseline, args.tolerance)
+    if regressions:
+        print('\nREGRESSIONS (tolerance {:.0%}):'.format(args.tolerance), file=sys.stderr)
+        for regression in regressions:
+            print('  ' + regression, file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def test_benchmarks_run():
+    results = run(count=50, repeat=1)
+    assert set(results) == set(BENCHMARKS)
+    assert all(result['relative'] > 0 and result['peak_memory'] >= 0 for result in results.values())
+
+
+def test_compare_results():
+    baseline = {'a': {'ops_per_sec': 1000, 'relative': 1.0, 'peak_memory': 10**6}}
+    assert compare_results({'a': {'ops_per_sec': 500, 'relative': 0.9, 'peak_memory': 10**6}}, baseline, 0.25) == []
+    assert len(compare_results({'a': {'ops_per_sec': 1000, 'relative': 0.5, 'peak_memory': 2 * 10**6}}, baseline, 0.25)) == 2
+    assert compare_results({'b': {'ops_per_sec': 1, 'relative': 0.1, 'peak_memory': 1}}, baseline, 0.25) == []
+
+
+def test_missing_baseline_fails(tmp_path):
+    import pytest
+
+    for content in (None, '', '{}'):
+        path = tmp_path / 'baseline.json'
+        if content is not None:
+            path.write_text(content)
+
+        with pytest.raises(SystemExit) as error:
+            main(['construct_int', '--count', '10', '--repeat', '1', '--baseline', str(path)])
+        assert error.value.code == 2
+
+    assert main(['construct_int', '--count', '10', '--repeat', '1', '--baseline', str(tmp_path / 'new.json'), '--save-baseline']) == 0
+    assert main(['construct_int', '--count', '10', '--repeat', '1', '--baseline', str(tmp_path / 'new.json'), '--tolerance', '1000']) == 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from datetime import date
+
+from estnin import estnin, EstNIN
+
+DATES = [
+    date(2000, 2, 28), date(2000, 2, 29), date(2000, 3, 1),
+    date(2001, 2, 28), date(2001, 3, 1),
+    date(2004, 2, 29), date(2023, 12, 31), date(2100, 2, 28), date(2100, 3, 1),
+]
+
+
+def expected_age(person, on):
+    # reference implementation with dates, a leap day birthday is on the 1st of March in common years
+    try:
+        birthday = person.date.replace(year=on.year)
+    except ValueError:
+        birthday = date(on.year, 3, 1)
+    return on.year - person.year - (on < birthday)
+
+
+@pytest.mark.parametrize('on', DATES)
+@pytest.mark.parametrize('value', [60002290003, 37001011233, 50002280006, 50003010005, 39912319997, 10001010002])
+def test_age_on(value, on):
+    person = estnin(value)
+    assert person.age_on(on) == expected_age(person, on)
+    assert EstNIN(value).age_on(on) == person.age_on(on)
+
+
+def test_age_on_leap_day():
+    person = estnin(60002290003)
+    assert [person.age_on(date(2000 + years, 2, 28)) for years in range(1, 5)] == [0, 1, 2, 3]
+    assert [person.age_on(date(2000 + years, 3, 1)) for years in range(1, 5)] == [1, 2, 3, 4]
+    assert person.age_on(date(2004, 2, 29)) == 4
+    assert person.age_on(date(2000, 2, 28)) == -1
+
+
+def test_age_on_lazy():
+    assert estnin(37001011233, lazy=True).age_on(date(1990, 1, 1)) == 20
+
+
+def test_ages_match_scalar():
+    np = pytest.importorskip('numpy')
+    from estnin import ages, random, EstNINArray
+
+    values = random(20000, seed=11)
+    values = np.concatenate((values, [60002290003, 50002280006, 50003010005]))
+
+    for on in DATES:
+        result = ages(values, on=on)
+        assert result.dtype == np.int64
+        assert result.tolist() == [EstNIN(value).age_on(on) for value in values.tolist()]
+        assert (EstNINArray(values).age_on(on) == result).all()
+
+    assert ages(values.astype(str).reshape(-1, 1), on=DATES[0]).shape == (len(values), 1)
+
+
+def test_ages_validation():
+    pytest.importorskip('numpy')
+    from estnin import ages
+
+    with pytest.raises(ValueError, match='index 1'):
+        ages([37001011233, 37001011234], on=date(2020, 1, 1))
+
+    assert ages([37001011234], on=date(2020, 1, 1), validate=False).tolist() == [50]
+    assert len(ages([])) == 0
+
+
+def test_age_buckets():
+    np = pytest.importorskip('numpy')
+    from estnin import ages, age_buckets, random
+
+    values = random(20000, seed=12)
+    on = date(2024, 2, 29)
+    edges = [0, 18, 65, 100]
+    buckets = age_buckets(values, on=on, edges=edges)
+    assert buckets.tolist() == [sum(age >= edge for edge in edges) for age in ages(values, on=on).tolist()]
+    assert age_buckets([60002290003, 60802290005], on=date(2026, 2, 28)).tolist() == [1, 0]
+    assert age_buckets([60802290005], on=date(2026, 3, 1), edges=[18]).tolist() == [1]
+
+
+def test_age_buckets_edges():
+    pytest.importorskip('numpy')
+    from estnin import age_buckets
+
+    with pytest.raises(ValueError):
+        age_buckets([37001011233], edges=[65, 18])
+    with pytest.raises(ValueError):
+        age_buckets([37001011233], edges=[18, 18])
+
+    assert age_buckets([37001011233], on=date(2020, 1, 1), edges=[]).tolist() == [0]
+    assert age_buckets([37001011233], on=date(2020, 1, 1), edges=50).tolist() == [1]
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import asyncio
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+np = pytest.importorskip('numpy')
+
+from estnin.aio import validate_stream, validate_batches, Result
+
+
+async def produce(values, delay=0):
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+
+async def collect(generator):
+    return [item async for item in generator]
+
+
+def run(generator):
+    return asyncio.run(collect(generator))
+
+
+def test_validate_stream_results_in_order():
+    values = [37001011233, '37001011234', 37013011233, None, '47001011234'] * 3
+    results = run(validate_stream(produce(values), batch_size=4))
+
+    assert [result.value for result in results] == values
+    assert results[:5] == [
+        Result(37001011233, True, 0),
+        Result('37001011234', False, 4),
+        Result(37013011233, False, 3),
+        Result(None, False, 5),
+        Result('47001011234', True, 0),
+    ]
+
+
+def test_validate_stream_accepts_regular_iterables():
+    assert [result.valid for result in run(validate_stream([37001011233, 1]))] == [True, False]
+
+
+def test_validate_batches_sizes():
+    batches = run(validate_batches(produce(range(10)), batch_size=4))
+    assert [len(values) for values, _, _ in batches] == [4, 4, 2]
+    assert all(len(mask) == len(errors) == len(values) for values, mask, errors in batches)
+
+
+def test_validate_batches_max_delay_flushes_partial_batches():
+    async def slow():
+        for value in range(3):
+            yield value
+        await asyncio.sleep(0.2)
+        yield 3
+
+    batches = run(validate_batches(slow(), batch_size=100, max_delay=0.05))
+    assert [values for values, _, _ in batches] == [[0, 1, 2], [3]]
+
+
+def test_validate_batches_offloads_to_executor():
+    with ThreadPoolExecutor(1) as executor:
+        batches = run(validate_batches(produce([37001011233] * 5), batch_size=2, executor=executor, offload_size=2))
+
+    assert [mask.tolist() for _, mask, _ in batches] == [[True, True], [True, True], [True]]
+
+
+def test_validate_stream_propagates_source_errors():
+    async def failing():
+        yield 37001011233
+        raise RuntimeError('source failed')
+
+    with pytest.raises(RuntimeError, match='source failed'):
+        run(validate_stream(failing()))
+
+
+def test_validate_stream_backpressure():
+    read = []
+
+    async def source():
+        for value in range(100):
+            read.append(value)
+            yield 37001011233
+
+    async def main():
+        stream = validate_stream(source(), batch_size=10)
+        await stream.__anext__()
+        await asyncio.sleep(0.01)
+        pending = len(read)
+        await stream.aclose()
+        return pending
+
+    assert asyncio.run(main()) <= 10 + 10 + 1
+
+
+def test_validate_batches_rejects_invalid_batch_size():
+    with pytest.raises(ValueError):
+        run(validate_batches([], batch_size=0))
+
+
+def test_validate_stream_empty():
+    assert run(validate_stream(produce([]))) == []
+
+
+def test_validate_batches_max_delay_keeps_every_value():
+    async def jittery():
+        for value in range(200):
+            await asyncio.sleep(0.001 * (value % 3))
+            yield value
+
+    batches = run(validate_batches(jittery(), batch_size=7, max_delay=0.001))
+    assert [value for values, _, _ in batches for value in values] == list(range(200))
+
+
+def test_validate_stream_close_waits_for_the_reader():
+    async def source():
+        for value in range(100):
+            yield 37001011233
+
+    async def main():
+        stream = validate_stream(source(), batch_size=10, max_delay=0.01)
+        await stream.__anext__()
+        await stream.aclose()
+        return [task for task in asyncio.all_tasks() if getattr(task.get_coro(), '__name__', None) == '_read' and not task.done()]
+
+    assert asyncio.run(main()) == []
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+import threading
+
+from datetime import date
+
+from estnin import estnin, Allocator
+
+
+def test_allocate_lowest_free():
+    allocator = Allocator()
+    day = date(2000, 2, 29)
+
+    values = [allocator.allocate(estnin.FEMALE, day) for _ in range(3)]
+    assert [estnin(value).sequence for value in values] == [0, 1, 2]
+    assert all(estnin(value).date == day and estnin(value).is_female for value in values)
+    assert estnin(allocator.allocate(estnin.MALE, day)).sequence == 0
+    assert len(allocator) == 4
+
+    allocator.release(values[1])
+    assert values[1] not in allocator
+    assert values[0] in allocator
+    assert allocator.allocate(estnin.FEMALE, day) == values[1]
+
+
+def test_allocate_century_boundaries():
+    allocator = Allocator()
+    for day, century in ((date(1800, 1, 1), 1), (date(1899, 12, 31), 1), (date(1900, 1, 1), 3), (date(2199, 12, 31), 7)):
+        person = estnin(allocator.allocate(estnin.MALE, day))
+        assert (person.date, person.century, person.sequence) == (day, century, 0)
+
+    with pytest.raises(ValueError):
+        allocator.allocate(estnin.MALE, date(2200, 1, 1))
+    with pytest.raises(ValueError):
+        allocator.available(estnin.MALE, date(1799, 12, 31))
+
+
+def test_allocate_full_day():
+    allocator = Allocator()
+    day = date(1985, 6, 15)
+
+    values = allocator.allocate_many(estnin.MALE, day, 999)
+    assert [estnin(value).sequence for value in values] == list(range(999))
+    assert allocator.available(estnin.MALE, day) == 1
+    assert allocator.available(estnin.FEMALE, day) == 1000
+
+    with pytest.raises(ValueError):
+        allocator.allocate_many(estnin.MALE, day, 2)
+    assert allocator.available(estnin.MALE, day) == 1
+
+    assert estnin(allocator.allocate(estnin.MALE, day)).sequence == 999
+    with pytest.raises(ValueError):
+        allocator.allocate(estnin.MALE, day)
+
+    allocator.release(values[500])
+    assert allocator.allocate(estnin.MALE, day) == values[500]
+
+    assert allocator.allocate_many(estnin.FEMALE, day, 0) == []
+    with pytest.raises(ValueError):
+        allocator.allocate_many(estnin.FEMALE, day, -1)
+
+
+def test_release_validates():
+    allocator = Allocator()
+    with pytest.raises(ValueError):
+        allocator.release(37001011233)
+    with pytest.raises(ValueError):
+        allocator.release(37001011234)
+
+    value = allocator.allocate(estnin.MALE, date(1970, 1, 1))
+    allocator.release(str(value))
+    assert len(allocator) == 0
+    assert 'invalid' not in allocator
+
+
+def test_load_used():
+    np = pytest.importorskip('numpy')
+    from estnin import random
+
+    values = random(50000, born_between=(date(1970, 1, 1), date(1970, 1, 10)), seed=1)
+    allocator = Allocator()
+    allocator.load_used(values)
+    allocator.load_used(values[:10])
+    assert len(allocator) == len(np.unique(values))
+    assert all(value in allocator for value in values[:100].tolist())
+
+    day = date(1970, 1, 5)
+    used = {int(value) for value in values.tolist() if estnin(value).date == day and estnin(value).is_male}
+    allocated = allocator.allocate_many(estnin.MALE, day, allocator.available(estnin.MALE, day))
+    assert not used & set(allocated)
+    assert len(used) + len(allocated) == 1000
+
+    with pytest.raises(ValueError):
+        allocator.load_used([37001011234])
+
+    allocator.load_used([])
+
+
+def test_threads():
+    allocator = Allocator()
+    day = date(1990, 1, 1)
+    results = []
+
+    def worker():
+        results.extend(allocator.allocate(estnin.FEMALE, day) for _ in range(100))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(estnin(value).sequence for value in results) == list(range(800))
+
+
+def test_save_load(tmp_path):
+    allocator = Allocator()
+    allocator.allocate_many(estnin.MALE, date(1800, 1, 1), 3)
+    allocator.allocate_many(estnin.FEMALE, date(2199, 12, 31), 1000)
+    allocator.release(allocator.allocate(estnin.MALE, date(2000, 1, 1)))
+
+    path = tmp_path / 'allocator'
+    allocator.save(path)
+    allocator.save(path)
+    assert [file.name for file in tmp_path.iterdir()] == ['allocator']
+
+    loaded = Allocator.load(path)
+    assert len(loaded) == 1003
+    assert loaded.available(estnin.FEMALE, date(2199, 12, 31)) == 0
+    assert estnin(loaded.allocate(estnin.MALE, date(1800, 1, 1))).sequence == 3
+    assert loaded.available(estnin.MALE, date(2000, 1, 1)) == 1000
+
+
+def test_load_validates(tmp_path):
+    path = tmp_path / 'allocator'
+    Allocator().save(path)
+    data = path.read_bytes()
+
+    for broken in (b'', b'x' * len(data), data + b'\x00'):
+        path.write_bytes(broken)
+        with pytest.raises(ValueError):
+            Allocator.load(path)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import sys
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from estnin import estnin, EstNINArray
+from datetime import date
+
+VALUES = [37001011233, 47001011234, 50002290002, estnin.MIN, estnin.MAX]
+
+
+def test_array_validates_values():
+    with pytest.raises(ValueError):
+        EstNINArray([37001011233, 37001011234])
+
+
+def test_array_can_skip_validation():
+    assert len(EstNINArray([37001011234], validate=False)) == 1
+
+
+def test_array_does_not_copy_int64_input():
+    values = np.array(VALUES, dtype=np.int64)
+    people = EstNINArray(values)
+    assert np.shares_memory(np.asarray(people), values)
+
+
+def test_array_is_read_only():
+    people = EstNINArray(VALUES)
+    with pytest.raises(ValueError):
+        people.values[0] = 0
+
+
+def test_array_fields_match_estnin():
+    people = EstNINArray(VALUES)
+    for name in ('century', 'year', 'month', 'day', 'sequence', 'checksum', 'is_male', 'is_female'):
+        assert getattr(people, name).tolist() == [getattr(estnin(v), name) for v in VALUES]
+
+
+def test_array_date_returns_datetime64():
+    assert EstNINArray(VALUES).date.tolist() == [estnin(v).date for v in VALUES]
+
+
+def test_array_item_access_returns_estnin():
+    people = EstNINArray(VALUES)
+    assert isinstance(people[0], estnin)
+    assert people[-1] == estnin.MAX
+    assert [int(p) for p in people] == VALUES
+
+
+def test_array_slicing_does_not_copy():
+    people = EstNINArray(VALUES)
+    part = people[1:3]
+    assert isinstance(part, EstNINArray)
+    assert part.values.tolist() == VALUES[1:3]
+    assert np.shares_memory(part.values, people.values)
+
+
+def test_array_mask_filtering():
+    people = EstNINArray(VALUES)
+    women = people[people.is_female]
+    assert women.values.tolist() == [47001011234, estnin.MAX]
+
+    with pytest.raises(IndexError):
+        people[np.array([True])]
+
+
+def test_array_membership():
+    people = EstNINArray(VALUES)
+    assert 37001011233 in people
+    assert estnin(47001011234) in people
+    assert 37001011244 not in people
+    assert 'invalid' not in people
+    assert people.contains([estnin.MAX, 37001011244]).tolist() == [True, False]
+    assert not EstNINArray([]).contains([estnin.MIN]).any()
+
+
+def test_array_sort_and_searchsorted():
+    people = EstNINArray(VALUES)
+    assert people.sort().values.tolist() == sorted(VALUES)
+    assert people.searchsorted(estnin.MIN) == 0
+    assert people.searchsorted(estnin.MAX, side='right') == len(VALUES)
+
+
+def test_array_supports_buffer_protocol():
+    people = EstNINArray(VALUES)
+    assert np.frombuffer(people.values, dtype=np.int64).tolist() == VALUES
+    assert np.asarray(people).tolist() == VALUES
+    assert np.shares_memory(np.asarray(people), people.values)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='the buffer protocol of Python classes needs Python 3.12')
+def test_array_exposes_buffer():
+    people = EstNINArray(VALUES)
+    view = memoryview(people)
+    assert view.readonly and view.format == 'q' and view.tolist() == VALUES
+    assert np.frombuffer(people, dtype=np.int64).tolist() == VALUES
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 12), reason='the buffer protocol of Python classes needs Python 3.12')
+def test_array_buffer_needs_python_3_12():
+    with pytest.raises(TypeError):
+        memoryview(EstNINArray(VALUES))
+
+
+def test_array_conversion_respects_copy():
+    people = EstNINArray(VALUES)
+    assert people.__array__(copy=False) is people.values
+    assert people.__array__(np.int64, copy=False) is people.values
+    assert people.__array__(np.float64).tolist() == VALUES
+    assert not np.shares_memory(people.__array__(copy=True), people.values)
+
+    with pytest.raises(ValueError):
+        people.__array__(np.float64, copy=False)
+    if np.lib.NumpyVersion(np.__version__) >= '2.0.0':
+        with pytest.raises(ValueError):
+            np.asarray(people, dtype=np.float64, copy=False)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from estnin import BloomFilter, EstNIN, random
+
+
+def test_add_and_contains():
+    bloom = BloomFilter(100)
+    bloom.add(37001011233)
+    bloom.add('47001011234')
+    bloom.add(EstNIN(50001010006))
+
+    assert 37001011233 in bloom
+    assert 47001011234 in bloom
+    assert '50001010006' in bloom
+    assert 37001011244 not in bloom
+    assert 'invalid' not in bloom
+    assert None not in bloom
+    assert len(bloom) == 3
+
+
+def test_sizing():
+    bloom = BloomFilter(10**6, error_rate=0.01)
+    assert bloom.size % 64 == 0
+    assert 9 * 10**6 < bloom.size < 10**7
+    assert bloom.hashes == 7
+    assert (bloom.capacity, bloom.error_rate) == (10**6, 0.01)
+
+    for capacity, error_rate in ((0, 0.01), (10, 0), (10, 1)):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, error_rate)
+
+
+def test_bulk_matches_scalar():
+    np = pytest.importorskip('numpy')
+    values = random(5000, seed=7)
+    others = random(5000, seed=8)
+
+    bulk = BloomFilter(5000, 0.01)
+    bulk.add_many(values)
+    scalar = BloomFilter(5000, 0.01)
+    for value in values.tolist():
+        scalar.add(value)
+
+    assert bulk.to_bytes() == scalar.to_bytes()
+    assert bulk.contains_many(values).all()
+    assert bulk.contains_many(others).tolist() == [value in scalar for value in others.tolist()]
+    assert bulk.contains_many(values.astype(str)).all()
+    assert bulk.contains_many(values.reshape(50, 100)).shape == (50, 100)
+    assert not bulk.contains_many(['x'])[0]
+
+    with pytest.raises(ValueError):
+        bulk.add_many(['37001011233', 'x'])
+
+
+def test_false_positive_rate():
+    np = pytest.importorskip('numpy')
+    bloom = BloomFilter(20000, 0.01)
+    assert bloom.false_positive_rate == 0
+
+    values = random(20000, seed=1)
+    bloom.add_many(values)
+    others = random(20000, seed=2)
+    others = others[~np.isin(others, values)]
+
+    measured = bloom.contains_many(others).mean()
+    assert 0.005 < bloom.false_positive_rate < 0.015
+    assert abs(measured - bloom.false_positive_rate) < 0.005
+
+    bloom.add_many(random(20000, seed=3))
+    assert bloom.false_positive_rate > 0.05
+
+
+def test_merge():
+    np = pytest.importorskip('numpy')
+    first, second = random(1000, seed=1), random(1000, seed=2)
+    left, right, both = BloomFilter(2000), BloomFilter(2000), BloomFilter(2000)
+    left.add_many(first)
+    right.add_many(second)
+    both.add_many(np.concatenate((first, second)))
+
+    merged = left | right
+    assert merged.to_bytes() == both.to_bytes()
+    assert len(merged) == 2000
+    assert len(left) == 1000
+
+    left |= right
+    assert left.to_bytes() == both.to_bytes()
+
+    with pytest.raises(ValueError):
+        left.update(BloomFilter(10))
+    with pytest.raises(TypeError):
+        left.update(set())
+
+
+def test_serialization(tmp_path):
+    bloom = BloomFilter(1000, 0.001)
+    bloom.add(37001011233)
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    assert 37001011233 in restored
+    assert (restored.capacity, restored.error_rate, len(restored)) == (1000, 0.001, 1)
+    restored.add(47001011234)
+    assert 47001011234 not in bloom
+
+    path = tmp_path / 'blocked.bloom'
+    bloom.save(path)
+    assert path.read_bytes() == bloom.to_bytes()
+
+    loaded = BloomFilter.load(path)
+    assert loaded.to_bytes() == bloom.to_bytes()
+
+    mapped = BloomFilter.load(path, mmap_mode=True)
+    assert 37001011233 in mapped
+    assert 47001011234 not in mapped
+    with pytest.raises(ValueError):
+        mapped.add(47001011234)
+
+    copy = mapped.copy()
+    copy.add(47001011234)
+    assert 47001011234 in copy
+
+    # merging from a read-only mapping
+    merged = BloomFilter(1000, 0.001)
+    merged |= mapped
+    assert merged.to_bytes() == bloom.to_bytes()
+    with pytest.raises(ValueError):
+        mapped |= merged
+
+
+def test_mmap_bulk(tmp_path):
+    pytest.importorskip('numpy')
+    bloom = BloomFilter(1000)
+    bloom.add_many([37001011233])
+    path = tmp_path / 'blocked.bloom'
+    bloom.save(path)
+
+    mapped = BloomFilter.load(path, mmap_mode=True)
+    assert mapped.contains_many([37001011233, 47001011234]).tolist() == [True, False]
+    with pytest.raises(ValueError):
+        mapped.add_many([47001011234])
+
+
+def test_invalid_serialized_data():
+    data = BloomFilter(100).to_bytes()
+    for invalid in (b'', b'x' * len(data), data[:-1]):
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(invalid)
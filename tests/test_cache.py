@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+import threading
+
+from estnin import EstNIN, Cache, cached
+
+
+def test_cache_returns_shared_instances():
+    cache = Cache()
+    first = cache(37001011233)
+    assert isinstance(first, EstNIN)
+    assert cache('37001011233') is first
+    assert cache.get(EstNIN(37001011233)) is first
+
+
+def test_cache_validates_values():
+    cache = Cache()
+    with pytest.raises(ValueError):
+        cache(37001011234)
+    assert len(cache) == 0
+    assert cache.cache_info().misses == 1
+
+
+def test_cache_rejects_non_integral_values():
+    cache = Cache()
+    cache(37001011233)
+    for value in (37001011233.0, 37001011233.7, True):
+        with pytest.raises(ValueError):
+            cache(value)
+        assert value not in cache
+    assert cache.cache_info().misses == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = Cache(maxsize=2)
+    cache(37001011233)
+    cache(47001011234)
+    cache(37001011233)
+    cache(37001011244)
+
+    assert 37001011233 in cache
+    assert 47001011234 not in cache
+    assert 'invalid' not in cache
+    assert cache.cache_info() == (1, 3, 1, 2, 2)
+
+
+def test_cache_clear_resets_statistics():
+    cache = Cache()
+    cache(37001011233)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, cache.cache_info().maxsize, 0)
+
+
+def test_cache_validates_maxsize():
+    with pytest.raises(ValueError):
+        Cache(maxsize=0)
+
+
+def test_cache_is_thread_safe():
+    cache = Cache(maxsize=50)
+    values = [int(EstNIN(37001010000 + sequence * 10, set_checksum=True)) for sequence in range(100)]
+    results = []
+
+    def worker():
+        results.extend(cache(value) for _ in range(20) for value in values)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = cache.cache_info()
+    assert info.hits + info.misses == len(results) == 4 * 20 * 100
+    assert info.currsize == 50
+    assert info.misses >= info.evictions + info.currsize
+
+
+def test_cached_uses_default_cache():
+    assert cached(37001011233) is cached('37001011233')
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import sys
+import subprocess
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from estnin.cli import main
+
+ROWS = 'name,id\na,37001011233\nb,37001011234\n\nc, 47001011234\nd,abc\n'
+
+
+@pytest.fixture
+def people(tmp_path):
+    path = tmp_path / 'people.csv'
+    path.write_text(ROWS)
+    return str(path)
+
+
+def test_cli_writes_summary(people, capsys):
+    assert main(['validate', people, '--header', '--column', 'id']) == 1
+    out, err = capsys.readouterr()
+    assert 'total: 4\nvalid: 2\n' in out
+    assert 'checksum: 1\n' in out
+    assert 'format: 1\n' in out
+    assert 'rows/s' in err
+
+
+def test_cli_writes_valid_rows(people, capsys):
+    main(['validate', people, '--header', '--column', '1', '--output', 'valid'])
+    assert capsys.readouterr().out == 'name,id\na,37001011233\nc, 47001011234\n'
+
+
+def test_cli_writes_invalid_rows_with_reason(people, tmp_path):
+    output = str(tmp_path / 'invalid.csv')
+    main(['validate', people, '--header', '-c', 'id', '--output', 'invalid', '-o', output, '--chunk-size', '1'])
+    with open(output) as file:
+        assert file.read() == 'name,id,reason\nb,37001011234,checksum\nd,abc,format\n'
+
+
+def test_cli_returns_zero_if_all_valid(tmp_path, capsys):
+    path = tmp_path / 'valid.csv'
+    path.write_text('37001011233\n47001011234\n')
+    assert main(['validate', str(path)]) == 0
+
+
+def test_cli_uses_worker_processes(people, capsys):
+    main(['validate', people, '--header', '-c', 'id', '--output', 'valid', '--jobs', '2', '--chunk-size', '1'])
+    assert capsys.readouterr().out == 'name,id\na,37001011233\nc, 47001011234\n'
+
+
+def test_cli_reports_missing_column(people, capsys):
+    with pytest.raises(SystemExit) as error:
+        main(['validate', people, '--column', '5'])
+    assert error.value.code == 2
+
+
+def test_cli_dedup(tmp_path, capsys):
+    first, second, output = tmp_path / 'a.txt', tmp_path / 'b.txt', tmp_path / 'out.txt'
+    first.write_text('47001011234\n37001011233\n')
+    second.write_text('37001011233\n37001011234\n')
+
+    assert main(['dedup', str(first), str(second), '-o', str(output), '--memory-limit', '1M']) == 1
+    assert output.read_text() == '37001011233\n47001011234\n'
+    assert '4 rows (1 invalid, 1 duplicates)' in capsys.readouterr().err
+
+    assert main(['dedup', str(first), '-o', str(output)]) == 0
+    with pytest.raises(SystemExit):
+        main(['dedup', str(first), '-o', str(output), '--memory-limit', 'lots'])
+
+
+def test_cli_long_fields_fail_format(tmp_path, capsys):
+    path = tmp_path / 'long.csv'
+    path.write_text('37001011233\n{}\n  47001011234  \n'.format('3' * 10**5))
+    assert main(['validate', str(path), '--output', 'invalid']) == 1
+    assert capsys.readouterr().out == '{},format\n'.format('3' * 10**5)
+
+
+def test_cli_reads_quoted_fields_from_stdin():
+    rows = b'name,id\r\n"a\r\nb",37001011233\r\n"c\r\nd",37001011234\r\n'
+    process = subprocess.run([sys.executable, '-m', 'estnin', 'validate', '--header', '-c', 'id', '--output', 'invalid'],
+                             input=rows, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert process.returncode == 1
+    assert process.stdout == b'name,id,reason\n"c\r\nd",37001011234,checksum\n'
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import mmap
+import pytest
+
+from estnin import estnin, codec, COUNT
+
+
+def test_encode_decode_roundtrip():
+    for value in (estnin.MIN, 37001011233, 47001011234, 60002290003, estnin.MAX):
+        record = codec.encode(value)
+        assert len(record) == codec.RECORD_SIZE
+        assert codec.decode(record) == value
+        assert codec.decode(bytearray(record)) == value
+
+
+def test_encode_keeps_order():
+    values = [estnin.MIN, 37001011233, 37001011244, 47001011234, estnin.MAX]
+    assert sorted(codec.encode(value) for value in values) == [codec.encode(value) for value in values]
+
+
+def test_encode_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        codec.encode(37001011234)
+
+
+def test_decode_validates_records():
+    with pytest.raises(ValueError):
+        codec.decode(COUNT.to_bytes(4, 'big'))
+    with pytest.raises(ValueError):
+        codec.decode(b'\x00\x00\x00')
+    assert codec.decode((COUNT - 1).to_bytes(4, 'big')) == estnin.MAX
+
+
+def test_decode_at():
+    data = b''.join(codec.encode(value) for value in (37001011233, 47001011234, 50001010006))
+    assert codec.decode_at(data, 1) == 47001011234
+    assert codec.decode_at(memoryview(data), -1) == 50001010006
+
+    with pytest.raises(IndexError):
+        codec.decode_at(data, 3)
+    with pytest.raises(ValueError):
+        codec.decode_at(data[:-1], 0)
+
+
+def test_many_roundtrip():
+    np = pytest.importorskip('numpy')
+    from estnin import random
+
+    values = random(10000, seed=3)
+    data = codec.encode_many(values)
+    assert len(data) == len(values) * codec.RECORD_SIZE
+    assert data[:8] == codec.encode(values[0]) + codec.encode(values[1])
+    assert (codec.decode_many(data) == values).all()
+    assert (codec.decode_many(np.frombuffer(data, dtype=np.uint8)) == values).all()
+    assert codec.decode_at(data, 1234) == values[1234]
+
+
+def test_many_empty():
+    pytest.importorskip('numpy')
+    assert codec.encode_many([]) == b''
+    assert len(codec.decode_many(b'')) == 0
+
+
+def test_encode_many_into_buffer(tmp_path):
+    pytest.importorskip('numpy')
+
+    out = bytearray(8)
+    assert codec.encode_many([37001011233, 47001011234], out=out) is out
+    assert bytes(out) == codec.encode(37001011233) + codec.encode(47001011234)
+
+    with pytest.raises(ValueError):
+        codec.encode_many([37001011233], out=bytearray(5))
+
+    path = tmp_path / 'records'
+    path.write_bytes(out)
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert codec.decode_many(mapped).tolist() == [37001011233, 47001011234]
+        assert codec.decode_at(mapped, 0) == 37001011233
+
+
+def test_many_validates():
+    pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError):
+        codec.encode_many([37001011233, 37001011234])
+    with pytest.raises(ValueError, match='index 1'):
+        codec.decode_many(codec.encode(37001011233) + b'\xff\xff\xff\xff')
+    with pytest.raises(ValueError):
+        codec.decode_many(b'\x00' * 5)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from estnin import suggest, suggest_many, Suggestion, is_valid
+
+
+def edits(value):
+    # every string within one edit: substitutions, adjacent swaps, deletions and insertions
+    result = set()
+    for position in range(len(value)):
+        for digit in '0123456789':
+            result.add(value[:position] + digit + value[position + 1:])
+        result.add(value[:position] + value[position + 1:])
+        result.add(value[:position] + value[position + 1:position + 2] + value[position] + value[position + 2:])
+    for position in range(len(value) + 1):
+        for digit in '0123456789':
+            result.add(value[:position] + digit + value[position:])
+    return result
+
+
+def brute_force(value, max_edits):
+    found, level = {}, {value}
+    for distance in range(1, max_edits + 1):
+        level = set().union(*map(edits, level))
+        for candidate in level:
+            if len(candidate) == 11 and candidate.isdigit() and is_valid(candidate):
+                found.setdefault(int(candidate), distance)
+    return sorted((distance, candidate) for candidate, distance in found.items())
+
+
+@pytest.mark.parametrize('value', [
+    '37001011234',  # checksum
+    '37010011233',  # swapped month and day
+    '30701011233',  # swapped century and year
+    '37001011323',  # swapped sequence digits
+    '3700101123',   # missing digit
+    '700101123',    # two missing digits
+    '370010112334',  # extra digit
+    '3700101l233',  # letter typed for a digit
+    '90001010002',  # century
+    '48502300003',  # 30th of February
+    '60102290005',  # 29th of February in a common year
+    '3850315001333',
+])
+@pytest.mark.parametrize('max_edits', [1, 2])
+def test_suggest_matches_brute_force(value, max_edits):
+    result = suggest(value, max_edits=max_edits)
+    assert [(suggestion.edits, suggestion.value) for suggestion in result] == brute_force(value, max_edits)
+    assert all(isinstance(suggestion, Suggestion) and is_valid(suggestion.value) for suggestion in result)
+
+
+def test_suggest_valid_value():
+    assert suggest('37001011233') == [Suggestion(37001011233, 0)]
+    assert suggest(37001011233, max_edits=2) == [Suggestion(37001011233, 0)]
+    assert suggest(' 37001011233\n') == [Suggestion(37001011233, 0)]
+
+
+def test_suggest_common_typos():
+    for typo in ('37001011243', '37010011233', '3700101233', '370001011233', '3700I011233'):
+        assert Suggestion(37001011233, 1) in suggest(typo)
+
+
+def test_suggest_too_far():
+    assert suggest('370010') == []
+    assert suggest('37001011233370') == []
+    assert suggest('') == []
+    assert suggest('3700101123', max_edits=1)[0].edits == 1
+
+
+def test_suggest_max_edits():
+    for max_edits in (0, 3, None):
+        with pytest.raises(ValueError):
+            suggest('37001011234', max_edits=max_edits)
+        with pytest.raises(ValueError):
+            suggest_many(['37001011234'], max_edits=max_edits)
+
+
+def test_suggest_many():
+    values = ['37001011233', '37001011234', 37001011234, '3700101123', '37001011234', 'x']
+    result = suggest_many(values)
+    assert result == [suggest(value) for value in values]
+    assert result[0] == [Suggestion(37001011233, 0)]
+    assert result[-1] == []
+    assert suggest_many([]) == []
+
+
+def test_suggest_many_numpy():
+    np = pytest.importorskip('numpy')
+    values = np.array(['37001011233', '37001011234'])
+    assert suggest_many(values) == [suggest('37001011233'), suggest('37001011234')]
+    assert suggest_many(np.array([37001011233]), max_edits=2) == [[Suggestion(37001011233, 0)]]
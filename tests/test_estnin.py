@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
+import os
+import sys
 import pytest
+import subprocess
 
-from estnin import estnin
+from estnin import estnin, checksum
 from datetime import date
 
 
@@ -123,6 +126,32 @@ def test_checksum_is_zero_if_recalculated_value_is_10():
     assert estnin._calculate_checksum(10001010080) == 0
 
 
+def test_checksum_function_returns_valid_value():
+    assert checksum(37001011230) == 3
+    assert checksum("10001010214") == 4
+    assert checksum(10001010080) == 0
+
+
+def test_checksum_function_checks_range():
+    with pytest.raises(ValueError):
+        checksum(10**10 - 1)
+
+    with pytest.raises(ValueError):
+        checksum(10**11)
+
+
+def test_checksum_function_matches_both_weight_passes():
+    def reference(value):
+        digits = str(value)
+        result = sum(int(k) * v for k, v in zip(digits, [1, 2, 3, 4, 5, 6, 7, 8, 9, 1])) % 11
+        if result == 10:
+            result = sum(int(k) * v for k, v in zip(digits, [3, 4, 5, 6, 7, 8, 9, 1, 2, 3])) % 11
+        return 0 if result == 10 else result
+
+    for value in range(10001010000, 10001010000 + 10**11 - 10**10, 7919 * 10**4 + 1237):
+        assert checksum(value) == reference(value)
+
+
 def test_century_property_returns_value():
     assert estnin(10001010002).century == 1
 
@@ -500,3 +529,104 @@ def test_reverse_ends_with_min_value():
 
     items = [i for c, i in zip(range(10), reversed(p))]
     assert len(items) == 2
+
+
+def test_lazy_validates_value():
+    for value in (estnin.MIN - 1, estnin.MAX + 1, 10001010009, 10013010000, 10002290000, 50002300000, "gyymmddsssc"):
+        with pytest.raises(ValueError):
+            estnin(value, lazy=True)
+
+
+def test_lazy_sets_checksum():
+    assert estnin(10001010000, set_checksum=True, lazy=True).checksum == 2
+
+
+def test_lazy_does_not_decode_fields_until_needed():
+    p = estnin(37001011233, lazy=True)
+    assert str(p) == '37001011233'
+    assert int(p) == 37001011233
+    assert p.is_male and p.century == 3 and p.sequence == 123 and p.checksum == 3
+    assert '_estnin' not in p.__dict__
+
+    assert p.date == date(1970, 1, 1)
+    assert '_estnin' in p.__dict__
+    assert '_value' not in p.__dict__
+
+
+def test_lazy_fields_match_eager():
+    for value in (estnin.MIN, estnin.MAX, 37001011233, 50002290002):
+        lazy, eager = estnin(value, lazy=True), estnin(value)
+        for name in ('century', 'year', 'month', 'day', 'sequence', 'checksum', 'date', 'is_male', 'is_female'):
+            assert getattr(lazy, name) == getattr(eager, name)
+
+
+def test_lazy_supports_updates():
+    p = estnin(10001010002, lazy=True)
+    p.sequence = 1
+    assert p == 10001010013
+
+    p = estnin(10001010002, lazy=True)
+    p.year = 2000
+    assert p.century == 5 and p.checksum == 6
+
+    p = estnin(10001010002, lazy=True)
+    -p
+    assert p.is_female and p.checksum == 3
+
+    p = estnin(10001010002, lazy=True)
+    p += 1
+    assert p.sequence == 1
+
+
+def test_lazy_instance_has_no_unknown_attributes():
+    with pytest.raises(AttributeError):
+        estnin(37001011233, lazy=True).unknown
+
+
+def test_calendar_matches_datetime():
+    from estnin.core import _day_number, _day_value, _day_date, _DAY_ZERO
+
+    for year in range(1800, 2200, 3):
+        century = (year - 1800) // 100 * 2 + 1
+        for month in range(0, 14):
+            for day in range(0, 33):
+                value = century * 10**10 + year % 100 * 10**8 + month * 10**6 + day * 10**4
+                try:
+                    expected = date(year, month, day).toordinal() - _DAY_ZERO
+                except ValueError:
+                    expected = -1
+
+                assert _day_number(value) == _day_number(value + 10**10) == expected
+                if expected >= 0:
+                    assert _day_value(expected, False) == value
+                    assert _day_value(expected, True) == value + 10**10
+                    assert _day_date(expected) == date(year, month, day)
+
+
+def test_adding_integers_crosses_centuries():
+    for birth_date in (date(1800, 1, 1), date(1899, 12, 31), date(2000, 2, 29), date(2199, 12, 31)):
+        for sex in (estnin.MALE, estnin.FEMALE):
+            for other in (-10**6, -366999, -1, 1, 1000, 366001, 10**6, 36525001):
+                expected = date.fromordinal(birth_date.toordinal() + (other + 500) // 1000)
+                p = estnin.create(sex, birth_date, 500)
+                if not 1800 <= expected.year <= 2199:
+                    with pytest.raises(ValueError):
+                        p + other
+                    continue
+
+                p += other
+                assert (p.date, p.sequence, p.is_female) == (expected, (500 + other) % 1000, bool(sex))
+                assert p == estnin.create(sex, expected, (500 + other) % 1000)
+                assert estnin(int(p), lazy=True) + 0 == p
+
+
+def test_tables_are_built_on_first_use():
+    code = '\n'.join((
+        'from estnin import core',
+        'assert core._CHECKSUM_TABLES is None and core._CALENDAR is None',
+        'assert core.checksum(37001011230) == 3',
+        'assert core._CHECKSUM_TABLES is not None and core._CALENDAR is None',
+        'core.estnin(37001011233)',
+        'assert core._CALENDAR is not None',
+    ))
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
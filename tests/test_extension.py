@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+
+from estnin import EstNIN
+from estnin.extension import EstNINDtype, EstNINExtensionArray
+
+
+def test_dtype_construction():
+    series = pd.Series(['37001011233', 47001011234, None, np.nan], dtype='estnin')
+    assert isinstance(series.dtype, EstNINDtype)
+    assert series.array._data.tolist() == [37001011233, 47001011234, 0, 0]
+    assert series[0] == EstNIN(37001011233)
+    assert isinstance(series[1], EstNIN)
+    assert series.isna().tolist() == [False, False, True, True]
+    assert series.memory_usage(index=False) == 4 * 8
+
+
+def test_dtype_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        pd.Series([37001011233, 37001011234], dtype='estnin')
+
+
+def test_dtype_operations():
+    series = pd.Series([47001011234, 37001011233, None, 37001011233], dtype='estnin')
+
+    assert series.sort_values().tolist()[:3] == [37001011233, 37001011233, 47001011234]
+    assert series.value_counts()[EstNIN(37001011233)] == 2
+    assert len(series.unique()) == 3
+    assert series.dropna().tolist() == [47001011234, 37001011233, 37001011233]
+    assert series.fillna(EstNIN(50001010006)).tolist()[2] == 50001010006
+    assert (series == 37001011233).tolist() == [False, True, False, True]
+    assert pd.concat([series[:1], series[1:2]]).dtype == 'estnin'
+    assert series.take([0, 1]).tolist() == [47001011234, 37001011233]
+    assert series.dropna().astype('int64').tolist() == [47001011234, 37001011233, 37001011233]
+    assert series.astype(str).tolist()[:2] == ['47001011234', '37001011233']
+
+
+def test_dtype_setitem():
+    series = pd.Series([47001011234, 37001011233], dtype='estnin')
+    series[0] = '37001011233'
+    series[1] = None
+    assert series.array._data.tolist() == [37001011233, 0]
+
+    with pytest.raises(ValueError):
+        series[0] = 37001011234
+
+
+def test_read_csv_with_dtype(tmp_path):
+    path = tmp_path / 'people.csv'
+    path.write_text('id\n37001011233\n\n47001011234\n')
+    frame = pd.read_csv(path, dtype={'id': 'estnin'}, skip_blank_lines=False)
+    assert frame['id'].array._data.tolist() == [37001011233, 0, 47001011234]
+
+
+def test_extension_array_from_sequence():
+    array = pd.array([37001011233, None], dtype='estnin')
+    assert isinstance(array, EstNINExtensionArray)
+    assert list(array) == [EstNIN(37001011233), pd.NA]
+
+
+@pytest.mark.parametrize('series', [
+    pd.Series(['37001011233', '47001011234', '37001011234', 'x', None]),
+    pd.Series([37001011233, 47001011234, 37001011234, 1, None]),
+    pd.Series([37001011233, 47001011234, 37001011234, 1, None], dtype='Int64'),
+    pd.Series([37001011233, 47001011234, 37001011234, 1, None], dtype=object),
+])
+def test_accessor(series):
+    accessor = series.estnin
+
+    assert accessor.is_valid.tolist() == [True, True, False, False, False]
+    assert accessor.errors.tolist()[:3] == [0, 0, 4]
+    assert accessor.is_female.tolist() == [False, True, pd.NA, pd.NA, pd.NA]
+    assert accessor.is_male.tolist() == [True, False, pd.NA, pd.NA, pd.NA]
+    assert accessor.sequence.tolist() == [123, 123, pd.NA, pd.NA, pd.NA]
+    assert accessor.birth_date.tolist()[:2] == [pd.Timestamp(1970, 1, 1)] * 2
+    assert accessor.birth_date.isna().tolist() == [False, False, True, True, True]
+    assert accessor.to_estnin().isna().tolist() == [False, False, True, True, True]
+
+
+def test_accessor_keeps_index_and_name():
+    series = pd.Series([37001011233], index=['a'], name='id')
+    result = series.estnin.is_valid
+    assert result.index.tolist() == ['a'] and result.name == 'id'
+
+
+def test_accessor_on_extension_dtype():
+    series = pd.Series([47001011234, None], dtype='estnin')
+    assert series.estnin.is_valid.tolist() == [True, False]
+    assert series.estnin.sequence.tolist() == [123, pd.NA]
+
+
+def test_accessor_special_columns():
+    assert pd.Series([True]).estnin.is_valid.tolist() == [False]
+    assert pd.Series([37001011233.0, 1.5, np.nan]).estnin.is_valid.tolist() == [True, False, False]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import copy
+import pickle
+import pytest
+
+from estnin import estnin, EstNIN
+from datetime import date
+
+
+def test_frozen_validates_value():
+    for value in (estnin.MIN - 1, estnin.MAX + 1, 10001010009, 10013010000, 10002290000, "gyymmddsssc"):
+        with pytest.raises(ValueError):
+            EstNIN(value)
+
+
+def test_frozen_sets_checksum():
+    assert int(EstNIN(10001010000, set_checksum=True)) == 10001010002
+
+
+def test_frozen_create():
+    assert EstNIN.create(EstNIN.MALE, date(1970, 1, 1), 123) == 37001011233
+    assert EstNIN.create(EstNIN.FEMALE, date(2100, 1, 1), 0).century == 8
+
+    with pytest.raises(ValueError):
+        EstNIN.create(EstNIN.MALE, date(1799, 1, 1), 0)
+
+    with pytest.raises(ValueError):
+        EstNIN.create(EstNIN.MALE, date(1800, 1, 1), 1000)
+
+
+def test_frozen_fields_match_estnin():
+    for value in (estnin.MIN, estnin.MAX, 37001011233, 50002290002, 47611050036):
+        frozen, mutable = EstNIN(value), estnin(value)
+        for name in ('century', 'year', 'month', 'day', 'sequence', 'checksum', 'date', 'is_male', 'is_female'):
+            assert getattr(frozen, name) == getattr(mutable, name)
+
+
+def test_frozen_is_immutable():
+    p = EstNIN(37001011233)
+
+    with pytest.raises(AttributeError):
+        p.sequence = 1
+
+    with pytest.raises(AttributeError):
+        p._value = 1
+
+    with pytest.raises(AttributeError):
+        p.extra = 1
+
+
+def test_frozen_has_no_dict():
+    assert not hasattr(EstNIN(37001011233), '__dict__')
+
+
+def test_frozen_is_hashable():
+    assert len({EstNIN(37001011233), EstNIN("37001011233"), EstNIN(37001011244)}) == 2
+    assert {EstNIN(37001011233): 1}[EstNIN(37001011233)] == 1
+    assert hash(EstNIN(37001011233)) == hash(37001011233)
+
+
+def test_frozen_has_total_ordering():
+    a, b = EstNIN(10001010002), EstNIN(10001010013)
+    assert a < b and a <= b and b > a and b >= a and a != b
+    assert a == 10001010002
+    assert a == estnin(10001010002)
+    assert sorted([b, a]) == [a, b]
+    assert a != 'invalid'
+
+
+def test_frozen_arithmetic_does_not_mutate():
+    p = EstNIN.create(EstNIN.MALE, date(1999, 12, 31), 999)
+    q = p + 1
+    assert p == 39912319997
+    assert q.date == date(2000, 1, 1)
+    assert q.sequence == 0
+    assert q.century == 5
+    assert q - 1 == p
+
+
+def test_frozen_arithmetic_has_bounds():
+    with pytest.raises(ValueError):
+        EstNIN(EstNIN.MAX) + 1
+
+    with pytest.raises(ValueError):
+        EstNIN(EstNIN.MIN) - 1
+
+
+def test_frozen_negation_changes_sex():
+    p = EstNIN(37001011233)
+    assert -p == 47001011234
+    assert -(-p) == p
+    assert p.is_male
+
+
+def test_frozen_can_be_copied_and_pickled():
+    p = EstNIN(37001011233)
+    assert copy.copy(p) == p
+    assert copy.deepcopy(p) == p
+    assert pickle.loads(pickle.dumps(p)) == p
+
+
+def test_estnin_can_be_frozen():
+    p = estnin(37001011233)
+    frozen = p.frozen()
+    p.sequence = 1
+    assert isinstance(frozen, EstNIN)
+    assert frozen == 37001011233
+
+
+def test_frozen_arithmetic_matches_mutable():
+    for value in (10001010002, 39912319997, 50002290002, 80001019993):
+        for other in (-366999, -1, 1, 366001, 36525001):
+            try:
+                expected = int(estnin(value) + other)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    EstNIN(value) + other
+                continue
+
+            result = EstNIN(value) + other
+            assert type(result) is EstNIN and result == expected
+            assert result.date == estnin(expected).date
+
+
+def test_frozen_compares_only_to_integers():
+    p = EstNIN(37001011233)
+    assert p != '37001011233'
+    assert p != 37001011233.7
+    assert p != 37001011233.0
+    assert '37001011233' not in {p}
+    assert p in {37001011233} and 37001011233 in {p}
+
+    for other in ('37001011234', 37001011234.0, None):
+        with pytest.raises(TypeError):
+            p < other
+
+
+def test_frozen_is_not_an_index():
+    with pytest.raises(TypeError):
+        [0][EstNIN(37001011233):]
+    with pytest.raises(TypeError):
+        hex(EstNIN(37001011233))
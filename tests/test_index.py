@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from datetime import date
+
+np = pytest.importorskip('numpy')
+
+from estnin import estnin, Index, EstNINArray, random
+
+
+@pytest.fixture(scope='module')
+def values():
+    return random(20000, born_between=(date(1980, 1, 1), date(1990, 12, 31)), seed=5)
+
+
+@pytest.fixture(scope='module')
+def index(values):
+    return Index(values)
+
+
+def fields(values):
+    people = EstNINArray(values)
+    return people.date.astype(object), people.is_female
+
+
+def test_index_order(index, values):
+    assert len(index) == len(values)
+    keys = [(person.date, person.is_female, person.sequence) for person in map(estnin, index.values[:500].tolist())]
+    assert keys == sorted(keys)
+    assert sorted(index.values.tolist()) == sorted(values.tolist())
+
+
+def test_index_is_read_only(index):
+    with pytest.raises(ValueError):
+        index.values[0] = 0
+
+
+def test_born_between(index, values):
+    dates, females = fields(values)
+    first, last = date(1985, 3, 1), date(1985, 6, 30)
+    in_range = (dates >= first) & (dates <= last)
+
+    for sex, expected in ((None, in_range), (estnin.FEMALE, in_range & females), (estnin.MALE, in_range & ~females)):
+        result = index.born_between(first, last, sex=sex)
+        assert isinstance(result, EstNINArray)
+        assert sorted(result.values.tolist()) == sorted(values[expected].tolist())
+        assert index.count_between(first, last, sex=sex) == expected.sum()
+
+
+def test_born_between_single_day_and_empty(index, values):
+    dates, _ = fields(values)
+    day = dates[0]
+    assert sorted(index.born_between(day, day).values.tolist()) == sorted(values[dates == day].tolist())
+    assert len(index.born_between(date(1800, 1, 1), date(1979, 12, 31))) == 0
+    assert index.count_between(date(1800, 1, 1), date(2199, 12, 31)) == len(values)
+
+
+def test_born_between_validates_dates(index):
+    with pytest.raises(ValueError):
+        index.born_between(date(1990, 1, 1), date(1980, 1, 1))
+    with pytest.raises(ValueError):
+        index.count_between(date(1700, 1, 1), date(1980, 1, 1))
+
+
+@pytest.mark.parametrize('month, day', [(1, 1), (3, 15), (12, 31), (2, 29)])
+def test_birthday(index, values, month, day):
+    people = EstNINArray(values)
+    matching = (people.month == month) & (people.day == day)
+
+    for sex, expected in ((None, matching), (estnin.FEMALE, matching & people.is_female), (estnin.MALE, matching & people.is_male)):
+        result = index.birthday(month, day, sex=sex)
+        assert sorted(result.values.tolist()) == sorted(values[expected].tolist())
+        assert index.count_birthday(month, day, sex=sex) == expected.sum()
+
+    assert matching.sum() > 0
+
+
+def test_birthday_validates_dates(index):
+    for month, day in ((0, 1), (13, 1), (2, 30), (4, 31), (1, 0)):
+        with pytest.raises(ValueError):
+            index.birthday(month, day)
+
+
+def test_contains(index, values):
+    assert values[0] in index
+    assert estnin(int(values[1])) in index
+    assert 37001011233 not in index
+    assert 'invalid' not in index
+    assert 5 not in index
+
+
+def test_duplicates_and_validation():
+    index = Index([37001011233, 37001011233, 47001011234])
+    assert index.count_birthday(1, 1) == 3
+    assert index.count_birthday(1, 1, sex=estnin.FEMALE) == 1
+
+    with pytest.raises(ValueError):
+        Index([37001011234])
+
+    assert len(Index([])) == 0
+    assert len(Index([]).birthday(1, 1)) == 0
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from estnin import io, random
+from estnin.vectorized import FORMAT
+
+
+def _write(tmp_path, data):
+    path = tmp_path / 'people.txt'
+    path.write_bytes(data)
+    return path
+
+
+def test_load_lines(tmp_path):
+    result = io.load(_write(tmp_path, b'37001011233\n37001011234\r\n\n47001011234\r\n3700101123x\n370010112331'))
+    assert result.values.tolist() == [37001011233, 37001011234, 0, 47001011234, 0, 0]
+    assert result.mask.tolist() == [True, False, False, True, False, False]
+    assert result.invalid_lines.tolist() == [2, 3, 5, 6]
+
+
+def test_load_lines_without_trailing_newline(tmp_path):
+    assert io.load(_write(tmp_path, b'37001011233\n47001011234')).mask.tolist() == [True, True]
+    assert io.load(_write(tmp_path, b'37001011233\n47001011234\n')).mask.tolist() == [True, True]
+
+
+def test_load_lines_in_small_blocks(tmp_path):
+    values = random(1000, seed=0)
+    data = b''.join(b'%d\n' % value for value in values.tolist()) + b'bad\n'
+    result = io.load(_write(tmp_path, data), block_size=100)
+    assert result.values[result.mask].tolist() == values.tolist()
+    assert result.invalid_lines.tolist() == [1001]
+
+
+def test_load_lines_longer_than_block(tmp_path):
+    result = io.load(_write(tmp_path, b'1' * 50 + b'\n37001011233\n'), block_size=16)
+    assert result.mask.tolist() == [False, True]
+
+
+def test_load_fixed_width_records(tmp_path):
+    path = _write(tmp_path, b'A37001011233\nB37001011234\nC47001011234\n')
+    result = io.load(path, record_size=13, offset=1)
+    assert result.values.tolist() == [37001011233, 37001011234, 47001011234]
+    assert result.invalid_lines.tolist() == [2]
+
+
+def test_load_fixed_width_records_without_separator(tmp_path):
+    result = io.load(_write(tmp_path, b'370010112334700101123x'), record_size=11, block_size=1)
+    assert result.mask.tolist() == [True, False]
+
+
+def test_load_validates_record_size(tmp_path):
+    path = _write(tmp_path, b'37001011233\n4')
+    with pytest.raises(ValueError):
+        io.load(path, record_size=12)
+
+    with pytest.raises(ValueError):
+        io.load(path, record_size=12, offset=2)
+
+
+def test_load_empty_file(tmp_path):
+    result = io.load(_write(tmp_path, b''))
+    assert len(result.values) == len(result.mask) == len(result.invalid_lines) == 0
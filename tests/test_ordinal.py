@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from estnin import estnin, span, COUNT, to_ordinal, from_ordinal
+from datetime import date
+
+
+def test_count_matches_all_valid_values():
+    assert COUNT == len(span(date(1800, 1, 1), date(2200, 1, 1)))
+
+
+def test_ordinal_bounds():
+    assert to_ordinal(estnin.MIN) == 0
+    assert to_ordinal(estnin.MAX) == COUNT - 1
+    assert from_ordinal(0) == estnin.MIN
+    assert from_ordinal(COUNT - 1) == estnin.MAX
+
+
+def test_ordinal_round_trip_keeps_order():
+    values = sorted(span(date(1899, 12, 31), date(1900, 1, 2))) + sorted(span(date(2000, 2, 28), date(2000, 3, 2)))
+    ordinals = [to_ordinal(value) for value in values]
+    assert ordinals == sorted(ordinals)
+    assert [from_ordinal(ordinal) for ordinal in ordinals] == values
+
+
+def test_ordinal_is_dense_between_centuries():
+    assert to_ordinal(estnin.create(estnin.FEMALE, date(1800, 1, 1), 0)) == to_ordinal(
+        estnin.create(estnin.MALE, date(1899, 12, 31), 999)) + 1
+
+
+def test_to_ordinal_validates_value():
+    for value in (estnin.MIN - 1, estnin.MAX + 1, 10001010009, 10002290000, 'invalid'):
+        with pytest.raises(ValueError):
+            to_ordinal(value)
+
+
+def test_from_ordinal_validates_range():
+    with pytest.raises(ValueError):
+        from_ordinal(-1)
+
+    with pytest.raises(ValueError):
+        from_ordinal(COUNT)
+
+
+def test_vectorized_ordinals_match_scalar():
+    np = pytest.importorskip('numpy')
+    from estnin import to_ordinal_many, from_ordinal_many
+
+    ordinals = np.random.default_rng(2).integers(0, COUNT, 5000)
+    ordinals[:2] = [0, COUNT - 1]
+    values = from_ordinal_many(ordinals)
+    assert values.tolist() == [from_ordinal(ordinal) for ordinal in ordinals.tolist()]
+    assert to_ordinal_many(values).tolist() == ordinals.tolist()
+
+    with pytest.raises(ValueError):
+        to_ordinal_many([estnin.MIN, 10001010009])
+
+    with pytest.raises(ValueError):
+        from_ordinal_many([COUNT])
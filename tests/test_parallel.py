@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import gc
+import os
+import pytest
+
+from multiprocessing import shared_memory
+
+np = pytest.importorskip('numpy')
+
+from estnin import estnin, parallel, validate_many
+
+
+def _values(count):
+    rng = np.random.default_rng(1)
+    values = rng.integers(estnin.MIN, estnin.MAX, count)
+    values[::2] = values[::2] // 10 * 10 + [estnin._calculate_checksum(v) for v in values[::2].tolist()]
+    return values
+
+
+def test_parallel_matches_validate_many():
+    values = _values(5000)
+    mask, errors = parallel.validate(values, workers=2)
+    expected_mask, expected_errors = validate_many(values)
+    assert mask.tolist() == expected_mask.tolist()
+    assert errors.tolist() == expected_errors.tolist()
+
+
+def test_parallel_handles_strings_and_shapes():
+    mask, errors = parallel.validate([['37001011233', 'x'], ['37001011234', '47001011234']], workers=1)
+    assert mask.tolist() == [[True, False], [False, True]]
+    assert errors.shape == (2, 2)
+
+
+def test_parallel_handles_empty_input():
+    mask, errors = parallel.validate(np.array([], dtype=np.int64), workers=2)
+    assert mask.shape == (0,)
+
+
+def test_parallel_uses_shared_input_without_copy():
+    values = parallel.empty(100)
+    values[:] = _values(100)
+    assert parallel._locate(values[10:]) == (parallel._locate(values)[0], 80)
+
+    mask, _ = parallel.validate(values[10:], workers=2)
+    assert mask.tolist() == validate_many(values[10:])[0].tolist()
+
+
+def test_parallel_releases_shared_memory():
+    mask, errors = parallel.validate(_values(10), workers=1)
+    assert parallel._BLOCKS
+    del mask, errors
+    gc.collect()
+    assert not parallel._BLOCKS
+
+
+def test_parallel_unlinks_blocks_after_validation():
+    values = _values(100)
+    mask, errors = parallel.validate(values.tolist(), workers=2)
+    assert mask.tolist() == validate_many(values)[0].tolist()
+
+    for array in (mask, errors):
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(parallel._locate(array)[0])
+
+    shared = parallel.empty(100)
+    shared[:] = values
+    parallel.validate(shared, workers=2)
+    if os.path.isdir('/dev/shm'):
+        assert os.path.exists(os.path.join('/dev/shm', parallel._locate(shared)[0].lstrip('/')))
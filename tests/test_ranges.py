@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from estnin import estnin, span
+from datetime import date
+
+
+def test_span_matches_estnin_iteration():
+    start = estnin.create(estnin.MALE, date(1999, 12, 31), 990)
+    expected = [int(p) for _, p in zip(range(30), estnin(start))]
+    assert list(span(expected[0], estnin(expected[-1]) + 1, sex=estnin.MALE)) == expected
+
+
+def test_span_has_constant_time_length():
+    assert len(span(date(1800, 1, 1), date(2200, 1, 1))) == 146097 * 1000 * 2
+    assert len(span(date(2000, 1, 1), date(2001, 1, 1), sex=estnin.MALE)) == 366000
+    assert len(span(date(2000, 1, 1), date(2000, 1, 1))) == 0
+
+
+def test_span_orders_sexes_by_sequence():
+    people = span(date(1970, 1, 1), date(1970, 1, 2))
+    assert list(people[:4]) == [37001010007, 47001010008, 37001010018, 47001010019]
+    assert list(people[:4]) == list(span(37001010007, estnin(37001010020, set_checksum=True)))
+
+
+def test_span_supports_negative_indexing():
+    people = span(date(1800, 1, 1), date(2200, 1, 1), sex=estnin.FEMALE)
+    assert people[0] == 20001010003
+    assert people[-1] == estnin.MAX
+
+    with pytest.raises(IndexError):
+        people[len(people)]
+
+
+def test_span_slicing_returns_span():
+    people = span(date(1970, 1, 1), date(1971, 1, 1), sex=estnin.MALE)
+    part = people[5:-5:7]
+    assert isinstance(part, span)
+    assert list(part) == list(people)[5:-5:7]
+
+
+def test_span_reversed():
+    people = span(date(1999, 12, 31), date(2000, 1, 2), sex=estnin.MALE)
+    assert list(reversed(people)) == list(people)[::-1]
+
+
+def test_span_containment():
+    people = span(date(1970, 1, 1), date(1971, 1, 1), sex=estnin.MALE)
+    assert 37001011233 in people
+    assert estnin(37012319999 // 10 * 10, set_checksum=True) in people
+    assert 47001011234 not in people
+    assert 37001011234 not in people
+    assert 37101010006 not in people
+    assert 'invalid' not in people
+    assert people.index(37001010018) == 1
+    assert people.count(37001010018) == 1
+
+    with pytest.raises(ValueError):
+        people.index(47001011234)
+
+
+def test_span_validates_bounds():
+    with pytest.raises(ValueError):
+        span(date(1799, 12, 31), date(1800, 1, 2))
+
+    with pytest.raises(ValueError):
+        span(90001010000, estnin.MAX)
+
+
+def test_span_respects_sex_of_bounds():
+    assert list(span(47001010008, 47001010019)) == [47001010008, 37001010018]
+    assert list(span(37001010018, 47001010019)) == [37001010018]
+    assert list(span(47001010008, 37001010018)) == [47001010008]
+    assert list(span(47001010008, 37001010029, sex=estnin.MALE)) == [37001010018]
+    assert list(span(47001010008, 37001010029, sex=estnin.FEMALE)) == [47001010008, 47001010019]
+    assert list(span(37001010007, 47001010008, sex=estnin.FEMALE)) == []
+    assert list(span(47001010008, 47001010019, sex=estnin.MALE)) == [37001010018]
+
+    people = span(47001010008, estnin(37001010300, set_checksum=True))
+    assert len(people) == len(list(people)) == 59
+    assert all(people.index(value) == index for index, value in enumerate(people))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from estnin import estnin, random, span, validate_many, EstNINArray
+from datetime import date
+
+
+def test_random_returns_valid_values():
+    people = random(10000, seed=0)
+    assert people.dtype == np.int64
+    assert len(people) == 10000
+    assert validate_many(people)[0].all()
+
+
+def test_random_is_deterministic():
+    assert random(100, seed=42).tolist() == random(100, seed=42).tolist()
+    assert random(100, seed=42).tolist() != random(100, seed=43).tolist()
+
+
+def test_random_filters_sex():
+    assert EstNINArray(random(1000, sex=estnin.FEMALE, seed=0)).is_female.all()
+    assert EstNINArray(random(1000, sex=estnin.MALE, seed=0)).is_male.all()
+
+
+def test_random_filters_birth_dates():
+    first, last = date(1899, 12, 30), date(1900, 1, 2)
+    people = EstNINArray(random(5000, born_between=(first, last), seed=0))
+    dates = people.date
+    assert (dates >= np.datetime64(first)).all() and (dates <= np.datetime64(last)).all()
+    assert len(set(dates.tolist())) == 4
+    assert set(people.century.tolist()) == {1, 2, 3, 4}
+
+
+def test_random_without_replacement_is_unique():
+    people = random(2000, sex=estnin.MALE, born_between=(date(2000, 1, 1), date(2000, 1, 2)), seed=0, replace=False)
+    assert len(set(people.tolist())) == 2000
+
+    with pytest.raises(ValueError):
+        random(2001, sex=estnin.MALE, born_between=(date(2000, 1, 1), date(2000, 1, 2)), replace=False)
+
+
+def test_random_validates_arguments():
+    with pytest.raises(ValueError):
+        random(-1)
+
+    with pytest.raises(ValueError):
+        random(1, born_between=(date(2000, 1, 2), date(2000, 1, 1)))
+
+    with pytest.raises(ValueError):
+        random(1, born_between=(date(1799, 1, 1), date(2000, 1, 1)))
+
+    assert len(random(0)) == 0
+
+
+def test_random_without_replacement_draws_whole_population():
+    born_between = (date(2000, 1, 1), date(2000, 1, 10))
+    people = random(10000, sex=estnin.FEMALE, born_between=born_between, seed=2, replace=False)
+    assert sorted(people.tolist()) == list(span(date(2000, 1, 1), date(2000, 1, 11), sex=estnin.FEMALE))
+    assert people.tolist() != sorted(people.tolist())
+
+    people = random(2500, sex=estnin.FEMALE, born_between=born_between, seed=2, replace=False)
+    assert len(set(people.tolist())) == 2500
+
+
+def test_random_without_replacement_memory_is_bounded():
+    import tracemalloc
+    from estnin import sampling
+
+    total, n = 8 * 10**6, 3 * 10**6
+    tracemalloc.start()
+    chosen = sampling._unique(np.random.default_rng(3), total, n)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # the result and one chunk, a permutation of the whole range would take 64MB more
+    assert peak < chosen.nbytes + 16 * sampling._SELECT_SIZE
+    assert len(np.unique(chosen)) == n and chosen.min() >= 0 and chosen.max() < total
+
+    # every chunk gets its share of the draws
+    counts = np.bincount(chosen // 10**6, minlength=8)
+    assert (abs(counts - n // 8) < 5000).all()
+
+    people = random(500000, born_between=(date(2000, 1, 1), date(2000, 12, 31)), seed=4, replace=False)
+    assert len(np.unique(people)) == 500000 and validate_many(people)[0].all()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import io
+import pytest
+
+from estnin import scan, redact
+from estnin.text import Match
+
+TEXT = (
+    'isikukood 37001011233; tel 37001011234, arve 370010112331, '
+    'kuupäev 37002301236, id=47001011234 ja x37001011233 ning 37001011233_ või õ37001011233\n'
+    '60002290003 (2000-02-29), 50002300000 (2000-02-30), 93001011234, 37013011233'
+)
+
+
+def test_scan_finds_only_valid_values():
+    values = [37001011233, 47001011234, 60002290003]
+    starts = [TEXT.index(str(value)) for value in values]
+    assert list(scan(TEXT)) == [Match(start, start + 11, value) for start, value in zip(starts, values)]
+
+
+def test_scan_offsets_point_to_values():
+    for match in scan(TEXT):
+        assert TEXT[match.start:match.end] == str(match.value)
+
+
+def test_scan_bytes_uses_byte_offsets():
+    data = TEXT.encode('utf-8')
+    matches = list(scan(data))
+    assert [match.value for match in matches] == [37001011233, 47001011234, 37001011233, 60002290003]
+    for match in matches:
+        assert data[match.start:match.end] == str(match.value).encode()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 11, 12, 13, 17, 64, 1 << 20])
+def test_scan_chunks(chunk_size):
+    text = '37001011233 ' * 5 + 'a37001011233 37001011233a 3700101123 ' + TEXT.replace('õ', 'o')
+    expected = list(scan(text))
+    assert len(expected) == 8
+    assert list(scan(io.StringIO(text), chunk_size=chunk_size)) == expected
+    assert list(scan(io.BytesIO(text.encode('ascii', 'replace')), chunk_size=chunk_size)) == expected
+
+
+def test_scan_iterable_of_chunks():
+    assert [match.start for match in scan(['abc 370010', '11233 ', '47001011234'])] == [4, 16]
+
+
+def test_scan_empty():
+    assert list(scan('')) == []
+    assert list(scan(io.BytesIO())) == []
+    assert list(scan('37001011233')) == [Match(0, 11, 37001011233)]
+
+
+def test_redact_masks_values():
+    assert ''.join(redact(TEXT)) == TEXT.replace('37001011233;', '***********;').replace(
+        '47001011234', '*' * 11).replace('60002290003', '*' * 11)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 12, 100])
+def test_redact_chunks(chunk_size):
+    text = '37001011233 ' + TEXT + ' 47001011234'
+    expected = ''.join(redact(text))
+    assert ''.join(redact(io.StringIO(text), chunk_size=chunk_size)) == expected
+    data = text.encode('utf-8')
+    assert b''.join(redact(io.BytesIO(data), chunk_size=chunk_size)) == b''.join(redact(data))
+    assert expected.startswith('*' * 11) and expected.endswith(' ' + '*' * 11)
+
+
+def test_redact_bytes():
+    assert b''.join(redact(b'id 37001011233\n', mask='#')) == b'id ###########\n'
+
+
+def test_redact_replacements():
+    assert ''.join(redact('a 37001011233 b', mask='<id>')) == 'a <id> b'
+    assert ''.join(redact('a 37001011233 b', mask=lambda value: str(value)[:5] + '*' * 6)) == 'a 37001****** b'
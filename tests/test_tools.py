@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import os
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from estnin import tools, random
+
+
+def write_lines(path, lines, newline='\n'):
+    path.write_bytes(''.join(line + newline for line in lines).encode())
+    return path
+
+
+def read_values(path):
+    return [int(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    values = random(30000, seed=4)
+    first = values[:20000].astype(str).tolist() + ['37001011234', '', 'abc']
+    second = values[10000:].astype(str).tolist() + values[:100].astype(str).tolist()
+    return values, [write_lines(tmp_path / 'a.txt', first), write_lines(tmp_path / 'b.txt', second, '\r\n')]
+
+
+@pytest.mark.parametrize('memory_limit', [1 << 28, 1 << 16, 1 << 12])
+def test_dedup(tmp_path, inputs, memory_limit):
+    values, paths = inputs
+    output = tmp_path / 'out.txt'
+
+    result = tools.dedup(paths, output, memory_limit=memory_limit, temporary_directory=tmp_path)
+    expected = sorted(set(values.tolist()))
+
+    assert read_values(output) == expected
+    assert result.rows == 40103
+    assert result.invalid == 3
+    assert result.written == len(expected)
+    assert result.duplicates == result.rows - result.invalid - result.written
+    assert result.rows_per_second > 0
+    assert (result.runs > 0) == (memory_limit < 1 << 20)
+    assert sorted(os.listdir(tmp_path)) == ['a.txt', 'b.txt', 'out.txt']
+
+
+def test_dedup_many_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, '_FAN_IN', 3)
+    values = random(40000, seed=5, replace=False)
+    path = write_lines(tmp_path / 'a.txt', np.concatenate((values, values[::-1])).astype(str).tolist())
+
+    result = tools.dedup(str(path), tmp_path / 'out.txt', memory_limit=1 << 12)
+    assert result.runs > 9
+    assert read_values(tmp_path / 'out.txt') == sorted(values.tolist())
+    assert result.duplicates == len(values)
+
+
+def test_dedup_empty_and_invalid(tmp_path):
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    invalid = write_lines(tmp_path / 'invalid.txt', ['1', '37001011234'])
+    output = tmp_path / 'out.txt'
+
+    result = tools.dedup([empty, invalid], output)
+    assert output.read_bytes() == b''
+    assert result[:5] == (2, 0, 0, 2, 0)
+
+
+def test_dedup_without_trailing_newline(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'47001011234\n37001011233\n37001011233')
+    result = tools.dedup(path, tmp_path / 'out.txt', memory_limit=1 << 12)
+    assert (tmp_path / 'out.txt').read_bytes() == b'37001011233\n47001011234\n'
+    assert result.duplicates == 1
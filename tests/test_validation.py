@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import pytest
+
+from datetime import date
+
+from estnin import estnin, EstNIN, is_valid, try_parse, Reason, Parsed
+
+
+@pytest.mark.parametrize('value, reason', [
+    (37001011233, Reason.VALID),
+    ('37001011233', Reason.VALID),
+    (b'37001011233', Reason.VALID),
+    (EstNIN(37001011233), Reason.VALID),
+    (estnin(37001011233), Reason.VALID),
+    (37001011234, Reason.CHECKSUM),
+    (37013011233, Reason.DATE),
+    (30002290008, Reason.DATE),
+    (97001011233, Reason.CENTURY),
+    (7001011233, Reason.CENTURY),
+    (10000000000, Reason.RANGE),
+    (-37001011233, Reason.RANGE),
+    (10**11, Reason.RANGE),
+    (True, Reason.CENTURY),
+    ('3700101123', Reason.FORMAT),
+    ('370010112330', Reason.FORMAT),
+    (' 7001011233', Reason.FORMAT),
+    ('3700101123x', Reason.FORMAT),
+    ('3700101123٣', Reason.FORMAT),
+    ('', Reason.FORMAT),
+    (None, Reason.FORMAT),
+    (object(), Reason.FORMAT),
+    (float('nan'), Reason.FORMAT),
+])
+def test_reasons(value, reason):
+    result = try_parse(value)
+    assert isinstance(result, Parsed)
+    assert result.reason is reason
+    assert result.valid is bool(result) is (reason is Reason.VALID) is is_valid(value)
+
+
+def test_parsed_value():
+    result = try_parse('60002290003')
+    assert isinstance(result.value, estnin)
+    assert result.value == 60002290003
+    assert result.value.date == date(2000, 2, 29)
+    assert result.value.is_female
+
+    result.value.sequence = 1
+    assert result.value == 60002290014
+
+    assert try_parse(60002290004).value is None
+
+
+def test_reasons_are_stable():
+    from estnin import vectorized
+
+    assert [(reason.name, int(reason)) for reason in Reason] == [
+        ('VALID', 0), ('RANGE', 1), ('CENTURY', 2), ('DATE', 3), ('CHECKSUM', 4), ('FORMAT', 5),
+    ]
+    assert all(getattr(vectorized, reason.name) == reason for reason in Reason)
+
+
+def test_reasons_match_validate_many():
+    np = pytest.importorskip('numpy')
+    from estnin import validate_many, random
+
+    values = random(5000, seed=7)
+    rng = np.random.default_rng(7)
+    values = np.concatenate((values, values + rng.integers(-10**9, 10**9, len(values)), rng.integers(-10**10, 10**12, 5000)))
+
+    _, errors = validate_many(values)
+    assert [try_parse(value).reason for value in values.tolist()] == errors.tolist()
+    assert set(errors.tolist()) == {0, 1, 2, 3, 4}
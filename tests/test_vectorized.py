@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import os
+import sys
+import pytest
+import subprocess
+
+np = pytest.importorskip('numpy')
+
+from estnin import estnin, validate_many
+from estnin import vectorized
+from datetime import date
+
+
+def test_validate_many_accepts_valid_values():
+    mask, errors = validate_many(np.array([estnin.MIN, 37001011233, estnin.MAX], dtype=np.int64))
+    assert mask.tolist() == [True, True, True]
+    assert errors.tolist() == [vectorized.VALID] * 3
+
+
+def test_validate_many_reports_range():
+    mask, errors = validate_many([estnin.MIN - 1, estnin.MAX + 1, -1, 10**11])
+    assert not mask.any()
+    assert errors.tolist() == [vectorized.RANGE] * 4
+
+
+def test_validate_many_reports_century():
+    _, errors = validate_many([90001010000, 1001010002])
+    assert errors.tolist() == [vectorized.CENTURY, vectorized.CENTURY]
+
+
+def test_validate_many_reports_date():
+    _, errors = validate_many([10013010000, 10001990000, 10002290000, 50002300000])
+    assert errors.tolist() == [vectorized.DATE] * 4
+
+
+def test_validate_many_accepts_leap_days():
+    values = [estnin.create(estnin.MALE, d, 0) for d in (date(2000, 2, 29), date(1804, 2, 29))]
+    mask, _ = validate_many([int(v) for v in values])
+    assert mask.all()
+
+
+def test_validate_many_reports_checksum():
+    _, errors = validate_many([10001010009, 37001011234])
+    assert errors.tolist() == [vectorized.CHECKSUM] * 2
+
+
+def test_validate_many_parses_strings():
+    mask, errors = validate_many(['37001011233', '3700101123x', '3700101123', '370010112331', '37001011234'])
+    assert mask.tolist() == [True, False, False, False, False]
+    assert errors.tolist() == [vectorized.VALID, vectorized.FORMAT, vectorized.FORMAT, vectorized.FORMAT, vectorized.CHECKSUM]
+
+
+def test_validate_many_parses_bytes():
+    mask, _ = validate_many(np.array([b'37001011233', b'47001011234'], dtype='S11'))
+    assert mask.all()
+
+
+def test_validate_many_keeps_shape():
+    mask, errors = validate_many(np.full((2, 3), 37001011233))
+    assert mask.shape == (2, 3)
+    assert errors.shape == (2, 3)
+
+
+def test_validate_many_rejects_floats():
+    with pytest.raises(TypeError):
+        validate_many([1.5])
+
+
+def test_validate_many_matches_scalar_validation():
+    rng = np.random.default_rng(0)
+    values = rng.integers(estnin.MIN - 10**8, estnin.MAX + 10**8, 20000)
+    values[::3] = [v // 10 * 10 + estnin._calculate_checksum(v) for v in values[::3].tolist()]
+
+    mask, _ = validate_many(values)
+    assert mask.tolist() == [_is_valid(v) for v in values.tolist()]
+
+
+def _is_valid(value):
+    try:
+        estnin(value)
+        return True
+    except ValueError:
+        return False
+
+
+def test_import_does_not_load_numpy():
+    code = '\n'.join((
+        'import sys, estnin',
+        'assert "numpy" not in sys.modules',
+        'assert estnin.estnin(37001011233) and estnin.is_valid(37001011233)',
+        'assert "numpy" not in sys.modules',
+        'from estnin import validate_many',
+        'assert "numpy" in sys.modules and "validate_many" in dir(estnin)',
+    ))
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))